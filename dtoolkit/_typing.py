@@ -11,4 +11,6 @@ OneDimArray = np.ndarray | pd.Series
 
 Number = int | float
 
+Dtype = str | np.dtype | pd.api.extensions.ExtensionDtype
+
 Axis = Literal[0, 1, "index", "columns"]  # only for dataframe axis
@@ -1,6 +1,13 @@
 import dtoolkit.accessor.dataframe  # noqa: F401
 import dtoolkit.accessor.index  # noqa: F401
 import dtoolkit.accessor.series  # noqa: F401
+from dtoolkit.accessor.duplicate_tracker import DuplicateTracker  # noqa: F401
+from dtoolkit.accessor.error_summary import ErrorSummary  # noqa: F401
+from dtoolkit.accessor.expr_cache import expr_cache  # noqa: F401
+from dtoolkit.accessor.expr_cache import ExprCache  # noqa: F401
+from dtoolkit.accessor.filter_spec import FilterSpec  # noqa: F401
+from dtoolkit.accessor.lazy import Lazy  # noqa: F401
+from dtoolkit.accessor.lazy import register_row_filter  # noqa: F401
 from dtoolkit.accessor.register import register_dataframe_method  # noqa: F401
 from dtoolkit.accessor.register import register_index_method  # noqa: F401
 from dtoolkit.accessor.register import register_method_factory  # noqa: F401
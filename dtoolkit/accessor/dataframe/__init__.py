@@ -1,6 +1,7 @@
 from dtoolkit.accessor.dataframe.boolean import boolean  # noqa: F401
 from dtoolkit.accessor.dataframe.change_axis_type import change_axis_type  # noqa: F401
 from dtoolkit.accessor.dataframe.cols import cols  # noqa: F401
+from dtoolkit.accessor.dataframe.compact import compact  # noqa: F401
 from dtoolkit.accessor.dataframe.decompose import decompose  # noqa: F401
 from dtoolkit.accessor.dataframe.drop_inf import drop_inf  # noqa: F401
 from dtoolkit.accessor.dataframe.drop_not_duplicates import (  # noqa: F401
@@ -15,6 +16,8 @@ from dtoolkit.accessor.dataframe.fillna_regression import (  # noqa: F401
 )
 from dtoolkit.accessor.dataframe.filter_in import filter_in  # noqa: F401
 from dtoolkit.accessor.dataframe.groupby_index import groupby_index  # noqa: F401
+from dtoolkit.accessor.dataframe.has_inf import has_inf  # noqa: F401
+from dtoolkit.accessor.dataframe.lazy import lazy  # noqa: F401
 from dtoolkit.accessor.dataframe.repeat import repeat  # noqa: F401
 from dtoolkit.accessor.dataframe.set_unique_index import set_unique_index  # noqa: F401
 from dtoolkit.accessor.dataframe.to_series import to_series  # noqa: F401
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from collections.abc import Hashable
+
+import pandas as pd
+from pandas.api.types import pandas_dtype
+
+from dtoolkit._typing import Dtype
+from dtoolkit.accessor.register import register_dataframe_method
+from dtoolkit.accessor.series.compact import check_category_ratio
+from dtoolkit.accessor.series.compact import compact_dtype
+from dtoolkit.accessor.series.compact import convert
+from dtoolkit.accessor.series.compact import get_report
+from dtoolkit.accessor.series.compact import REPORT
+
+
+@register_dataframe_method
+def compact(
+    df: pd.DataFrame,
+    /,
+    category_ratio: float = 0.5,
+    plan: dict[Hashable, Dtype] = None,
+    dry_run: bool = False,
+    report: bool = False,
+) -> pd.DataFrame | dict[Hashable, Dtype] | tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Shrink the memory of the DataFrame via downcasting the dtype of each column.
+
+    - Integer and float are downcast to the smallest width holding the values, see
+      :func:`pandas.to_numeric` with ``downcast``. Float is only downcast if all
+      values are kept exactly.
+    - Object of booleans is converted to ``bool``, or ``boolean`` if there are
+      missing values.
+    - Object or string with low cardinality is converted to ``category``, if it
+      takes less memory.
+    - Others are kept.
+
+    Parameters
+    ----------
+    category_ratio : float, default 0.5
+        Object or string is converted to ``category`` if the number of distinct
+        values is at most ``category_ratio`` of its length. Should fall between
+        0 and 1.
+
+    plan : dict, ``{column: dtype}``, optional
+        The dtypes to convert to, such as the plan returned via ``dry_run=True``.
+        The columns not in ``plan`` are kept. If None, the compact dtypes are
+        inferred from the values.
+
+    dry_run : bool, default False
+        If True, only return the plan ``{column: dtype}`` rather than converting.
+        So it could be passed to ``plan`` of the following chunks to keep the same
+        dtypes.
+
+    report : bool, default False
+        If True, return the report of the dtype and bytes before and after of each
+        column as well.
+
+    Returns
+    -------
+    DataFrame, dict or tuple of (DataFrame, DataFrame)
+        The plan is returned if ``dry_run=True``. The report is returned only if
+        ``report=True``.
+
+    Raises
+    ------
+    ValueError
+        - If ``category_ratio`` isn't between 0 and 1.
+        - If the columns of the DataFrame are not unique.
+        - If the values don't fit in ``plan``, such as integers out of bounds,
+          floats truncated or losing precision, categories missing or booleans
+          with missing values.
+
+    KeyError
+        If the columns of ``plan`` are not in the DataFrame.
+
+    See Also
+    --------
+    pandas.to_numeric
+    pandas.DataFrame.astype
+    pandas.DataFrame.memory_usage
+    dtoolkit.accessor.series.compact
+
+    Examples
+    --------
+    >>> import dtoolkit
+    >>> import pandas as pd
+    >>> df = pd.DataFrame(
+    ...     {
+    ...         'a': [1, 2, 300, 4] * 25,
+    ...         'b': [0.5, 1.5, 2.5, None] * 25,
+    ...         'c': ['x', 'y', 'x', 'x'] * 25,
+    ...         'd': [True, False, None, True] * 25,
+    ...     },
+    ... )
+    >>> df.head(4)
+         a    b  c      d
+    0    1  0.5  x   True
+    1    2  1.5  y  False
+    2  300  2.5  x   None
+    3    4  NaN  x   True
+    >>> df.dtypes
+    a      int64
+    b    float64
+    c        str
+    d     object
+    dtype: object
+    >>> df.compact().dtypes
+    a       int16
+    b     float32
+    c    category
+    d     boolean
+    dtype: object
+
+    Report the dtype and bytes before and after of each column.
+
+    >>> _, report = df.compact(report=True)
+    >>> report  # doctest: +SKIP
+      dtype_before dtype_after  bytes_before  bytes_after
+    a        int64       int16           800          200
+    b      float64     float32           800          400
+    c          str    category           900          226
+    d       object     boolean          3300          200
+
+    Infer the plan from the first chunk, then apply it to the following chunks.
+
+    >>> plan = df.compact(dry_run=True)
+    >>> plan
+    {'a': dtype('int16'), 'b': dtype('float32'), \
+'c': CategoricalDtype(categories=['x', 'y'], ordered=False, categories_dtype=str), \
+'d': BooleanDtype}
+    >>> chunk = pd.DataFrame(
+    ...     {
+    ...         'a': [5, 6],
+    ...         'b': [3.5, 4.5],
+    ...         'c': ['y', 'y'],
+    ...         'd': [False, False],
+    ...     },
+    ... )
+    >>> chunk.compact(plan=plan).dtypes
+    a       int16
+    b     float32
+    c    category
+    d     boolean
+    dtype: object
+    """
+
+    check_category_ratio(category_ratio)
+    if not df.columns.is_unique:
+        raise ValueError("The columns of the inputting is not unique.")
+
+    if plan is None:
+        plan = {
+            column: compact_dtype(df[column], category_ratio) for column in df.columns
+        }
+    else:
+        if unknown := set(plan).difference(df.columns):
+            raise KeyError(f"The columns of 'plan' are not in the frame: {unknown}.")
+        plan = {column: pandas_dtype(dtype) for column, dtype in plan.items()}
+
+    if dry_run:
+        return plan
+
+    arrays = [
+        convert(df[column], plan[column]) if column in plan else df[column]
+        for column in df.columns
+    ]
+    # Assemble by position, so the columns keep their type and names.
+    result = pd.DataFrame(dict(enumerate(arrays)), index=df.index, copy=False)
+    result.columns = df.columns
+
+    if report:
+        return result, pd.DataFrame(
+            [get_report(df[c], result[c]) for c in df.columns],
+            index=df.columns,
+            columns=REPORT,
+        )
+    return result
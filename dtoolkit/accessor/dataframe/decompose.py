@@ -9,6 +9,8 @@ import pandas as pd
 from dtoolkit.accessor.dataframe.drop_or_not import drop_or_not
 from dtoolkit.accessor.register import register_dataframe_method
 from dtoolkit.accessor.series.expand import collapse
+from dtoolkit.util import parallelize
+from dtoolkit.util.fit_decompose import count_components
 
 if TYPE_CHECKING:
     from sklearn.base import TransformerMixin
@@ -26,8 +28,11 @@ def decompose(
         | pd.Index
     ) = None,
     drop: bool = False,
+    fitted: TransformerMixin | dict[Hashable, TransformerMixin] = None,
+    return_model: bool = False,
+    n_jobs: int = 1,
     **kwargs,
-) -> pd.DataFrame:
+) -> pd.DataFrame | tuple[pd.DataFrame, TransformerMixin | dict]:
     """
     Decompose DataFrame's columns.
 
@@ -46,13 +51,33 @@ def decompose(
     drop : bool, default False
         If True, drop the used columns when ``columns`` is :keyword:`dict`.
 
+    fitted : TransformerMixin or dict, optional
+        Already fitted transformer(s), only ``transform`` would be called without
+        refitting. It's useful to apply the same transformer to new chunks.
+
+        - If ``columns`` is :keyword:`dict`, it should be a dict of fitted
+          transformers ``{new columns: transformer}``.
+        - Otherwise, it should be a fitted transformer.
+
+    return_model : bool, default False
+        If True, return the fitted transformer(s) as well, which could be passed
+        to ``fitted`` later.
+
+    n_jobs : int, default 1
+        The number of jobs to fit transformers concurrently when ``columns`` is
+        :keyword:`dict`. All the jobs are threads sharing the same memory, and
+        results are written into one preallocated array. ``-1`` means using all
+        processors. See the documentation for :class:`joblib.Parallel` for
+        complete details.
+
     **kwargs
         See the documentation for ``method`` for complete details on
         the keyword arguments.
 
     Returns
     -------
-    DataFrame
+    DataFrame or tuple of (DataFrame, TransformerMixin or dict)
+        The fitted transformer(s) are returned only if ``return_model=True``.
 
     Raises
     ------
@@ -63,6 +88,8 @@ def decompose(
     --------
     sklearn.decomposition
         Scikit-learn's matrix decomposition transformer.
+    dtoolkit.util.fit_decompose
+        Fit decomposition transformer(s) from chunks.
 
     Examples
     --------
@@ -135,46 +162,81 @@ def decompose(
     3 -1.702037 -0.321045  1  1 -1 -1
     4 -2.988071  0.267273  2  1 -2 -1
     5 -4.690108 -0.053773  3  2 -3 -2
+
+    Reuse the fitted transformer to decompose a new chunk without refitting.
+
+    >>> _, model = df.decompose(
+    ...     decomposition.PCA,
+    ...     {"A": ["a", "b"]},
+    ...     return_model=True,
+    ... )
+    >>> model
+    {'A': PCA(n_components=1)}
+    >>> df.head(2).decompose(
+    ...     decomposition.PCA,
+    ...     {"A": ["a", "b"]},
+    ...     fitted=model,
+    ... )  # doctest: +SKIP
+              A  a  b  c  d
+    0  1.383406 -1 -1  1  1
+    1  2.221898 -2 -1  2  1
     """
 
     if columns is None:
-        return pd.DataFrame(
-            _decompose(df, method, **kwargs),
-            index=df.index,
-            columns=df.columns,
-        )
+        values, model = _decompose(df, method, fitted=fitted, **kwargs)
+        result = pd.DataFrame(values, index=df.index, columns=df.columns)
 
     elif isinstance(columns, (list, pd.Index)):
-        return pd.DataFrame(
-            _decompose(df[columns], method, **kwargs),
-            index=df.index,
-            columns=columns,
-        ).combine_first(df)
+        values, model = _decompose(df[columns], method, fitted=fitted, **kwargs)
+        result = _join(pd.DataFrame(values, index=df.index, columns=columns), df)
 
     elif isinstance(columns, dict):
-        return pd.DataFrame(
-            np.hstack(
-                [
-                    _decompose(
-                        df[value],
-                        method,
-                        n_components=len(key) if isinstance(key, tuple) else 1,
-                        **kwargs,
-                    )
-                    for key, value in columns.items()
-                ],
-            ),
-            index=df.index,
-            columns=collapse(columns.keys()),
-        ).combine_first(
-            drop_or_not(
-                df,
-                drop=drop,
-                columns=collapse(columns.values()),
-            ),
+        fitted = fitted or {}
+        used = list(dict.fromkeys(collapse(columns.values())))
+        # All jobs share the same float block of the used columns.
+        block = pd.DataFrame(df[used].to_numpy(dtype=float), columns=used)
+
+        stops = np.cumsum([count_components(key) for key in columns])
+        values = np.empty((len(df), stops[-1] if len(stops) else 0))
+
+        def fit(job: tuple[int, Hashable, Hashable | list[Hashable]]):
+            i, key, value = job
+            piece, model = _decompose(
+                block[value],
+                method,
+                n_components=count_components(key),
+                fitted=fitted.get(key),
+                **kwargs,
+            )
+            # Write the result into the preallocated array directly.
+            values[:, stops[i] - piece.shape[1] : stops[i]] = piece
+            return model
+
+        models = parallelize(
+            fit,
+            ((i, key, value) for i, (key, value) in enumerate(columns.items())),
+            n_jobs=n_jobs,
+            backend="threading",
+            require="sharedmem",
         )
+        model = dict(zip(columns.keys(), models))
+        result = _join(
+            pd.DataFrame(values, index=df.index, columns=collapse(columns.keys())),
+            drop_or_not(df, drop=drop, columns=used),
+        )
+
+    else:
+        raise ValueError("The type of inputting 'columns' isn't right")
 
-    raise ValueError("The type of inputting 'columns' isn't right")
+    return (result, model) if return_model else result
+
+
+def _join(result: pd.DataFrame, df: pd.DataFrame, /) -> pd.DataFrame:
+    # The decomposed columns are prior to the original columns.
+    return pd.concat(
+        (result, df.drop(columns=result.columns, errors="ignore")),
+        axis=1,
+    )
 
 
 def _decompose(
@@ -182,14 +244,18 @@ def _decompose(
     /,
     method: TransformerMixin,
     n_components=None,
+    fitted: TransformerMixin = None,
     **kwargs,
-) -> np.ndarray:
+) -> tuple[np.ndarray, TransformerMixin]:
+    df = df.to_frame() if isinstance(df, pd.Series) else df
+    if fitted is not None:
+        return fitted.transform(df), fitted
+
     if n_components is None and len(df) < df.columns.size:
         raise ValueError(
             "Don't support decomposing DataFrame in which "
             "the number of rows is less than the number of columns",
         )
 
-    return method(n_components, **kwargs).fit_transform(
-        df.to_frame() if isinstance(df, pd.Series) else df,
-    )
+    model = method(n_components, **kwargs)
+    return model.fit_transform(df), model
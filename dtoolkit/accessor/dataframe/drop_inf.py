@@ -4,9 +4,9 @@ import numpy as np
 import pandas as pd
 
 from dtoolkit._typing import Axis
-from dtoolkit.accessor.dataframe import boolean  # noqa: F401
+from dtoolkit.accessor.dataframe.has_inf import inf_mask
+from dtoolkit.accessor.lazy import register_row_filter
 from dtoolkit.accessor.register import register_dataframe_method
-from dtoolkit.accessor.series.drop_inf import get_inf_range
 
 
 @register_dataframe_method
@@ -53,6 +53,9 @@ def drop_inf(
 
     See Also
     --------
+    dtoolkit.accessor.dataframe.has_inf
+        :obj:`~pandas.DataFrame` detects rows or columns which contain ``inf``
+        values.
     dtoolkit.accessor.series.drop_inf
         :obj:`~pandas.Series` drops ``inf`` values.
 
@@ -113,19 +116,21 @@ def drop_inf(
     Keep the DataFrame with valid entries in the same variable.
     """
 
-    inf_range = get_inf_range(inf)
     axis = df._get_axis_number(axis)
-    agg_axis = 1 - axis
+    mask = inf_mask(df, axis=axis, how=how, inf=inf, subset=subset)
+    return df.loc(axis=axis)[~mask]
 
-    agg_obj = df
-    if subset is not None:
-        ax = df._get_axis(agg_axis)
-        indices = ax.get_indexer_for(subset)
-        check = indices == -1
-        if check.any():
-            raise KeyError(list(np.compress(check, subset)))
 
-        agg_obj = df.take(indices, axis=agg_axis)
+@register_row_filter(pd.DataFrame, "drop_inf")
+def drop_inf_mask(
+    df: pd.DataFrame,
+    /,
+    axis: Axis = 0,
+    how: Literal["any", "all"] = "any",
+    inf: Literal["all", "pos", "neg"] = "all",
+    subset: list[str] = None,
+) -> np.ndarray | None:
+    if df._get_axis_number(axis) != 0:
+        return None  # Drop columns rather than rows.
 
-    mask = agg_obj.isin(inf_range).boolean(how=how, axis=agg_axis)
-    return df.loc(axis=axis)[~mask]
+    return ~inf_mask(df, axis=0, how=how, inf=inf, subset=subset)
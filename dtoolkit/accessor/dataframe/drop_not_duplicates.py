@@ -4,6 +4,8 @@ from typing import Sequence
 
 import pandas as pd
 
+from dtoolkit.accessor.duplicate_tracker import DuplicateTracker
+from dtoolkit.accessor.lazy import register_row_filter
 from dtoolkit.accessor.register import register_dataframe_method
 
 
@@ -13,6 +15,7 @@ def drop_not_duplicates(
     /,
     subset: Hashable | Sequence[Hashable] | None = None,
     keep: Literal["first", "last", False] = False,
+    tracker: DuplicateTracker = None,
 ) -> pd.DataFrame:
     """
     Return duplicate DataFrame values.
@@ -34,15 +37,25 @@ def drop_not_duplicates(
         - 'last' : Keep duplicates except for the last occurrence.
         - ``False`` : Keep all duplicates.
 
+    tracker : DuplicateTracker, optional
+        Track the rows across chunks of a stream, a row is a duplicate if it is
+        in the previous chunks. Only works with ``keep='first'``.
+
     Returns
     -------
     DataFrame
         Kept duplicate values.
 
+    Raises
+    ------
+    ValueError
+        If ``tracker`` is given and ``keep`` isn't 'first'.
+
     See Also
     --------
     pandas.DataFrame.duplicated
     pandas.DataFrame.drop_duplicates
+    dtoolkit.accessor.DuplicateTracker
     dtoolkit.accessor.series.drop_not_duplicates
 
     Examples
@@ -67,4 +80,21 @@ def drop_not_duplicates(
     1  Yum Yum   cup     4.0
     """
 
-    return df[df.duplicated(subset=subset, keep=keep)]
+    mask = drop_not_duplicates_mask(df, subset=subset, keep=keep, tracker=tracker)
+    return df[mask.to_numpy()]
+
+
+@register_row_filter(pd.DataFrame, "drop_not_duplicates", rowwise=False)
+def drop_not_duplicates_mask(
+    df: pd.DataFrame,
+    /,
+    subset: Hashable | Sequence[Hashable] | None = None,
+    keep: Literal["first", "last", False] = False,
+    tracker: DuplicateTracker = None,
+) -> pd.Series:
+    if tracker is not None:
+        if keep != "first":
+            raise ValueError(f"'tracker' only works with keep='first', got {keep!r}.")
+        return tracker.duplicated(df, subset=subset)
+
+    return df.duplicated(subset=subset, keep=keep)
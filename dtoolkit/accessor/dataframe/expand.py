@@ -1,16 +1,32 @@
 from collections.abc import Hashable
 from textwrap import dedent
 
+import numpy as np
 import pandas as pd
+from pandas._libs.lib import to_object_array
 from pandas.util._decorators import doc
 
 from dtoolkit.accessor.register import register_dataframe_method
 from dtoolkit.accessor.series import expand as s_expand
+from dtoolkit.accessor.series.expand import expand_arrow
+from dtoolkit.accessor.series.expand import get_columns
+from dtoolkit.accessor.series.expand import get_rows
+from dtoolkit.util import parallelize
+from dtoolkit.util._arrow import is_arrow_list
 
 
 @register_dataframe_method
 @doc(
     s_expand,
+    parameters=dedent(
+        """
+    n_jobs : int, default 1
+        The number of jobs to expand columns concurrently via threads. The width
+        of each column is computed first, then the expanded columns are filled
+        into one preallocated block. ``-1`` means using all processors. See the
+        documentation for :class:`joblib.Parallel` for complete details.
+    """,
+    ),
     examples=dedent(
         """
     Examples
@@ -71,16 +87,63 @@ def expand(
     suffix: list[Hashable] = None,
     delimiter: str = "_",
     flatten: bool = False,
+    n_jobs: int = 1,
 ) -> pd.DataFrame:
-    return pd.concat(
-        (
-            s_expand(
-                s,
-                suffix=suffix,
-                delimiter=delimiter,
-                flatten=flatten,
+    # Get the expanded rows and the output width of each column up front.
+    def plan(
+        i: int,
+    ) -> tuple[list[list] | pd.DataFrame | None, list[Hashable] | None]:
+        s = df.iloc[:, i]
+        if not flatten and is_arrow_list(s):
+            # Arrow lists are expanded via Arrow kernels, out of the object block.
+            expanded = expand_arrow(s, suffix=suffix, delimiter=delimiter)
+            return expanded, list(expanded.columns)
+        if (rows := get_rows(s, flatten=flatten)) is None:
+            return None, None
+        lengths = list(map(len, rows))
+        return rows, get_columns(s, lengths, suffix=suffix, delimiter=delimiter)
+
+    plans = _parallelize(plan, range(df.shape[1]), n_jobs=n_jobs)
+    widths = [len(columns) if isinstance(rows, list) else 0 for rows, columns in plans]
+    starts = np.cumsum([0, *widths])
+
+    # Fill the expanded columns into one preallocated block.
+    block = np.empty((len(df), starts[-1]), dtype=object)
+
+    def fill(i: int):
+        if isinstance(rows := plans[i][0], list):
+            block[:, starts[i] : starts[i + 1]] = to_object_array(
+                rows,
+                min_width=widths[i],
             )
-            for _, s in df.items()
-        ),
-        axis=1,
+
+    _parallelize(fill, range(df.shape[1]), n_jobs=n_jobs)
+    expanded = pd.DataFrame(block, index=df.index, copy=False).infer_objects()
+
+    # The columns which need no expansion are passed through.
+    arrays, labels = [], []
+    for i, (label, (rows, columns)) in enumerate(zip(df.columns, plans)):
+        if columns is None:
+            arrays.append(df.iloc[:, i])
+            labels.append(label)
+        elif isinstance(rows, pd.DataFrame):
+            arrays.extend(rows.iloc[:, j] for j in range(rows.shape[1]))
+            labels.extend(columns)
+        else:
+            arrays.extend(expanded.iloc[:, starts[i] + j] for j in range(widths[i]))
+            labels.extend(columns)
+
+    # Assemble by position, the labels may be duplicated.
+    result = pd.DataFrame(dict(enumerate(arrays)), index=df.index, copy=False)
+    result.columns = labels
+    return result
+
+
+def _parallelize(func, jobs, /, n_jobs: int) -> list:
+    return parallelize(
+        func,
+        jobs,
+        n_jobs=n_jobs,
+        backend="threading",
+        require="sharedmem",
     )
@@ -4,9 +4,12 @@ from collections.abc import Hashable
 from typing import Literal
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
 from dtoolkit.accessor.register import register_dataframe_method
+from dtoolkit.util import parallelize
+from dtoolkit.util._validation import is_positive_integer
 
 if TYPE_CHECKING:
     from sklearn.base import RegressorMixin
@@ -19,35 +22,64 @@ def fillna_regression(
     method: RegressorMixin,
     columns: dict[Hashable, Hashable | list[Hashable] | pd.Index],
     how: Literal["na", "all"] = "na",
+    return_model: bool = False,
+    n_jobs: int = 1,
+    fitted: dict[Hashable, RegressorMixin] = None,
+    batch_size: int = None,
     **kwargs,
-) -> pd.DataFrame:
+) -> pd.DataFrame | tuple[pd.DataFrame, dict[Hashable, RegressorMixin]]:
     """
     Fill na value with regression algorithm.
 
     Parameters
     ----------
     method : RegressorMixin
-        Regression transformer.
+        Regression transformer. Only used for the targets which are not in
+        ``fitted``.
 
     columns : dict, ``{y: X}``
         A series of column names pairs. The key is the y (or target) column name, and
         values are X (or feature) column names.
 
+        Targets are filled in order. If a target is one of the features of a later
+        target, the later one uses the filled values.
+
     how : {'na', 'all'}, default 'na'
         Only fill na value or apply regression to entire target column.
 
+    return_model : bool, default False
+        If True, return the fitted models ``{y: model}`` as well.
+
+    n_jobs : int, default 1
+        The number of jobs to fit targets concurrently. Targets which don't depend
+        on others' filled values are fitted at the same time via threads. ``-1``
+        means using all processors. See the documentation for
+        :class:`joblib.Parallel` for complete details.
+
+    fitted : dict, ``{y: model}``, optional
+        The already fitted models of targets, such as the models returned via
+        ``return_model=True``. These targets skip fitting and are predicted directly,
+        so chunks of a large frame could be filled with models fitted once.
+
+    batch_size : int, optional
+        The number of rows to predict at once. If None, predict all the rows in one
+        call. The predictions are written into a preallocated array, so only
+        ``batch_size`` rows of features are copied at a time.
+
     **kwargs
         See the documentation for ``method`` for complete details on
         the keyword arguments.
 
     Returns
     -------
-    DataFrame
+    DataFrame or tuple of (DataFrame, dict)
+        The fitted models are returned only if ``return_model=True``.
 
     Raises
     ------
     ValueError
-        If ``how`` isn't "na" or "all".
+        - If ``how`` isn't "na" or "all".
+        - If ``batch_size`` isn't a positive integer.
 
     See Also
     --------
@@ -109,16 +141,101 @@ def fillna_regression(
     2   2   2   9.0
     3   2   3  11.0
     4   3   5  16.0
+
+    Get the fitted models as well.
+
+    >>> _, models = df.fillna_regression(
+    ...     LinearRegression,
+    ...     {'y': ['x1', 'x2']},
+    ...     return_model=True,
+    ... )
+    >>> models
+    {'y': LinearRegression()}
+
+    Reuse the fitted models to fill another chunk without refitting, and predict
+    in batches.
+
+    >>> chunk = pd.DataFrame({'x1': [4, 5], 'x2': [1, 2], 'y': [None, None]})
+    >>> chunk.fillna_regression(
+    ...     LinearRegression,
+    ...     {'y': ['x1', 'x2']},
+    ...     fitted=models,
+    ...     batch_size=1,
+    ... )
+       x1  x2     y
+    0   4   1   9.0
+    1   5   2  12.0
     """
 
     if how not in {"na", "all"}:
         raise ValueError(f"invalid inf option: {how!r}")
+    if batch_size is not None and not is_positive_integer(batch_size):
+        raise ValueError(
+            f"'batch_size' must be a positive integer, got {batch_size!r}.",
+        )
+
+    fitted = fitted or {}
+
+    order = {y: i for i, y in enumerate(columns)}
+    filled, models = {}, {}
+
+    def fit(y: Hashable) -> tuple[pd.Series, RegressorMixin]:
+        return _fillna_regression(
+            df,
+            method,
+            y,
+            columns[y],
+            how=how,
+            model=fitted.get(y),
+            batch_size=batch_size,
+            # Only the targets in front of 'y' are filled for it.
+            filled={k: v for k, v in filled.items() if order[k] < order[y]},
+            **kwargs,
+        )
+
+    for level in _levels(columns):
+        results = parallelize(
+            fit,
+            level,
+            n_jobs=n_jobs,
+            backend="threading",
+            require="sharedmem",
+        )
+        for y, (values, model) in zip(level, results):
+            filled[y], models[y] = values, model
 
     df = df.copy()  # avoid mutating the original dataframe
+    for y in columns:
+        df[y] = filled[y]
+
+    return (df, {y: models[y] for y in columns}) if return_model else df
+
+
+def _levels(
+    columns: dict[Hashable, Hashable | list[Hashable] | pd.Index],
+    /,
+) -> list[list[Hashable]]:
+    """
+    Group targets by their dependency depth.
+
+    A target depends on the targets in front of it which are its features.
+    Targets in the same level don't depend on each other.
+    """
+
+    depth = {}
     for y, X in columns.items():
-        df = _fillna_regression(df, method, y, X, how=how, **kwargs)
+        X = _as_list(X)
+        depth[y] = 1 + max((depth[x] for x in X if x in depth), default=-1)
+
+    levels = [[] for _ in range(max(depth.values(), default=-1) + 1)]
+    for y, d in depth.items():
+        levels[d].append(y)
+
+    return levels
 
-    return df
+
+def _as_list(X: Hashable | list[Hashable] | pd.Index, /) -> list[Hashable]:
+    return [X] if isinstance(X, (str, int)) else list(X)
 
 
 def _fillna_regression(
@@ -128,20 +245,60 @@ def _fillna_regression(
     y: Hashable,
     X: Hashable | list[Hashable] | pd.Index,
     how: Literal["na", "all"],
+    filled: dict[Hashable, pd.Series],
+    model: RegressorMixin = None,
+    batch_size: int = None,
     **kwargs,
-):
+) -> tuple[pd.Series, RegressorMixin]:
     """Fill single na column at once."""
 
-    if isinstance(X, (str, int)):
-        X = [X]
+    X = _as_list(X)
+    # Only select the used columns rather than copying the whole frame.
+    features = df[X]
+    if used := [x for x in X if x in filled]:
+        features = features.copy()
+        for x in used:
+            features[x] = filled[x]
 
-    data = df[df[y].notnull()]
-    model = method(**kwargs).fit(data[X], data[y])
+    target = df[y]
+    notnull = target.notnull().to_numpy()
+    if model is None:
+        model = method(**kwargs).fit(features[notnull], target[notnull])
 
     if how == "all":
-        df[y] = model.predict(df[X])
-    elif how == "na":
-        index_null = df[y].isnull()
-        df.loc[index_null, y] = model.predict(df.loc[index_null, X])
+        values = _predict(model, features, batch_size=batch_size)
+        return pd.Series(values, index=df.index, name=y), model
+
+    if notnull.all():
+        return target, model
+
+    rows = np.flatnonzero(~notnull)
+    target = target.copy()
+    target.iloc[rows] = _predict(model, features, rows=rows, batch_size=batch_size)
+    return target, model
+
+
+def _predict(
+    model: RegressorMixin,
+    features: pd.DataFrame,
+    /,
+    rows: np.ndarray = None,
+    batch_size: int = None,
+) -> np.ndarray:
+    """Predict the selected rows batch by batch into a preallocated array."""
+
+    n = len(features) if rows is None else len(rows)
+    if batch_size is None or batch_size >= n:
+        return model.predict(features if rows is None else features.iloc[rows])
+
+    values = None
+    for start in range(0, n, batch_size):
+        batch = slice(start, start + batch_size)
+        predicted = model.predict(
+            features.iloc[batch if rows is None else rows[batch]],
+        )
+        if values is None:
+            values = np.empty(n, dtype=predicted.dtype)
+        values[batch] = predicted
 
-    return df
+    return values
@@ -2,17 +2,20 @@ from collections.abc import Hashable
 from typing import Iterable
 from typing import Literal
 
+import numpy as np
 import pandas as pd
 
 from dtoolkit._typing import SeriesOrFrame
 from dtoolkit.accessor.dataframe import boolean  # noqa: F401
+from dtoolkit.accessor.filter_spec import FilterSpec
+from dtoolkit.accessor.lazy import register_row_filter
 from dtoolkit.accessor.register import register_dataframe_method
 
 
 @register_dataframe_method
 def filter_in(
     df: pd.DataFrame,
-    condition: Iterable | SeriesOrFrame | dict[Hashable, list[Hashable]],
+    condition: Iterable | SeriesOrFrame | dict[Hashable, list[Hashable]] | FilterSpec,
     /,
     how: Literal["any", "all"] = "all",
     complement: bool = False,
@@ -24,7 +27,7 @@ def filter_in(
 
     Parameters
     ----------
-    condition : Iterable, Series, DataFrame or dict
+    condition : Iterable, Series, DataFrame, dict or FilterSpec
         The filtered result is based on this specific condition.
 
         * If ``condition`` is a :obj:`dict`, the keys must be the column
@@ -35,6 +38,10 @@ def filter_in(
         * If ``condition`` is a :obj:`~pandas.DataFrame`, then both the index
           and column labels must be matched.
 
+        * If ``condition`` is a :class:`~dtoolkit.accessor.FilterSpec`, the
+          compiled condition is reused. It's faster to apply the same
+          Iterable or dict condition to many DataFrames.
+
     how : {'any', 'all'}, default 'all'
         Determine whether the row is filtered from :obj:`~pandas.DataFrame`,
         when there have at least one value or all value.
@@ -61,6 +68,9 @@ def filter_in(
     dtoolkit.accessor.series.filter_in
         Filter Series contents.
 
+    dtoolkit.accessor.FilterSpec
+        Compiled reusable condition.
+
     Examples
     --------
     >>> import dtoolkit
@@ -120,28 +130,41 @@ def filter_in(
     falcon     2      2
     """
 
-    return df[
-        select_column(df, condition=condition)
-        .isin(condition)
-        .boolean(
-            how=how,
-            axis=1,
-            complement=complement,
+    return df[filter_in_mask(df, condition, how=how, complement=complement)]
+
+
+@register_row_filter(pd.DataFrame, "filter_in")
+def filter_in_mask(
+    df: pd.DataFrame,
+    condition: Iterable | SeriesOrFrame | dict[Hashable, list[Hashable]] | FilterSpec,
+    /,
+    how: Literal["any", "all"] = "all",
+    complement: bool = False,
+) -> pd.Series | np.ndarray:
+    if isinstance(condition, (pd.Series, pd.DataFrame)):
+        return (
+            select_column(df, condition=condition)
+            .isin(condition)
+            .boolean(
+                how=how,
+                axis=1,
+                complement=complement,
+            )
         )
-    ]
+
+    if not isinstance(condition, FilterSpec):
+        condition = FilterSpec(condition)
+    return condition.mask(df, how=how, complement=complement)
 
 
 def select_column(
     df: pd.DataFrame,
     /,
-    condition: Iterable | SeriesOrFrame | dict[Hashable, list[Hashable]],
+    condition: SeriesOrFrame,
 ) -> pd.DataFrame:
     """Select DataFram columns via condition type"""
 
-    if isinstance(condition, dict):
-        # 'how' only works on condition these dictionary's keys
-        return df[condition.keys()]
-    elif isinstance(condition, pd.DataFrame):
+    if isinstance(condition, pd.DataFrame):
         # 'how' only works on condition these DataFrame's columns
         return df[condition.columns]
 
@@ -0,0 +1,175 @@
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+from dtoolkit._typing import Axis
+from dtoolkit.accessor.register import register_dataframe_method
+from dtoolkit.accessor.series.has_inf import can_hold_inf
+from dtoolkit.accessor.series.has_inf import get_inf_func
+from dtoolkit.accessor.series.has_inf import isinf
+
+
+@register_dataframe_method
+def has_inf(
+    df: pd.DataFrame,
+    /,
+    axis: Axis = 0,
+    how: Literal["any", "all"] = "any",
+    inf: Literal["all", "pos", "+", "neg", "-"] = "all",
+    subset: list[str] = None,
+) -> pd.Series:
+    """
+    Detect rows or columns which contain ``inf`` values.
+
+    The mask is reduced column by column, so no intermediate boolean
+    :obj:`~pandas.DataFrame` is materialised. Float columns are checked via
+    :func:`numpy.isinf` directly, and columns which can't hold ``inf`` (integer,
+    boolean, datetime, string) are skipped entirely.
+
+    Parameters
+    ----------
+    axis : {0 or 'index', 1 or 'columns'}, default 0
+        Determine if rows or columns are detected.
+
+        * 0, or 'index' : Detect rows which contain ``inf`` values.
+        * 1, or 'columns' : Detect columns which contain ``inf`` value.
+
+    how : {'any', 'all'}, default 'any'
+        Determine if row or column is marked, when we have at least one ``inf``
+        or all ``inf``.
+
+        * 'any' : If any ``inf`` values are present, mark that row or column.
+        * 'all' : If all values are ``inf``, mark that row or column.
+
+    inf : {'all', 'pos', '+', 'neg', '-'}, default 'all'
+        * 'all' : Detect ``inf`` and ``-inf``.
+        * 'pos' / '+' : Only detect ``inf``.
+        * 'neg' / '-' : Only detect ``-inf``.
+
+    subset : array-like, optional
+        Labels along other axis to consider, e.g. if you are detecting rows
+        these would be a list of columns to include.
+
+    Returns
+    -------
+    Series(bool)
+        Indexed by the labels of ``axis``.
+
+    Raises
+    ------
+    ValueError
+        - If ``how`` isn't "any" or "all".
+        - If ``inf`` isn't "all", "pos", "+", "neg", or "-".
+
+    KeyError
+        If ``subset`` contains labels which aren't in the DataFrame.
+
+    See Also
+    --------
+    dtoolkit.accessor.series.has_inf
+    dtoolkit.accessor.dataframe.drop_inf
+
+    Examples
+    --------
+    >>> import dtoolkit
+    >>> import pandas as pd
+    >>> import numpy as np
+    >>> df = pd.DataFrame({"a": [1., np.inf, 3.], "b": [-np.inf, np.inf, 0.]})
+    >>> df
+         a    b
+    0  1.0 -inf
+    1  inf  inf
+    2  3.0  0.0
+
+    Detect the rows where at least one element is inf and -inf.
+
+    >>> df.has_inf()
+    0     True
+    1     True
+    2    False
+    dtype: bool
+
+    Detect the rows where all elements are inf.
+
+    >>> df.has_inf(how="all", inf="pos")
+    0    False
+    1     True
+    2    False
+    dtype: bool
+
+    Detect the columns where at least one element is -inf.
+
+    >>> df.has_inf(axis=1, inf="neg")
+    a    False
+    b     True
+    dtype: bool
+
+    Several masks could be combined before selecting only once.
+
+    >>> df[~df.has_inf(subset=["a"]) & (df["b"] < 1)]
+         a    b
+    0  1.0 -inf
+    2  3.0  0.0
+    """
+
+    axis = df._get_axis_number(axis)
+    return pd.Series(
+        inf_mask(df, axis=axis, how=how, inf=inf, subset=subset),
+        index=df._get_axis(axis),
+    )
+
+
+def inf_mask(
+    df: pd.DataFrame,
+    /,
+    axis: Axis = 0,
+    how: Literal["any", "all"] = "any",
+    inf: Literal["all", "pos", "+", "neg", "-"] = "all",
+    subset: list[str] = None,
+) -> np.ndarray:
+    """Reduce the ``inf`` mask of DataFrame to a row or column numpy array"""
+
+    if how not in {"any", "all"}:
+        raise ValueError(f"invalid how option: {how!r}")
+    get_inf_func(inf)  # Validate 'inf' option even if there is nothing to check.
+
+    axis = df._get_axis_number(axis)
+    agg_axis = 1 - axis
+
+    agg_obj = df
+    if subset is not None:
+        ax = df._get_axis(agg_axis)
+        indices = ax.get_indexer_for(subset)
+        check = indices == -1
+        if check.any():
+            raise KeyError(list(np.compress(check, subset)))
+
+        agg_obj = df.take(indices, axis=agg_axis)
+
+    if axis == 1:
+        reduce = np.any if how == "any" else np.all
+        return np.fromiter(
+            (reduce(isinf(s, inf=inf)) for _, s in agg_obj.items()),
+            dtype=bool,
+            count=agg_obj.shape[1],
+        )
+
+    if how == "any":
+        mask = np.zeros(len(agg_obj), dtype=bool)
+        for _, s in agg_obj.items():
+            if not can_hold_inf(s):
+                continue
+            np.logical_or(mask, isinf(s, inf=inf), out=mask)
+    else:
+        mask = np.ones(len(agg_obj), dtype=bool)
+        for _, s in agg_obj.items():
+            if not can_hold_inf(s):
+                # A column without any 'inf' makes every row failed.
+                mask[:] = False
+                break
+            np.logical_and(mask, isinf(s, inf=inf), out=mask)
+            if not mask.any():
+                break
+
+    return mask
@@ -0,0 +1,47 @@
+import pandas as pd
+from pandas.util._decorators import doc
+
+from dtoolkit.accessor.lazy import Lazy
+from dtoolkit.accessor.register import register_dataframe_method
+from dtoolkit.accessor.series import lazy as s_lazy
+
+
+@register_dataframe_method
+@doc(
+    s_lazy,
+    klass="DataFrame",
+    examples="""
+    >>> import dtoolkit
+    >>> import numpy as np
+    >>> import pandas as pd
+    >>> df = pd.DataFrame(
+    ...     {
+    ...         'a': [1, 2, np.inf, 4, 5, 5],
+    ...         'b': [5, 4, 3, 2, 1, 1],
+    ...     },
+    ...     index=['x', None, 'y', 'z', 'w', 'v'],
+    ... )
+    >>> plan = (
+    ...     df.lazy()
+    ...     .drop_inf()
+    ...     .filter_in({'b': [1, 2, 4, 5]})
+    ...     .dropna_index()
+    ...     .drop_not_duplicates()
+    ...     .sum()
+    ... )
+    >>> print(plan.explain())
+    Lazy DataFrame plan:
+      0. fused mask, take once
+         drop_inf()
+         filter_in({'b': [1, 2, 4, 5]})
+         dropna_index()
+         drop_not_duplicates()
+      1. sum()
+    >>> plan.collect()
+    a    10.0
+    b     2.0
+    dtype: float64
+    """,
+)
+def lazy(df: pd.DataFrame, /) -> Lazy:
+    return Lazy(df)
@@ -1,7 +1,9 @@
 from collections.abc import Hashable
 
+import numpy as np
 import pandas as pd
 from pandas.api.types import is_dict_like
+from pandas.api.types import is_hashable
 from pandas.api.types import is_number
 
 from dtoolkit._typing import Number
@@ -13,10 +15,16 @@ from dtoolkit.accessor.register import register_dataframe_method
 def weighted_mean(
     df: pd.DataFrame,
     /,
-    weights: list[Number] | dict[Hashable, Number | dict[Hashable, Number]] | pd.Series,
+    weights: (
+        list[Number]
+        | dict[Hashable, Number | dict[Hashable, Number]]
+        | pd.Series
+        | Hashable
+    ),
     validate: bool = False,
     top: Number = 1,
     drop: bool = False,
+    by: Hashable | list[Hashable] = None,
 ) -> SeriesOrFrame:
     """
     Calculate the weighted score of selected columns in the DataFrame.
@@ -28,12 +36,13 @@ def weighted_mean(
 
     Parameters
     ----------
-    weights : list, dict or Series
+    weights : list, dict, Series or column label
         The weights of each column in the DataFrame.
 
         - list : The weights of each column in the DataFrame.
         - dict : Receive like ``{column: score}`` or ``{new_column: {column: score}}``.
         - Series : The weights must be a series with the same index as the DataFrame.
+        - column label : Only works with ``by``. The column of each row's weight.
 
     validate : bool, default False
         If True, require the sum of ``weights`` values equal to 1.
@@ -42,7 +51,17 @@ def weighted_mean(
         If ``validate`` is True, require the sum of ``weights`` values equal to ``top``.
 
     drop : bool, default False
-        If True, drop the used columns.
+        If True, drop the used columns. Doesn't work with ``by``.
+
+    by : column label or list of labels, optional
+        If given, calculate the weighted mean of each group for all the other
+        numeric columns, weighted by the ``weights`` column::
+
+            w = df[weights]
+            df.mul(w, axis=0).groupby(by).sum() / w.groupby(by).sum()
+
+        ``sum(w·x)`` and ``sum(w)`` of all groups are calculated in one grouped
+        reduction, rather than calling this method once per group.
 
     Returns
     -------
@@ -54,6 +73,10 @@ def weighted_mean(
         - If one of the ``weights`` values is not number type.
         - If ``weights`` is not a list, a dict or a Series type.
         - If ``weights`` is a dict and the value is not a number or a dict type.
+        - If ``by`` is given and ``weights`` is not a column label.
+
+    KeyError
+        If ``by`` is given and ``weights`` is not in the DataFrame columns.
 
     ValueError
         - If ``weights`` is list type and its length is not the same as the number of
@@ -61,6 +84,7 @@ def weighted_mean(
         - If ``weights`` is Series type and its labels are not in the DataFrame columns.
         - If ``weights`` is Series type and its labels are duplicated.
         - If ``validate=True`` and the sum of ``weights`` values is not equal to 1.
+          With ``by``, the sum of each group's weights is checked.
 
     See also
     --------
@@ -110,8 +134,39 @@ def weighted_mean(
         ab   bc  ab-bc  a  b  c
     0  1.5  3.0   2.25  1  2  4
     1  1.5  3.0   2.25  1  2  4
+
+    Calculate the weighted mean of each group, the weights are from a column.
+
+    >>> df = pd.DataFrame(
+    ...     {
+    ...         "region": ["x", "x", "y", "y"],
+    ...         "price": [1, 3, 2, 4],
+    ...         "amount": [10, 20, 30, 40],
+    ...         "weight": [1, 3, 1, 1],
+    ...     }
+    ... )
+    >>> df
+      region  price  amount  weight
+    0      x      1      10       1
+    1      x      3      20       3
+    2      y      2      30       1
+    3      y      4      40       1
+    >>> df.weighted_mean("weight", by="region")
+            price  amount
+    region
+    x         2.5    17.5
+    y         3.0    35.0
     """
 
+    if by is not None:
+        if isinstance(weights, (list, tuple, dict, pd.Series)):
+            raise TypeError(
+                "'weights' must be a column label when 'by' is given, "
+                f"but you passed a {type(weights).__name__!r}.",
+            )
+
+        return grouped_score(df, weights, by=by, validate=validate, top=top)
+
     if isinstance(weights, (list, tuple)):
         result = score(df, weights, validate=validate, top=top)
 
@@ -123,14 +178,7 @@ def weighted_mean(
             result = score(df, weights=weights, validate=validate, top=top)
 
         elif all(map(is_dict_like, weights.values())):
-            result = pd.DataFrame()
-            for name, weight in weights.items():
-                if not all(map(is_number, weight.values())):
-                    raise TypeError("The value of weights is not number type.")
-
-                data = result.combine_first(df)
-                another = score(data, weight, validate=validate, top=top, name=name)
-                result = pd.concat((result, another), axis=1)
+            result = scores(df, weights, validate=validate, top=top)
 
         else:
             raise TypeError("Received an invalid 'weights' type.")
@@ -145,7 +193,9 @@ def weighted_mean(
         if isinstance(result, pd.Series) and result.name:
             result = result.to_frame()
         if isinstance(result, pd.DataFrame):
-            result = result.combine_first(df)
+            # The new generated columns are prior to the original columns.
+            others = df.drop(columns=result.columns, errors="ignore")
+            result = pd.concat((result, others), axis=1)
 
     return result
 
@@ -172,3 +222,88 @@ def score(
         raise ValueError(f"{sum(weights)=} is not equal to {top}.")
 
     return df.mul(weights).sum(axis=1).divide(sum(weights)).rename(name)
+
+
+def scores(
+    df: pd.DataFrame,
+    /,
+    weights: dict[Hashable, dict[Hashable, Number]],
+    *,
+    validate: bool,
+    top: Number,
+) -> pd.DataFrame:
+    """
+    Return calculated multiple score columns via a single matrix multiplication.
+
+    Each score is linear to its used columns, so a score using the new generated
+    columns could be unfolded to the original columns. Then all the weights are
+    assembled into one matrix ``W`` and evaluated via ``df.values @ W``.
+    """
+
+    # The original columns used and their position in the weights matrix.
+    columns = {}
+    # The unfolded weights of each new generated column on the original columns.
+    unfolded = {}
+    for name, weight in weights.items():
+        if not all(map(is_number, weight.values())):
+            raise TypeError("The value of weights is not number type.")
+
+        total = sum(weight.values())
+        if validate and total != top:
+            raise ValueError(f"sum(weights)={total} is not equal to {top}.")
+
+        vector = {}
+        for key, w in weight.items():
+            if key in unfolded:
+                # The new generated column is prior to the original column.
+                for k, v in unfolded[key].items():
+                    vector[k] = vector.get(k, 0) + w * v
+            elif key in df.columns:
+                columns.setdefault(key, len(columns))
+                vector[key] = vector.get(key, 0) + w
+            else:
+                raise KeyError(key)
+
+        unfolded[name] = {k: v / total for k, v in vector.items()}
+
+    W = np.zeros((len(columns), len(unfolded)))
+    for j, vector in enumerate(unfolded.values()):
+        for key, w in vector.items():
+            W[columns[key], j] = w
+
+    # Missing values don't contribute to the score like 'DataFrame.sum'.
+    values = df[list(columns)].to_numpy(dtype=float, na_value=0)
+    return pd.DataFrame(values @ W, index=df.index, columns=list(unfolded))
+
+
+def grouped_score(
+    df: pd.DataFrame,
+    /,
+    weights: Hashable,
+    by: Hashable | list[Hashable],
+    *,
+    validate: bool,
+    top: Number,
+) -> pd.DataFrame:
+    """Return calculated weighted mean of each group via one grouped reduction."""
+
+    keys = by if isinstance(by, list) else [by]
+    # Only the hashable keys are column labels, the others are arrays.
+    is_label = [is_hashable(k) and k in df.columns for k in keys]
+    grouper = [df[k] if label else k for k, label in zip(keys, is_label)]
+    if not isinstance(by, list):
+        grouper = grouper[0]
+
+    w = df[weights]
+    labels = [k for k, label in zip(keys, is_label) if label]
+    columns = df.drop(columns=[weights, *labels]).select_dtypes("number").columns
+    # The last column is 'sum(w)' and the others are 'sum(w·x)'.
+    data = pd.concat((df[columns].mul(w, axis=0), w), axis=1, ignore_index=True)
+    sums = data.groupby(grouper).sum()
+    total = sums.iloc[:, -1]
+    if validate and (total != top).any():
+        raise ValueError(f"sum(weights) of each group is not equal to {top}.")
+
+    result = sums.iloc[:, :-1].div(total, axis=0)
+    result.columns = columns
+    return result
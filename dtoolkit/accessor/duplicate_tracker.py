@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import weakref
+from collections.abc import Hashable
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_list_like
+
+from dtoolkit._typing import SeriesOrFrame
+
+
+class DuplicateTracker:
+    """
+    Track duplicate rows across chunks of a stream.
+
+    Each row is reduced to a 64-bit hash via :func:`~pandas.util.hash_pandas_object`
+    (geometries are hashed via their WKB), and only the hashes of seen rows are kept.
+    So a stream could be deduplicated chunk by chunk with ``keep='first'``
+    semantics: a row is a duplicate if the same row is in the previous chunks or in
+    front of it in the current chunk.
+
+    The seen hashes are kept as a few sorted runs which are merged as they grow, and
+    looked up via binary search.
+
+    Two different rows could collide on the same 64-bit hash with a very tiny
+    probability (about ``n**2 / 2**65`` for ``n`` distinct rows), then the latter
+    one would be marked as a duplicate.
+
+    Parameters
+    ----------
+    max_memory : int, optional
+        The max bytes of hashes to keep in memory, 8 bytes per distinct row. If None,
+        there is no limit.
+
+    spill_dir : str or path-like, optional
+        If the memory would exceed ``max_memory``, the in-memory hashes are spilled
+        into a temporary file under this directory and looked up via memory-map.
+        The files are removed when the tracker is cleared or garbage collected.
+        If None, :class:`MemoryError` is raised instead.
+
+    See Also
+    --------
+    pandas.Series.duplicated
+    pandas.DataFrame.duplicated
+    dtoolkit.accessor.series.drop_not_duplicates
+    dtoolkit.accessor.dataframe.drop_not_duplicates
+    dtoolkit.geoaccessor.geoseries.drop_duplicates_geometry
+    dtoolkit.geoaccessor.geodataframe.drop_duplicates_geometry
+
+    Examples
+    --------
+    >>> import dtoolkit
+    >>> import pandas as pd
+    >>> from dtoolkit.accessor import DuplicateTracker
+    >>> tracker = DuplicateTracker()
+    >>> first = pd.Series(['llama', 'cow', 'llama'])
+    >>> second = pd.Series(['beetle', 'cow', 'beetle'], index=[3, 4, 5])
+    >>> tracker.duplicated(first)
+    0    False
+    1    False
+    2     True
+    dtype: bool
+    >>> tracker.duplicated(second)
+    3    False
+    4     True
+    5     True
+    dtype: bool
+    >>> tracker
+    DuplicateTracker(size=3)
+
+    Drop the rows seen before.
+
+    >>> tracker = DuplicateTracker()
+    >>> tracker.drop_duplicates(first)
+    0    llama
+    1      cow
+    dtype: str
+    >>> tracker.drop_duplicates(second)
+    3    beetle
+    dtype: str
+    """
+
+    def __init__(
+        self,
+        max_memory: int | None = None,
+        spill_dir: str | os.PathLike | None = None,
+    ):
+        self.max_memory = max_memory
+        self.spill_dir = spill_dir
+        self._runs: list[np.ndarray] = []
+        self._spilled: list[np.ndarray] = []
+        self._files: list[str] = []
+        self._finalizer = weakref.finalize(self, _remove, self._files)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(size={len(self)})"
+
+    def __len__(self) -> int:
+        """The number of distinct rows seen."""
+
+        return sum(run.size for run in (*self._runs, *self._spilled))
+
+    @property
+    def nbytes(self) -> int:
+        """The bytes of hashes kept in memory."""
+
+        return sum(run.nbytes for run in self._runs)
+
+    def clear(self) -> None:
+        """Forget all seen rows and remove the spilled files."""
+
+        self._runs.clear()
+        self._spilled.clear()
+        _remove(self._files)
+
+    def duplicated(
+        self,
+        obj: SeriesOrFrame,
+        /,
+        subset: Hashable | Sequence[Hashable] | None = None,
+    ) -> pd.Series:
+        """
+        Return boolean Series denoting rows seen before, then record the rows.
+
+        Parameters
+        ----------
+        obj : Series or DataFrame
+            A chunk of the stream.
+
+        subset : column label or sequence of labels, optional
+            Only consider certain columns for identifying duplicates, only works
+            for DataFrame. By default use all of the columns.
+
+        Returns
+        -------
+        Series
+            Boolean series for each duplicated rows.
+
+        Raises
+        ------
+        ValueError
+            If ``subset`` is given for Series.
+
+        MemoryError
+            If ``max_memory`` would be exceeded and ``spill_dir`` is None.
+        """
+
+        hashes = row_hash(obj, subset=subset)
+        unique, first = np.unique(hashes, return_index=True)
+        seen = self._contains(unique)
+
+        self._add(unique[~seen])
+        duplicated = np.ones(hashes.size, dtype=bool)
+        duplicated[first[~seen]] = False
+        return pd.Series(duplicated, index=obj.index)
+
+    def drop_duplicates(
+        self,
+        obj: SeriesOrFrame,
+        /,
+        subset: Hashable | Sequence[Hashable] | None = None,
+    ) -> SeriesOrFrame:
+        """
+        Return the rows not seen before, then record the rows.
+
+        A sugary syntax wraps::
+
+            obj[~tracker.duplicated(obj, subset=subset)]
+        """
+
+        return obj[~self.duplicated(obj, subset=subset).to_numpy()]
+
+    def drop_not_duplicates(
+        self,
+        obj: SeriesOrFrame,
+        /,
+        subset: Hashable | Sequence[Hashable] | None = None,
+    ) -> SeriesOrFrame:
+        """
+        Return the rows seen before, then record the rows.
+
+        A sugary syntax wraps::
+
+            obj[tracker.duplicated(obj, subset=subset)]
+        """
+
+        return obj[self.duplicated(obj, subset=subset).to_numpy()]
+
+    def _contains(self, hashes: np.ndarray, /) -> np.ndarray:
+        found = np.zeros(hashes.size, dtype=bool)
+        for run in (*self._runs, *self._spilled):
+            if run.size == 0:
+                continue
+            pos = np.searchsorted(run, hashes)
+            np.minimum(pos, run.size - 1, out=pos)
+            found |= run[pos] == hashes
+        return found
+
+    def _add(self, hashes: np.ndarray, /) -> None:
+        if hashes.size == 0:
+            return
+
+        if (
+            self.max_memory is not None
+            and self.nbytes + hashes.nbytes > self.max_memory
+        ):
+            if self.spill_dir is None:
+                raise MemoryError(
+                    f"The hashes of seen rows exceed {self.max_memory} bytes, "
+                    "set 'spill_dir' to spill them to disk.",
+                )
+
+            self._spill(np.sort(np.concatenate((*self._runs, hashes))))
+            self._runs.clear()
+            return
+
+        # Merge the runs of similar sizes, so there are only a few runs to look up.
+        self._runs.append(hashes)
+        while len(self._runs) > 1 and self._runs[-2].size <= 2 * self._runs[-1].size:
+            last = self._runs.pop()
+            self._runs[-1] = np.sort(np.concatenate((self._runs[-1], last)))
+
+    def _spill(self, hashes: np.ndarray, /) -> None:
+        fd, path = tempfile.mkstemp(suffix=".npy", dir=self.spill_dir)
+        os.close(fd)
+        self._files.append(path)
+        np.save(path, hashes)
+        self._spilled.append(np.load(path, mmap_mode="r"))
+
+
+def row_hash(
+    obj: SeriesOrFrame,
+    /,
+    subset: Hashable | Sequence[Hashable] | None = None,
+) -> np.ndarray:
+    """Return the 64-bit hash of each row, geometries are hashed via their WKB."""
+
+    if isinstance(obj, pd.Series):
+        if subset is not None:
+            raise ValueError("'subset' only works for DataFrame.")
+        obj = _to_hashable(obj)
+    else:
+        if subset is not None:
+            obj = obj[list(subset) if is_list_like(subset) else [subset]]
+        obj = pd.DataFrame(
+            {i: _to_hashable(s) for i, (_, s) in enumerate(obj.items())},
+            index=obj.index,
+        )
+
+    return pd.util.hash_pandas_object(obj, index=False).to_numpy()
+
+
+def _to_hashable(s: pd.Series, /) -> pd.Series:
+    if getattr(s.dtype, "name", None) == "geometry":
+        import shapely
+
+        return pd.Series(shapely.to_wkb(s.to_numpy()), index=s.index, dtype=object)
+    return s
+
+
+def _remove(files: list[str], /) -> None:
+    while files:
+        path = files.pop()
+        if os.path.exists(path):
+            os.remove(path)
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import numpy as np
+import pandas as pd
+
+from dtoolkit._typing import Number
+from dtoolkit._typing import OneDimArray
+
+
+class ErrorSummary:
+    """
+    Mergeable aggregates of :meth:`~dtoolkit.accessor.series.error_report`.
+
+    Only the running sums, extremes and a sketch of the absolute errors are kept,
+    so the true and predicted values could be streamed chunk by chunk and the
+    partial states of different chunks (or workers) could be merged.
+
+    The percentiles of the absolute error are estimated via a logarithmic
+    histogram (DDSketch). The estimation of the lower nearest rank is within
+    ``accuracy`` relative error.
+
+    Parameters
+    ----------
+    percentiles : list-like of float, default (0.5, 0.9, 0.99)
+        The percentiles of the absolute error to report, all should fall between
+        0 and 1.
+
+    accuracy : float, default 0.01
+        The relative accuracy of the estimated percentiles, should fall between
+        0 and 1.
+
+    Raises
+    ------
+    ValueError
+        - If any of ``percentiles`` isn't between 0 and 1.
+        - If ``accuracy`` isn't between 0 and 1.
+
+    See Also
+    --------
+    dtoolkit.accessor.series.error_report
+
+    Examples
+    --------
+    >>> import dtoolkit
+    >>> import pandas as pd
+    >>> from dtoolkit.accessor import ErrorSummary
+    >>> summary = ErrorSummary()
+    >>> summary.update([1, 2, 3], [3, 2, 1])
+    ErrorSummary(count=3)
+    >>> summary.update([4, 5], [4, 6])
+    ErrorSummary(count=5)
+
+    Merge the partial state of another chunk.
+
+    >>> other = ErrorSummary().update([10], [15])
+    >>> summary.merge(other)
+    ErrorSummary(count=6)
+    >>> summary.to_series()
+    count    6.000000
+    mae      1.666667
+    mape     0.561111
+    rmse     2.380476
+    max      5.000000
+    50%      0.990000
+    90%      1.993662
+    99%      1.993662
+    dtype: float64
+    """
+
+    def __init__(
+        self,
+        percentiles: Iterable[float] = (0.5, 0.9, 0.99),
+        accuracy: float = 0.01,
+    ):
+        percentiles = tuple(percentiles)
+        if not all(0 <= q <= 1 for q in percentiles):
+            raise ValueError("percentiles should all be in the interval [0, 1].")
+        if not 0 < accuracy < 1:
+            raise ValueError(
+                f"accuracy should be in the interval (0, 1), got {accuracy}.",
+            )
+
+        self.percentiles = percentiles
+        self.accuracy = accuracy
+        self._gamma = (1 + accuracy) / (1 - accuracy)
+
+        self.count = 0
+        self._absolute = 0.0
+        self._squared = 0.0
+        self._relative = 0.0
+        self._relative_count = 0
+        self._max = np.nan
+        # The sketch of absolute errors: zeros, infinities and logarithmic bins.
+        self._zeros = 0
+        self._infs = 0
+        self._bins: dict[int, int] = {}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(count={self.count})"
+
+    def update(
+        self,
+        true: OneDimArray | list[Number],
+        predicted: OneDimArray | list[Number],
+        /,
+    ) -> ErrorSummary:
+        """
+        Add a chunk of true and predicted values.
+
+        Pairs containing missing values are skipped.
+
+        Parameters
+        ----------
+        true, predicted : list of int or float, ndarray, Series
+            Two arrays with the same length.
+
+        Returns
+        -------
+        ErrorSummary
+            Itself.
+
+        Raises
+        ------
+        IndexError
+            If ``len(true)`` != ``len(predicted)``.
+        """
+
+        true, predicted = _to_float(true), _to_float(predicted)
+        if len(true) != len(predicted):
+            raise IndexError(
+                "Length of 'predicted' doesn't match length of 'reference'.",
+            )
+
+        absolute, relative = errors(true, predicted)
+        valid = ~np.isnan(absolute)
+        if not valid.all():
+            absolute, relative = absolute[valid], relative[valid]
+        if absolute.size == 0:
+            return self
+
+        self.count += absolute.size
+        self._absolute += absolute.sum()
+        self._squared += np.dot(absolute, absolute)
+        defined = ~np.isnan(relative)  # 0 / 0
+        # MAPE is relative to the absolute true values.
+        self._relative += np.abs(relative[defined]).sum()
+        self._relative_count += np.count_nonzero(defined)
+        self._max = np.fmax(self._max, absolute.max())
+
+        zeros = absolute == 0
+        infs = np.isinf(absolute)
+        self._zeros += np.count_nonzero(zeros)
+        self._infs += np.count_nonzero(infs)
+        positive = absolute[~(zeros | infs)]
+        if positive.size:
+            keys = np.ceil(np.log(positive) / np.log(self._gamma)).astype(np.int64)
+            # The keys are logarithmic, so their range is small enough to count.
+            low = keys.min()
+            counts = np.bincount(keys - low)
+            for key in np.flatnonzero(counts).tolist():
+                self._bins[key + low] = self._bins.get(key + low, 0) + counts[key]
+
+        return self
+
+    def merge(self, other: ErrorSummary, /) -> ErrorSummary:
+        """
+        Merge the partial state of another summary.
+
+        Parameters
+        ----------
+        other : ErrorSummary
+
+        Returns
+        -------
+        ErrorSummary
+            Itself.
+
+        Raises
+        ------
+        ValueError
+            If the ``accuracy`` of two summaries are different.
+        """
+
+        if self.accuracy != other.accuracy:
+            raise ValueError(
+                "Only summaries with the same accuracy could be merged, "
+                f"got {self.accuracy} and {other.accuracy}.",
+            )
+
+        self.count += other.count
+        self._absolute += other._absolute
+        self._squared += other._squared
+        self._relative += other._relative
+        self._relative_count += other._relative_count
+        self._max = np.fmax(self._max, other._max)
+        self._zeros += other._zeros
+        self._infs += other._infs
+        for key, count in other._bins.items():
+            self._bins[key] = self._bins.get(key, 0) + count
+
+        return self
+
+    def quantile(self, q: float, /) -> float:
+        """Estimate the ``q`` quantile of the absolute error."""
+
+        if self.count == 0:
+            return np.nan
+
+        rank = q * (self.count - 1)
+        seen = self._zeros
+        if rank < seen:
+            return 0.0
+        for key in sorted(self._bins):
+            seen += self._bins[key]
+            if rank < seen:
+                return 2 * self._gamma**key / (self._gamma + 1)
+        return np.inf
+
+    def to_series(self) -> pd.Series:
+        """
+        Return the aggregates.
+
+        Returns
+        -------
+        Series
+            - count : The number of pairs without missing values.
+            - mae : Mean absolute error.
+            - mape : Mean relative error to the absolute true values, skips
+              ``0 / 0``.
+            - rmse : Root mean squared error.
+            - max : Max absolute error.
+            - percentiles : The estimated percentiles of the absolute error.
+        """
+
+        count = self.count or np.nan
+        return pd.Series(
+            [
+                self.count,
+                self._absolute / count,
+                self._relative / (self._relative_count or np.nan),
+                np.sqrt(self._squared / count),
+                self._max,
+                *map(self.quantile, self.percentiles),
+            ],
+            index=[
+                "count",
+                "mae",
+                "mape",
+                "rmse",
+                "max",
+                *percentile_labels(self.percentiles),
+            ],
+            dtype=float,
+        )
+
+
+def errors(
+    true: np.ndarray,
+    predicted: np.ndarray,
+    /,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate absolute error and relative error of two arrays in one pass.
+
+    The absolute error is computed in place of the difference buffer.
+    """
+
+    absolute = np.subtract(predicted, true)
+    np.abs(absolute, out=absolute)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        relative = np.true_divide(absolute, true)
+    return absolute, relative
+
+
+def percentile_labels(percentiles: tuple[float, ...], /) -> list[str]:
+    """
+    Format the percentiles like ``'99.5%'``, with enough significant digits to
+    keep the different percentiles unique.
+    """
+
+    unique = len(set(percentiles))
+    for digits in range(3, 18):
+        labels = [f"{q * 100:.{digits}g}%" for q in percentiles]
+        if len(set(labels)) == unique:
+            break
+    return labels
+
+
+def _to_float(values: OneDimArray | list[Number], /) -> np.ndarray:
+    if isinstance(values, (pd.Series, pd.Index)):
+        return values.to_numpy(dtype=float, na_value=np.nan)
+    return np.asarray(values, dtype=float)
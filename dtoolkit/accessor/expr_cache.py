@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from time import perf_counter
+from typing import Callable
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+# The compiler relies on the private parser of 'pandas.eval', if pandas moves it,
+# all expressions fall back to 'pandas.eval' rather than failing.
+try:
+    import pandas.core.common as com
+    from pandas.core.computation.align import align_terms
+    from pandas.core.computation.check import NUMEXPR_INSTALLED
+    from pandas.core.computation.expr import Expr
+    from pandas.core.computation.ops import Term
+    from pandas.core.computation.scope import ensure_scope
+    from pandas.io.formats import printing
+except ImportError:
+    PANDAS_INTERNALS = False
+else:
+    PANDAS_INTERNALS = all(
+        hasattr(pd.Series, name)
+        for name in ("_get_cleaned_column_resolvers", "_get_index_resolvers")
+    )
+
+# The functions supported by 'numexpr', they are also numpy functions.
+MATH_FUNCS = {
+    name: getattr(np, name)
+    for name in (
+        "sin",
+        "cos",
+        "tan",
+        "exp",
+        "log",
+        "expm1",
+        "log1p",
+        "sqrt",
+        "sinh",
+        "cosh",
+        "tanh",
+        "arcsin",
+        "arccos",
+        "arctan",
+        "arccosh",
+        "arcsinh",
+        "arctanh",
+        "abs",
+        "arctan2",
+        "log10",
+    )
+}
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    parse_time: float
+    eval_time: float
+
+
+class _Compiled(NamedTuple):
+    """A compiled expression, only binds data when evaluating."""
+
+    source: str
+    code: object
+    # The value getter of each name used in the expression.
+    names: dict[str, Callable[[pd.Series], np.ndarray]]
+    name: object
+    dtype: np.dtype
+
+
+class ExprCache:
+    """
+    The cache of compiled expressions of :meth:`~dtoolkit.accessor.series.eval`
+    and :meth:`~dtoolkit.accessor.series.query`.
+
+    An expression is parsed by pandas once and compiled to a program, keyed by the
+    expression string and the resolver layout (the name and dtype of the Series
+    and its index levels). Then following calls only bind the data of the chunk and
+    run the program, the resolvers and the parse tree are not rebuilt.
+
+    The program is run via ``numexpr`` if it is installed, otherwise via numpy.
+    Only expressions which pandas would evaluate on numeric or boolean arrays are
+    cached, such as arithmetic, comparison, boolean and math function operations.
+    Others (string operations, ``in``, local ``@`` variables, assignments, ...)
+    fall back to :func:`pandas.eval`.
+
+    Parameters
+    ----------
+    maxsize : int, default 1024
+        The max number of compiled expressions to keep, the least recently used
+        are discarded first.
+
+    See Also
+    --------
+    dtoolkit.accessor.series.eval
+    dtoolkit.accessor.series.query
+
+    Examples
+    --------
+    >>> import dtoolkit
+    >>> import pandas as pd
+    >>> from dtoolkit.accessor import expr_cache
+    >>> expr_cache.clear()
+    >>> s = pd.Series([1, 2, 3], name="col")
+    >>> for chunk in (s, s + 1, s + 2):
+    ...     _ = chunk.eval("col > 2 and col < 5")
+    >>> info = expr_cache.info()
+    >>> info.hits, info.misses, info.currsize
+    (2, 1, 1)
+
+    ``parse_time`` and ``eval_time`` are the total seconds spent on parsing
+    expressions and evaluating compiled programs.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.clear()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(maxsize={self.maxsize})"
+
+    def clear(self) -> None:
+        """Discard all compiled expressions and reset the statistics."""
+
+        with self._lock:
+            self._cache.clear()
+            self._hits = self._misses = 0
+            self._parse_time = self._eval_time = 0.0
+
+    def info(self) -> CacheInfo:
+        """
+        Report the statistics of the cache.
+
+        Returns
+        -------
+        CacheInfo
+            A named tuple of ``hits``, ``misses``, ``maxsize``, ``currsize``,
+            ``parse_time`` and ``eval_time``. Only the calls run via a compiled
+            program are hits, the calls falling back to :func:`pandas.eval` are
+            misses.
+        """
+
+        return CacheInfo(
+            self._hits,
+            self._misses,
+            self.maxsize,
+            len(self._cache),
+            self._parse_time,
+            self._eval_time,
+        )
+
+    def eval(
+        self,
+        s: pd.Series,
+        /,
+        expr: str,
+        parser: str = "pandas",
+        engine: str | None = None,
+    ) -> pd.Series | None:
+        """
+        Evaluate ``expr`` on ``s`` via the compiled program.
+
+        Returns
+        -------
+        Series or None
+            None if ``expr`` can't be compiled.
+        """
+
+        if not PANDAS_INTERNALS:
+            return None
+
+        use_numexpr = NUMEXPR_INSTALLED and engine != "python"
+        key = (expr, parser, use_numexpr, *_layout(s))
+
+        with self._lock:
+            found = key in self._cache
+            if found:
+                self._cache.move_to_end(key)
+                compiled = self._cache[key]
+                # The expression which can't be compiled falls back, not a hit.
+                if compiled is None:
+                    self._misses += 1
+                else:
+                    self._hits += 1
+
+        if not found:
+            start = perf_counter()
+            compiled = _compile(s, expr, parser=parser, use_numexpr=use_numexpr)
+            with self._lock:
+                self._misses += 1
+                self._parse_time += perf_counter() - start
+                self._cache[key] = compiled
+                if len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+
+        if compiled is None:
+            return None
+
+        start = perf_counter()
+        result = _evaluate(compiled, s)
+        with self._lock:
+            self._eval_time += perf_counter() - start
+        return result
+
+
+# The default cache used by 'Series.eval' and 'Series.query'.
+expr_cache = ExprCache()
+
+
+def _layout(s: pd.Series, /) -> tuple:
+    """The resolver layout decides the names and types of the parse tree."""
+
+    index = s.index
+    return (
+        s.name,
+        s.dtype,
+        type(index),
+        tuple(index.names),
+        tuple(index.dtypes) if isinstance(index, pd.MultiIndex) else (index.dtype,),
+    )
+
+
+def _compile(
+    s: pd.Series,
+    /,
+    expr: str,
+    parser: str,
+    use_numexpr: bool,
+) -> _Compiled | None:
+    if not isinstance(expr, str) or "@" in expr or len(expr.strip().splitlines()) != 1:
+        return None
+
+    column_resolvers = s._get_cleaned_column_resolvers()
+    index_resolvers = s._get_index_resolvers()
+    # The column resolvers are prior to the index resolvers.
+    getters = {
+        key: _index if key == "index" else _level(i)
+        for i, key in enumerate(index_resolvers)
+    }
+    getters |= {key: _values for key in column_resolvers}
+
+    # Empty globals and locals, only the resolvers are allowed.
+    env = ensure_scope(
+        0,
+        global_dict={},
+        local_dict={},
+        resolvers=(column_resolvers, index_resolvers),
+        target=s,
+    )
+    try:
+        parsed = Expr(expr, engine="numexpr", parser=parser, env=env)
+        typ, _, name = align_terms(parsed.terms)
+        dtype = np.dtype(parsed.terms.return_type)
+    except Exception:
+        return None
+
+    if isinstance(parsed.terms, Term):
+        terms = [parsed.terms]
+    else:
+        terms = list(com.flatten(parsed.terms))
+    names = {t.name for t in terms if isinstance(t.name, str)}
+    if (
+        env.temps
+        or parsed.assigner is not None
+        or typ is not pd.Series
+        or not names.issubset(getters)
+        or not names.isdisjoint(MATH_FUNCS)
+        or not all(
+            isinstance(t.value.dtype, np.dtype) and t.value.dtype.kind in "biuf"
+            for t in terms
+            if isinstance(t.name, str)
+        )
+    ):
+        return None
+
+    source = printing.pprint_thing(parsed)
+    compiled = _Compiled(
+        source=source,
+        code=None if use_numexpr else compile(source, "<expr>", "eval"),
+        names={key: getters[key] for key in names},
+        name=name,
+        dtype=dtype,
+    )
+    try:
+        # Make sure the compiled program is runnable.
+        _evaluate(compiled, s)
+    except Exception:
+        return None
+    return compiled
+
+
+def _evaluate(compiled: _Compiled, s: pd.Series, /) -> pd.Series:
+    scope = {key: getter(s) for key, getter in compiled.names.items()}
+    if compiled.code is None:
+        import numexpr as ne
+
+        values = ne.evaluate(compiled.source, local_dict=scope)
+        # Like pandas, only the result of 'numexpr' is cast to the return type.
+        values = values.astype(np.result_type(values.dtype, compiled.dtype))
+    else:
+        with np.errstate(all="ignore"):
+            values = eval(compiled.code, {"__builtins__": {}, **MATH_FUNCS}, scope)
+
+    return pd.Series(np.asarray(values), index=s.index, name=compiled.name)
+
+
+def _values(s: pd.Series, /) -> np.ndarray:
+    return s.to_numpy()
+
+
+def _index(s: pd.Series, /) -> np.ndarray:
+    return s.index.to_numpy()
+
+
+def _level(i: int, /) -> Callable[[pd.Series], np.ndarray]:
+    def getter(s: pd.Series, /) -> np.ndarray:
+        return s.index.get_level_values(i).to_numpy()
+
+    return getter
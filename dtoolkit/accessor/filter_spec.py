@@ -0,0 +1,215 @@
+from collections.abc import Hashable
+from typing import Iterable
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_list_like
+
+# The max size of lookup table (16 MB) for integer condition.
+TABLE_MAX_SIZE = 2**24
+
+
+class FilterSpec:
+    """
+    Compiled reusable ``condition`` of :meth:`~dtoolkit.accessor.series.filter_in`
+    and :meth:`~dtoolkit.accessor.dataframe.filter_in`.
+
+    The condition values are deduplicated and factorized once, then could be
+    applied to many chunks without rebuilding hash tables on every call.
+
+    * Categorical column: only its categories are looked up, then rows are
+      mapped via categorical codes.
+    * Integer column with dense integer condition: looked up via a boolean table
+      indexed by the values.
+    * Float, object or string column: looked up via the cached hash table of
+      :class:`~pandas.Index`.
+    * Other dtypes: fall back to :meth:`~pandas.Series.isin`.
+
+    Parameters
+    ----------
+    condition : list-like or dict
+        * If ``condition`` is a list-like, all columns are checked via it.
+        * If ``condition`` is a :obj:`dict`, the keys must be the column names and
+          the values are list-like condition of each column.
+
+    Raises
+    ------
+    TypeError
+        If ``condition`` or any value of ``condition`` is not list-like.
+
+    See Also
+    --------
+    dtoolkit.accessor.series.filter_in
+    dtoolkit.accessor.dataframe.filter_in
+
+    Examples
+    --------
+    >>> import dtoolkit
+    >>> import pandas as pd
+    >>> from dtoolkit.accessor import FilterSpec
+    >>> spec = FilterSpec({"legs": [2, 4], "wings": [2]})
+    >>> spec
+    FilterSpec(columns=['legs', 'wings'])
+    >>> df = pd.DataFrame(
+    ...     {'legs': [2, 4, 2], 'wings': [2, 0, 0]},
+    ...     index=['falcon', 'dog', 'cat'],
+    ... )
+    >>> df.filter_in(spec)
+            legs  wings
+    falcon     2      2
+    >>> df.filter_in(spec, how="any")
+            legs  wings
+    falcon     2      2
+    dog        4      0
+    cat        2      0
+
+    Reuse the same spec for another chunk.
+
+    >>> df.iloc[1:].filter_in(spec, how="any", complement=True)
+         legs  wings
+    dog     4      0
+    cat     2      0
+    """
+
+    def __init__(self, condition: Iterable | dict[Hashable, Iterable], /):
+        if isinstance(condition, dict):
+            self.columns = list(condition.keys())
+            self._values = {k: _Values(v) for k, v in condition.items()}
+        else:
+            self.columns = None
+            self._values = _Values(condition)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(columns={self.columns!r})"
+
+    def isin(self, s: pd.Series, /, key: Hashable = None) -> np.ndarray:
+        """
+        Whether each element in the Series is contained in the condition.
+
+        Parameters
+        ----------
+        s : Series
+
+        key : Hashable, optional
+            The column name to choose the condition, only works when the
+            ``condition`` is a :obj:`dict`.
+
+        Returns
+        -------
+        ndarray(bool)
+        """
+
+        if self.columns is None:
+            return self._values.isin(s)
+        return self._values[key].isin(s)
+
+    def mask(
+        self,
+        df: pd.DataFrame,
+        /,
+        how: Literal["any", "all"] = "all",
+        complement: bool = False,
+    ) -> np.ndarray:
+        """
+        Reduce the condition of each column to a row mask.
+
+        Columns are evaluated one by one. Rows already decided (``False`` for
+        'all', ``True`` for 'any') are skipped in the following columns.
+
+        Parameters
+        ----------
+        how : {'any', 'all'}, default 'all'
+            Determine whether the row is kept, when there have at least one value
+            or all value.
+
+        complement : bool, default is False
+            If True, check the complement of the condition of each value.
+
+        Returns
+        -------
+        ndarray(bool)
+
+        Raises
+        ------
+        ValueError
+            If ``how`` isn't "any" or "all".
+
+        KeyError
+            If the keys of ``condition`` aren't in the DataFrame.
+        """
+
+        if how not in {"any", "all"}:
+            raise ValueError(f"invalid how option: {how!r}")
+
+        if self.columns is not None:
+            df = df[self.columns]
+
+        # For 'all', undecided rows are still True.
+        # For 'any', undecided rows are still False.
+        decided = how == "any"
+        mask = np.full(len(df), not decided, dtype=bool)
+        for i, key in enumerate(df.columns):
+            undecided = np.flatnonzero(mask != decided)
+            if undecided.size == 0:
+                break
+
+            s = df.iloc[:, i]
+            if undecided.size < len(df):
+                s = s.take(undecided)
+            mask[undecided] = self.isin(s, key=key) != complement
+
+        return mask
+
+
+class _Values:
+    """Compiled condition values of a single column"""
+
+    def __init__(self, values: Iterable, /):
+        if not is_list_like(values):
+            raise TypeError(
+                "only list-like objects are allowed to be passed to filter_in(), "
+                f"you passed a {type(values).__name__!r}",
+            )
+
+        self.index = pd.Index(values, tupleize_cols=False).unique()
+
+        # Dense integer condition is compiled to a lookup table. The head and tail
+        # of the table are padded with False for values out of the range.
+        self.table = None
+        if (
+            len(self.index) > 0
+            and self.index.dtype.kind in "iu"
+            and np.can_cast(self.index.dtype, np.int64)
+        ):
+            values = self.index.to_numpy(dtype=np.int64)
+            self.low, high = values.min(), values.max()
+            if high - self.low <= TABLE_MAX_SIZE and abs(self.low) <= 2**62:
+                self.table = np.zeros(high - self.low + 3, dtype=bool)
+                self.table[values - self.low + 1] = True
+
+    def isin(self, s: pd.Series, /) -> np.ndarray:
+        dtype = s.dtype
+
+        if isinstance(dtype, pd.CategoricalDtype):
+            # Only look up categories, code -1 (missing value) maps to the last.
+            found = np.append(s.cat.categories.isin(self.index), self.index.hasnans)
+            return found[s.cat.codes.to_numpy()]
+        elif (
+            self.table is not None
+            and isinstance(dtype, np.dtype)
+            and dtype.kind in "iu"
+            and np.can_cast(dtype, np.int64)
+        ):
+            pos = s.to_numpy(dtype=np.int64, copy=True)
+            pos -= self.low - 1
+            np.clip(pos, 0, len(self.table) - 1, out=pos)
+            return self.table[pos]
+        elif self.index.dtype.kind != "b" and (
+            isinstance(dtype, pd.StringDtype)
+            or (isinstance(dtype, np.dtype) and dtype.kind in "fO")
+        ):
+            # 'Index.get_indexer' reuses the hash table cached on 'Index'.
+            return self.index.get_indexer(s) != -1
+
+        return s.isin(self.index).to_numpy(dtype=bool)
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import reprlib
+from typing import Callable
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+from pandas.core.indexing import check_bool_indexer
+
+from dtoolkit._typing import SeriesOrFrame
+
+
+class RowFilter(NamedTuple):
+    # Return the row mask to keep, or None if the call can't be fused.
+    mask: Callable[..., np.ndarray | pd.Series | None]
+    # Whether the mask of each row only depends on the row itself. If False, the
+    # mask is computed on the remaining rows only, such as finding duplicates.
+    rowwise: bool
+
+
+# The row filtering methods which could be fused, keyed by (class, name).
+ROW_FILTERS: dict[tuple[type, str], RowFilter] = {}
+
+
+def register_row_filter(klass: type, name: str, /, rowwise: bool = True):
+    """
+    Register the row mask of a row filtering method, so its calls could be fused
+    into one mask by :class:`Lazy`.
+
+    The mask function receives the object and the arguments of the method call,
+    and returns the boolean mask of the rows to keep (or None if the call can't be
+    fused).
+
+    Parameters
+    ----------
+    klass : type
+        The class of the method, subclasses also use it.
+
+    name : str
+        The name of the method.
+
+    rowwise : bool, default True
+        Whether the mask of each row only depends on the row itself. If False, the
+        mask is computed on the remaining rows only.
+    """
+
+    def decorator(mask: Callable, /) -> Callable:
+        ROW_FILTERS[klass, name] = RowFilter(mask, rowwise)
+        return mask
+
+    return decorator
+
+
+def get_row_filter(obj: SeriesOrFrame, name: str, /) -> RowFilter | None:
+    for klass in type(obj).__mro__:
+        if (klass, name) in ROW_FILTERS:
+            return ROW_FILTERS[klass, name]
+    return None
+
+
+class Step(NamedTuple):
+    name: str
+    args: tuple
+    kwargs: dict
+
+    def __repr__(self) -> str:
+        arguments = [*map(reprlib.repr, self.args)]
+        arguments += [f"{k}={reprlib.repr(v)}" for k, v in self.kwargs.items()]
+        return f"{self.name}({', '.join(arguments)})"
+
+
+class Lazy:
+    """
+    Record the chained method calls as a plan, and run the plan when collecting.
+
+    Consecutive row filtering calls (such as ``drop_inf``, ``filter_in``,
+    ``dropna_index``, ``drop_not_duplicates``, ``select_geom_type`` and
+    ``filter_geometry``) are fused: their masks are combined into one and the rows
+    are taken once, rather than materializing an intermediate object after each
+    call. Other calls run as they are.
+
+    Parameters
+    ----------
+    obj : Series or DataFrame
+
+    See Also
+    --------
+    dtoolkit.accessor.series.lazy
+    dtoolkit.accessor.dataframe.lazy
+
+    Examples
+    --------
+    >>> import dtoolkit
+    >>> import numpy as np
+    >>> import pandas as pd
+    >>> df = pd.DataFrame(
+    ...     {
+    ...         'a': [1, 2, np.inf, 4, 5],
+    ...         'b': [5, 4, 3, 2, 1],
+    ...     },
+    ...     index=['x', None, 'y', 'z', 'w'],
+    ... )
+    >>> plan = (
+    ...     df.lazy()
+    ...     .drop_inf()
+    ...     .filter_in({'b': [1, 2, 4, 5]})
+    ...     .dropna_index()
+    ...     .top_n(1)
+    ... )
+    >>> print(plan.explain())
+    Lazy DataFrame plan:
+      0. fused mask, take once
+         drop_inf()
+         filter_in({'b': [1, 2, 4, 5]})
+         dropna_index()
+      1. top_n(1)
+    >>> plan.collect()
+      top_1
+    x     b
+    z     a
+    w     a
+    """
+
+    def __init__(self, obj: SeriesOrFrame, /, steps: tuple[Step, ...] = ()):
+        self._obj = obj
+        self._steps = steps
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({type(self._obj).__name__}, steps={len(self)})"
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def __getattr__(self, name: str) -> Callable[..., Lazy]:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def record(*args, **kwargs) -> Lazy:
+            return type(self)(self._obj, (*self._steps, Step(name, args, kwargs)))
+
+        return record
+
+    def explain(self) -> str:
+        """
+        Return the plan, showing which calls are fused.
+
+        Returns
+        -------
+        str
+        """
+
+        lines = [f"{type(self).__name__} {type(self._obj).__name__} plan:"]
+        for i, steps in enumerate(self._stages()):
+            if isinstance(steps, list):
+                lines.append(f"  {i}. fused mask, take once")
+                lines.extend(f"     {step!r}" for step in steps)
+            else:
+                lines.append(f"  {i}. {steps!r}")
+        return "\n".join(lines)
+
+    def collect(self):
+        """
+        Run the plan.
+
+        Returns
+        -------
+        Series, DataFrame or object
+            The result of the last call.
+        """
+
+        obj = self._obj
+        for steps in self._stages():
+            if isinstance(steps, list):
+                obj = fuse(obj, steps)
+            else:
+                obj = call(obj, steps)
+        return obj
+
+    def _stages(self) -> list[list[Step] | Step]:
+        """Group the consecutive row filtering calls."""
+
+        stages = []
+        for step in self._steps:
+            if get_row_filter(self._obj, step.name) is None:
+                stages.append(step)
+            elif stages and isinstance(stages[-1], list):
+                stages[-1].append(step)
+            else:
+                stages.append([step])
+        return stages
+
+
+def call(obj, step: Step, /):
+    return getattr(obj, step.name)(*step.args, **step.kwargs)
+
+
+def fuse(obj: SeriesOrFrame, steps: list[Step], /):
+    """Combine the masks of the row filtering calls, then take the rows once."""
+
+    keep = np.ones(len(obj), dtype=bool)
+    for i, step in enumerate(steps):
+        if (row_filter := get_row_filter(obj, step.name)) is not None:
+            if row_filter.rowwise or keep.all():
+                rows, target = slice(None), obj
+            else:
+                rows = np.flatnonzero(keep)
+                target = obj.take(rows)
+
+            mask = row_filter.mask(target, *step.args, **step.kwargs)
+            if mask is not None:
+                # Align the mask like boolean indexing does.
+                keep[rows] &= check_bool_indexer(target.index, mask)
+                continue
+
+        # The call can't be fused, take the rows so far and run it as it is.
+        return fuse(call(take(obj, keep), step), steps[i + 1 :])
+
+    return take(obj, keep)
+
+
+def take(obj: SeriesOrFrame, keep: np.ndarray, /) -> SeriesOrFrame:
+    return obj if keep.all() else obj.take(np.flatnonzero(keep))
@@ -1,6 +1,7 @@
 from dtoolkit.accessor.series.bin import bin  # noqa: F401
 from dtoolkit.accessor.series.change_axis_type import change_axis_type  # noqa: F401
 from dtoolkit.accessor.series.cols import cols  # noqa: F401
+from dtoolkit.accessor.series.compact import compact  # noqa: F401
 from dtoolkit.accessor.series.drop_inf import drop_inf  # noqa: F401
 from dtoolkit.accessor.series.drop_not_duplicates import (  # noqa: F401
     drop_not_duplicates,
@@ -13,9 +14,11 @@ from dtoolkit.accessor.series.expand import expand  # noqa: F401
 from dtoolkit.accessor.series.filter_in import filter_in  # noqa: F401
 from dtoolkit.accessor.series.getattr import getattr  # noqa: F401
 from dtoolkit.accessor.series.groupby_index import groupby_index  # noqa: F401
+from dtoolkit.accessor.series.has_inf import has_inf  # noqa: F401
 from dtoolkit.accessor.series.invert_or_not import invert_or_not  # noqa: F401
 from dtoolkit.accessor.series.jenks_bin import jenks_bin  # noqa: F401
 from dtoolkit.accessor.series.jenks_breaks import jenks_breaks  # noqa: F401
+from dtoolkit.accessor.series.lazy import lazy  # noqa: F401
 from dtoolkit.accessor.series.len import len  # noqa: F401
 from dtoolkit.accessor.series.query import query  # noqa: F401
 from dtoolkit.accessor.series.set_unique_index import set_unique_index  # noqa: F401
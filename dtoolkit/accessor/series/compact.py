@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import infer_dtype
+from pandas.api.types import is_bool_dtype
+from pandas.api.types import is_float_dtype
+from pandas.api.types import is_integer_dtype
+from pandas.api.types import is_object_dtype
+from pandas.api.types import is_string_dtype
+from pandas.api.types import pandas_dtype
+
+from dtoolkit._typing import Dtype
+from dtoolkit.accessor.register import register_series_method
+
+
+REPORT = ["dtype_before", "dtype_after", "bytes_before", "bytes_after"]
+
+
+@register_series_method
+def compact(
+    s: pd.Series,
+    /,
+    category_ratio: float = 0.5,
+    plan: Dtype = None,
+    dry_run: bool = False,
+    report: bool = False,
+) -> pd.Series | Dtype | tuple[pd.Series, pd.Series]:
+    """
+    Shrink the memory of the Series via downcasting its dtype.
+
+    - Integer and float are downcast to the smallest width holding the values, see
+      :func:`pandas.to_numeric` with ``downcast``. Float is only downcast if all
+      values are kept exactly.
+    - Object of booleans is converted to ``bool``, or ``boolean`` if there are
+      missing values.
+    - Object or string with low cardinality is converted to ``category``, if it
+      takes less memory.
+    - Others are kept.
+
+    Parameters
+    ----------
+    category_ratio : float, default 0.5
+        Object or string is converted to ``category`` if the number of distinct
+        values is at most ``category_ratio`` of its length. Should fall between
+        0 and 1.
+
+    plan : dtype, optional
+        The dtype to convert to, such as the one returned via ``dry_run=True``.
+        If None, the compact dtype is inferred from the values.
+
+    dry_run : bool, default False
+        If True, only return the compact dtype rather than converting. So it could
+        be passed to ``plan`` of the following chunks to keep the same dtype.
+
+    report : bool, default False
+        If True, return the report of the dtype and bytes before and after as well.
+
+    Returns
+    -------
+    Series, dtype or tuple of (Series, Series)
+        The compact dtype is returned if ``dry_run=True``. The report is returned
+        only if ``report=True``.
+
+    Raises
+    ------
+    ValueError
+        - If ``category_ratio`` isn't between 0 and 1.
+        - If the values don't fit in ``plan``, such as integers out of bounds,
+          floats truncated or losing precision, categories missing or booleans
+          with missing values.
+
+    See Also
+    --------
+    pandas.to_numeric
+    pandas.Series.astype
+    pandas.Series.memory_usage
+    dtoolkit.accessor.dataframe.compact
+
+    Examples
+    --------
+    >>> import dtoolkit
+    >>> import pandas as pd
+    >>> s = pd.Series([1, 2, 300])
+    >>> s
+    0      1
+    1      2
+    2    300
+    dtype: int64
+    >>> s.compact()
+    0      1
+    1      2
+    2    300
+    dtype: int16
+
+    Low cardinality strings are converted to categories.
+
+    >>> pd.Series(['a', 'b', 'a', 'a'] * 25).compact().dtype
+    CategoricalDtype(categories=['a', 'b'], ordered=False, categories_dtype=str)
+
+    Report the dtype and bytes before and after.
+
+    >>> _, report = s.compact(report=True)
+    >>> report
+    dtype_before    int64
+    dtype_after     int16
+    bytes_before       24
+    bytes_after         6
+    dtype: object
+
+    Infer the dtype from the first chunk, then apply it to the following chunks.
+
+    >>> dtype = s.compact(dry_run=True)
+    >>> dtype
+    dtype('int16')
+    >>> pd.Series([4, 5, 6]).compact(plan=dtype)
+    0    4
+    1    5
+    2    6
+    dtype: int16
+    """
+
+    check_category_ratio(category_ratio)
+
+    dtype = compact_dtype(s, category_ratio) if plan is None else pandas_dtype(plan)
+    if dry_run:
+        return dtype
+
+    result = convert(s, dtype)
+    if report:
+        return result, pd.Series(get_report(s, result), index=REPORT, dtype=object)
+    return result
+
+
+def check_category_ratio(category_ratio: float, /) -> None:
+    if not 0 <= category_ratio <= 1:
+        raise ValueError(
+            "'category_ratio' should be in the interval [0, 1], "
+            f"got {category_ratio!r}.",
+        )
+
+
+def compact_dtype(s: pd.Series, /, category_ratio: float) -> Dtype:
+    """Infer the compact dtype of ``s``."""
+
+    dtype = s.dtype
+    if is_bool_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype):
+        return dtype
+
+    if is_integer_dtype(dtype) or is_float_dtype(dtype):
+        compact = numeric_dtype(s)
+        return compact if compact.itemsize < dtype.itemsize else dtype
+
+    if not (is_object_dtype(dtype) or is_string_dtype(dtype)):
+        return dtype
+
+    values = s.dropna()
+    if is_object_dtype(dtype) and infer_dtype(values, skipna=False) == "boolean":
+        return pd.BooleanDtype() if len(values) < len(s) else np.dtype(bool)
+
+    uniques = values.unique()
+    if len(s) and len(uniques) <= category_ratio * len(s):
+        categories = pd.Index(uniques)
+        try:
+            categories = categories.sort_values()
+        except TypeError:  # unorderable values
+            pass
+        category = pd.CategoricalDtype(categories)
+        # Such as Arrow strings, which are already compact.
+        if nbytes(s.astype(category)) < nbytes(s):
+            return category
+
+    return dtype
+
+
+def nbytes(s: pd.Series, /) -> int:
+    return s.memory_usage(index=False, deep=True)
+
+
+def numeric_dtype(s: pd.Series, /) -> Dtype:
+    """The smallest numeric dtype of the same kind holding the values."""
+
+    if is_float_dtype(s.dtype):
+        downcast = "float"
+    elif s.dtype.kind == "u":
+        downcast = "unsigned"
+    else:
+        downcast = "integer"
+
+    dtype = pd.to_numeric(s, downcast=downcast).dtype
+    # Downcasting floats rounds the values rather than checking they fit.
+    return dtype if downcast != "float" or fits(s, dtype) else s.dtype
+
+
+def fits(s: pd.Series, dtype: Dtype, /) -> bool:
+    """Whether the numeric values of ``s`` round-trip through ``dtype``."""
+
+    values = s.dropna()
+    if (
+        len(values) < len(s)
+        and isinstance(dtype, np.dtype)
+        and not is_float_dtype(dtype)
+    ):
+        return False  # NumPy integers can't hold missing values.
+
+    with np.errstate(all="ignore"):
+        try:
+            converted = values.astype(dtype)
+        except (ValueError, OverflowError, TypeError):
+            return False
+        return bool((converted.astype(values.dtype) == values).all())
+
+
+def convert(s: pd.Series, dtype: Dtype, /) -> pd.Series:
+    """Convert ``s`` to ``dtype``, checking the values fit in."""
+
+    if dtype == s.dtype:
+        return s
+
+    if isinstance(dtype, pd.CategoricalDtype):
+        if (
+            dtype.categories is not None
+            and (unknown := s.notna() & ~s.isin(dtype.categories)).any()
+        ):
+            raise ValueError(
+                f"The values of {s.name!r} are not in the categories, "
+                f"such as {s[unknown].iloc[0]!r}.",
+            )
+    elif isinstance(dtype, np.dtype) and dtype.kind == "b":
+        if s.hasnans:
+            raise ValueError(
+                f"{s.name!r} has missing values, use 'boolean' dtype instead.",
+            )
+    elif is_numeric(dtype) and is_numeric(s.dtype):
+        # Such as integers out of bounds, floats truncated to integers or rounded.
+        if not fits(s, dtype):
+            raise ValueError(f"The values of {s.name!r} don't fit in {dtype}.")
+
+    return s.astype(dtype)
+
+
+def is_numeric(dtype: Dtype, /) -> bool:
+    return is_integer_dtype(dtype) or is_float_dtype(dtype)
+
+
+def get_report(before: pd.Series, after: pd.Series, /) -> list:
+    return [
+        before.dtype,
+        after.dtype,
+        before.memory_usage(index=False, deep=True),
+        after.memory_usage(index=False, deep=True),
+    ]
@@ -3,7 +3,9 @@ from typing import Literal
 import numpy as np
 import pandas as pd
 
+from dtoolkit.accessor.lazy import register_row_filter
 from dtoolkit.accessor.register import register_series_method
+from dtoolkit.accessor.series.has_inf import isinf
 
 
 @register_series_method
@@ -35,6 +37,8 @@ def drop_inf(
 
     See Also
     --------
+    dtoolkit.accessor.series.has_inf
+        Detect ``inf`` values.
     dtoolkit.accessor.dataframe.drop_inf
         :obj:`~pandas.DataFrame` drops rows or columns which contain ``inf``
         values.
@@ -59,20 +63,13 @@ def drop_inf(
     dtype: float64
     """
 
-    return s[~s.isin(get_inf_range(inf))]
+    return s[drop_inf_mask(s, inf=inf)]
 
 
-def get_inf_range(inf: Literal["all", "pos", "+", "neg", "-"] = "all") -> set[float]:
-    """Get inf value from string"""
-
-    INF_RANGE = {
-        "all": {np.inf, -np.inf},
-        "pos": {np.inf},
-        "+": {np.inf},
-        "neg": {-np.inf},
-        "-": {-np.inf},
-    }
-    try:
-        return INF_RANGE[inf]
-    except KeyError as e:
-        raise ValueError(f"invalid inf option: {inf!r}") from e
+@register_row_filter(pd.Series, "drop_inf")
+def drop_inf_mask(
+    s: pd.Series,
+    /,
+    inf: Literal["all", "pos", "+", "neg", "-"] = "all",
+) -> np.ndarray:
+    return ~isinf(s, inf=inf)
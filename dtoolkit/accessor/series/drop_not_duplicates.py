@@ -2,6 +2,8 @@ from typing import Literal
 
 import pandas as pd
 
+from dtoolkit.accessor.duplicate_tracker import DuplicateTracker
+from dtoolkit.accessor.lazy import register_row_filter
 from dtoolkit.accessor.register import register_series_method
 
 
@@ -10,6 +12,7 @@ def drop_not_duplicates(
     s: pd.Series,
     /,
     keep: Literal["first", "last", False] = False,
+    tracker: DuplicateTracker = None,
 ) -> pd.Series:
     """
     Return duplicate Series values.
@@ -27,15 +30,25 @@ def drop_not_duplicates(
         - 'last' : Keep duplicates except for the last occurrence.
         - ``False`` : Keep all duplicates.
 
+    tracker : DuplicateTracker, optional
+        Track the values across chunks of a stream, a value is a duplicate if it is
+        in the previous chunks. Only works with ``keep='first'``.
+
     Returns
     -------
     Series
         Kept duplicate values.
 
+    Raises
+    ------
+    ValueError
+        If ``tracker`` is given and ``keep`` isn't 'first'.
+
     See Also
     --------
     pandas.Series.duplicated
     pandas.Series.drop_duplicates
+    dtoolkit.accessor.DuplicateTracker
     dtoolkit.accessor.dataframe.drop_not_duplicates
 
     Examples
@@ -55,6 +68,32 @@ def drop_not_duplicates(
     2      llama
     4      llama
     dtype: str
+
+    Find the duplicates across chunks.
+
+    >>> from dtoolkit.accessor import DuplicateTracker
+    >>> tracker = DuplicateTracker()
+    >>> animals[:2].drop_not_duplicates(keep='first', tracker=tracker)
+    Series([], dtype: str)
+    >>> animals[2:].drop_not_duplicates(keep='first', tracker=tracker)
+    2    llama
+    4    llama
+    dtype: str
     """
 
-    return s[s.duplicated(keep=keep)]
+    return s[drop_not_duplicates_mask(s, keep=keep, tracker=tracker).to_numpy()]
+
+
+@register_row_filter(pd.Series, "drop_not_duplicates", rowwise=False)
+def drop_not_duplicates_mask(
+    s: pd.Series,
+    /,
+    keep: Literal["first", "last", False] = False,
+    tracker: DuplicateTracker = None,
+) -> pd.Series:
+    if tracker is not None:
+        if keep != "first":
+            raise ValueError(f"'tracker' only works with keep='first', got {keep!r}.")
+        return tracker.duplicated(s)
+
+    return s.duplicated(keep=keep)
@@ -1,8 +1,11 @@
 from typing import Literal
 
+import numpy as np
 import pandas as pd
 from pandas.util._decorators import doc
 
+from dtoolkit._typing import SeriesOrFrame
+from dtoolkit.accessor.lazy import register_row_filter
 from dtoolkit.accessor.register import register_series_method
 
 
@@ -47,7 +50,20 @@ def dropna_index(s: pd.Series, /, how: Literal["any", "all"] = "any") -> pd.Seri
     0.0  2  4
     """
 
+    mask = dropna_index_mask(s, how=how)
+    return s[mask] if s.index.hasnans else s
+
+
+@register_row_filter(pd.Series, "dropna_index")
+@register_row_filter(pd.DataFrame, "dropna_index")
+def dropna_index_mask(
+    s: SeriesOrFrame,
+    /,
+    how: Literal["any", "all"] = "any",
+) -> np.ndarray:
     if how not in {"any", "all"}:
         raise ValueError(f"invalid how option: {how!r}")
 
-    return s[~s.index._isnan] if s.index.hasnans else s
+    if not s.index.hasnans:
+        return np.ones(len(s), dtype=bool)
+    return ~s.index._isnan
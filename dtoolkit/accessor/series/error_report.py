@@ -1,8 +1,12 @@
+import numpy as np
 import pandas as pd
 
 from dtoolkit._typing import Number
 from dtoolkit._typing import OneDimArray
+from dtoolkit.accessor.error_summary import errors
+from dtoolkit.accessor.error_summary import ErrorSummary
 from dtoolkit.accessor.register import register_series_method
+from dtoolkit.util._validation import is_positive_integer
 
 
 @register_series_method
@@ -12,7 +16,9 @@ def error_report(
     /,
     absolute_error: str = "absolute_error",
     relative_error: str = "relative_error",
-) -> pd.DataFrame:
+    summary: bool = False,
+    batch_size: int = None,
+) -> pd.DataFrame | pd.Series:
     """
     Calculate `absolute_error` and `relative_error` of two columns.
 
@@ -40,11 +46,21 @@ def error_report(
     relative_error : str, default 'relative_error'
         The name of the column of relative error.
 
+    summary : bool, default False
+        If True, only return the aggregates (count, MAE, MAPE, RMSE, max and
+        percentiles of absolute error) rather than the error of each row. Use
+        :class:`~dtoolkit.accessor.ErrorSummary` to merge the aggregates of chunks.
+
+    batch_size : int, optional
+        Only works with ``summary=True``. The number of rows to aggregate at once.
+        If None, aggregate all the rows at once.
+
     Returns
     -------
-    DataFrame
-        Return four columns DataFrame and each represents 'true value',
-        'predicted value', 'absolute error', and 'relative error'.
+    DataFrame or Series
+        - DataFrame: Return four columns DataFrame and each represents 'true value',
+          'predicted value', 'absolute error', and 'relative error'.
+        - Series: If ``summary=True``, return the aggregates.
 
     Raises
     ------
@@ -52,6 +68,13 @@ def error_report(
         - If ``len(s)`` != ``len(predicted)``.
         - If ``predicted`` is Series and its index not equal to ``s``'s index.
 
+    ValueError
+        If ``batch_size`` isn't a positive integer.
+
+    See Also
+    --------
+    dtoolkit.accessor.ErrorSummary
+
     Examples
     --------
     >>> import dtoolkit
@@ -85,6 +108,19 @@ def error_report(
     0  1  3  2  2.000000
     1  2  2  0  0.000000
     2  3  1  2  0.666667
+
+    Only return the aggregates, rows are aggregated batch by batch.
+
+    >>> s.error_report(predicted, summary=True, batch_size=2)
+    count    3.000000
+    mae      1.333333
+    mape     0.888889
+    rmse     1.632993
+    max      2.000000
+    50%      1.993662
+    90%      1.993662
+    99%      1.993662
+    dtype: float64
     """
 
     if s.size != len(predicted):
@@ -101,14 +137,51 @@ def error_report(
     else:
         predicted = pd.Series(predicted, index=s.index)
 
-    absolute = (predicted - s).abs()
-    relative = absolute / s
-    return pd.concat(
-        (
-            s.rename(s.name or "true"),
-            predicted.rename(predicted.name or "predicted"),
-            absolute.rename(absolute_error),
-            relative.rename(relative_error),
-        ),
-        axis=1,
+    if summary:
+        return aggregate(s, predicted, batch_size=batch_size).to_series()
+
+    if _is_numpy_numeric(s) and _is_numpy_numeric(predicted):
+        absolute, relative = errors(s.to_numpy(), predicted.to_numpy())
+    else:
+        absolute = (predicted - s).abs()
+        relative = absolute / s
+
+    # Assemble by position, the names of 's' and 'predicted' may be the same.
+    result = pd.DataFrame(
+        dict(enumerate((s, predicted, absolute, relative))),
+        index=s.index,
+        copy=False,
     )
+    result.columns = [
+        s.name or "true",
+        predicted.name or "predicted",
+        absolute_error,
+        relative_error,
+    ]
+    return result
+
+
+def aggregate(
+    s: pd.Series,
+    predicted: pd.Series,
+    /,
+    batch_size: int = None,
+) -> ErrorSummary:
+    """Aggregate the errors batch by batch without materializing the rows."""
+
+    if batch_size is not None and not is_positive_integer(batch_size):
+        raise ValueError(
+            f"'batch_size' must be a positive integer, got {batch_size!r}.",
+        )
+
+    summary = ErrorSummary()
+    batch_size = batch_size or max(len(s), 1)
+    for start in range(0, len(s), batch_size):
+        batch = slice(start, start + batch_size)
+        summary.update(s.iloc[batch], predicted.iloc[batch])
+
+    return summary
+
+
+def _is_numpy_numeric(s: pd.Series, /) -> bool:
+    return isinstance(s.dtype, np.dtype) and s.dtype.kind in "iuf"
@@ -1,6 +1,7 @@
 import pandas as pd
 from pandas.core.computation.eval import eval as _eval
 
+from dtoolkit.accessor.expr_cache import expr_cache
 from dtoolkit.accessor.register import register_series_method
 
 
@@ -12,6 +13,10 @@ def eval(s: pd.Series, /, expr: str, **kwargs):
     This allows ``eval`` to run arbitrary code, which can make you vulnerable to code
     injection if you pass user input to this function.
 
+    Numeric expressions are compiled once and cached by the expression and the
+    layout of the Series, then evaluated via ``numexpr`` (if installed) for the
+    following calls. See :class:`~dtoolkit.accessor.ExprCache` for details.
+
     Parameters
     ----------
     expr : str
@@ -36,6 +41,9 @@ def eval(s: pd.Series, /, expr: str, **kwargs):
     dtoolkit.accessor.series.query
         Evaluates a boolean expression to query Series.
 
+    dtoolkit.accessor.ExprCache
+        The cache of compiled expressions.
+
     Examples
     --------
     >>> import dtoolkit
@@ -72,6 +80,20 @@ def eval(s: pd.Series, /, expr: str, **kwargs):
     dtype: bool
     """
 
+    # Only the evaluation on the Series itself could be cached.
+    target = kwargs.get("target", s)
+    if set(kwargs) <= {"parser", "engine", "level", "target"} and (
+        target is s or target is None
+    ):
+        result = expr_cache.eval(
+            s,
+            expr,
+            parser=kwargs.get("parser", "pandas"),
+            engine=kwargs.get("engine"),
+        )
+        if result is not None:
+            return result
+
     index_resolvers = s._get_index_resolvers()
     column_resolvers = s._get_cleaned_column_resolvers()
     resolvers = column_resolvers, index_resolvers
@@ -2,15 +2,21 @@ from collections.abc import Hashable
 from textwrap import dedent
 from typing import Iterable
 
+import numpy as np
 import pandas as pd
+from pandas._libs.lib import to_object_array
 from pandas.api.types import is_list_like
 from pandas.util._decorators import doc
 
 from dtoolkit.accessor.register import register_series_method
+from dtoolkit.util._arrow import from_arrow
+from dtoolkit.util._arrow import is_arrow_list
+from dtoolkit.util._arrow import to_arrow
 
 
 @register_series_method
 @doc(
+    parameters="",
     examples=dedent(
         """
     Examples
@@ -82,7 +88,7 @@ def expand(
 
     flatten : bool, default False
         Flatten all like-list elements or not. It would cost more time.
-
+    {parameters}
     Returns
     -------
     DataFrame
@@ -110,30 +116,114 @@ def expand(
     {examples}
     """
 
-    s_list = s.apply(_wrap_collapse, flatten=flatten)
-    if all((s_len := s_list.len()) == 1):
-        return s.apply(lambda x: x[0] if isinstance(x, Iterable) else x).to_frame()
+    if not flatten and is_arrow_list(s):
+        return expand_arrow(s, suffix=suffix, delimiter=delimiter)
+
+    rows = get_rows(s, flatten=flatten)
+    if rows is None:
+        # No list-like element, nothing to expand.
+        return s.to_frame()
+
+    columns = get_columns(
+        s,
+        list(map(len, rows)),
+        suffix=suffix,
+        delimiter=delimiter,
+    )
+    values = to_object_array(rows, min_width=len(columns))
+    return pd.DataFrame(values, index=s.index, columns=columns).infer_objects()
+
+
+def expand_arrow(
+    s: pd.Series,
+    /,
+    suffix: list[Hashable],
+    delimiter: str,
+) -> pd.DataFrame:
+    """
+    Expand the Arrow list ``s`` via Arrow kernels, the columns keep the Arrow type
+    of the list elements. A missing list is taken as one missing element.
+    """
+
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    values = to_arrow(s).combine_chunks()
+    lengths = pc.fill_null(pc.list_value_length(values), 0).to_numpy()
+    lengths = lengths.astype(np.int64)
+    # The position of each row's first element in the flattened elements.
+    starts = np.cumsum(lengths) - lengths
+    flat = pc.list_flatten(values)
+
+    null = values.is_null().to_numpy(zero_copy_only=False)
+    columns = get_columns(
+        s,
+        np.where(null, 1, lengths).tolist(),
+        suffix=suffix,
+        delimiter=delimiter,
+    )
+    arrays = []
+    for i in range(len(columns)):
+        missing = lengths <= i
+        indices = pa.array(np.where(missing, 0, starts + i), mask=missing)
+        arrays.append(from_arrow(flat.take(indices), s))
+
+    # Assemble by position, the labels may be duplicated.
+    result = pd.DataFrame(dict(enumerate(arrays)), index=s.index, copy=False)
+    result.columns = columns
+    return result
+
+
+def get_rows(s: pd.Series, /, flatten: bool) -> list[list] | None:
+    """
+    Return the expanded elements of each row, or None if there is no list-like
+    element to expand.
+    """
+
+    values = s.tolist()
+    list_like = list(map(is_list_like, values))
+    if not any(list_like):
+        return None
+
+    return [
+        _wrap_collapse(x, flatten=flatten) if is_list else [x]
+        for x, is_list in zip(values, list_like)
+    ]
+
+
+def get_columns(
+    s: pd.Series,
+    lengths: list[int],
+    /,
+    suffix: list[Hashable],
+    delimiter: str,
+) -> list[Hashable]:
+    """
+    Return the expanded column names of ``s`` from the length of each row, so the
+    width is known up front.
+    """
+
+    max_len = max(lengths, default=0)
+    if all(length == 1 for length in lengths):
+        return [s.name]
 
     if s.name is None:
         raise ValueError("the column name should be specified.")
 
-    max_len: int = s_len.max()
     if suffix and len(suffix) < max_len:
         raise ValueError(
             f"suffix length is less than the max size of {s.name!r} elements.",
         )
 
-    return pd.DataFrame(
-        s_list.tolist(),
-        index=s.index,
-        columns=(suffix or range(max_len))[:max_len],
-    ).add_prefix(s.name + delimiter)
+    prefix = s.name + delimiter
+    return [f"{prefix}{x}" for x in (suffix or range(max_len))[:max_len]]
 
 
-def _wrap_collapse(x, flatten: bool) -> list:
-    if is_list_like(x):
-        return list(collapse(x)) if flatten else x
-    return [x]
+def _wrap_collapse(x, flatten: bool) -> list | tuple:
+    if flatten:
+        return list(collapse(x))
+    # Sized sequences are used as they are, rather than copied.
+    return x if isinstance(x, (list, tuple)) else list(x)
 
 
 # based on more_itertools/more.py
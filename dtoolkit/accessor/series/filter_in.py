@@ -1,15 +1,17 @@
 from typing import Iterable
 
+import numpy as np
 import pandas as pd
 
+from dtoolkit.accessor.filter_spec import FilterSpec
+from dtoolkit.accessor.lazy import register_row_filter
 from dtoolkit.accessor.register import register_series_method
-from dtoolkit.accessor.series.invert_or_not import invert_or_not
 
 
 @register_series_method
 def filter_in(
     s: pd.Series,
-    condition: Iterable,
+    condition: Iterable | FilterSpec,
     /,
     complement: bool = False,
 ) -> pd.Series:
@@ -20,9 +22,13 @@ def filter_in(
 
     Parameters
     ----------
-    condition : list-like
+    condition : list-like or FilterSpec
         The filtered result is based on this specific condition.
 
+        If ``condition`` is a :class:`~dtoolkit.accessor.FilterSpec` compiled
+        from a :obj:`dict`, the condition of ``s.name`` is used. A plain
+        :obj:`dict` is checked via its keys like :meth:`~pandas.Series.isin`.
+
     complement : bool, default is False
         If True, do operation reversely.
 
@@ -36,6 +42,8 @@ def filter_in(
     pandas.Series.filter
     dtoolkit.accessor.dataframe.filter_in
         Filter DataFrame contents.
+    dtoolkit.accessor.FilterSpec
+        Compiled reusable condition.
 
     Examples
     --------
@@ -65,4 +73,19 @@ def filter_in(
     Name: animal, dtype: str
     """
 
-    return s[invert_or_not(s.isin(condition), invert=complement)]
+    return s[filter_in_mask(s, condition, complement=complement)]
+
+
+@register_row_filter(pd.Series, "filter_in")
+def filter_in_mask(
+    s: pd.Series,
+    condition: Iterable | FilterSpec,
+    /,
+    complement: bool = False,
+) -> np.ndarray:
+    if isinstance(condition, dict):
+        # Like 'Series.isin', a dict is a list-like of its keys.
+        condition = list(condition)
+    if not isinstance(condition, FilterSpec):
+        condition = FilterSpec(condition)
+    return condition.isin(s, key=s.name) != complement
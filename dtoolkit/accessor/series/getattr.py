@@ -1,10 +1,34 @@
 import pandas as pd
 
 from dtoolkit.accessor.register import register_series_method
+from dtoolkit.util._arrow import from_arrow
+from dtoolkit.util._arrow import is_arrow_string
+from dtoolkit.util._arrow import to_arrow
 
 
 get_attr = getattr
 
+# The methods of 'str' without arguments which have the same Arrow kernels. Except
+# the length, the kernels differ from 'str' on some non-ASCII characters (such as
+# 'ß'.upper() and the final sigma), so they are only used for ASCII strings.
+ARROW_STRING_METHODS = {
+    "__len__": "utf8_length",
+    "capitalize": "utf8_capitalize",
+    "isalnum": "utf8_is_alnum",
+    "isalpha": "utf8_is_alpha",
+    "isdecimal": "utf8_is_decimal",
+    "isdigit": "utf8_is_digit",
+    "islower": "utf8_is_lower",
+    "isnumeric": "utf8_is_numeric",
+    "isspace": "utf8_is_space",
+    "istitle": "utf8_is_title",
+    "isupper": "utf8_is_upper",
+    "lower": "utf8_lower",
+    "swapcase": "utf8_swapcase",
+    "title": "utf8_title",
+    "upper": "utf8_upper",
+}
+
 
 @register_series_method
 def getattr(s: pd.Series, name: str, /, *args, **kwargs) -> pd.Series:
@@ -34,6 +58,14 @@ def getattr(s: pd.Series, name: str, /, *args, **kwargs) -> pd.Series:
     --------
     getattr
 
+    Notes
+    -----
+    For :class:`pandas.ArrowDtype` string, the :class:`str` methods without
+    arguments which have Arrow kernels (such as ``upper`` and ``isdigit``) are
+    computed on the Arrow buffers, returning an Arrow-backed Series and keeping
+    missing values. Except ``__len__``, this only applies to ASCII strings, since
+    the kernels differ from :class:`str` on some non-ASCII characters.
+
     Examples
     --------
     >>> import dtoolkit
@@ -62,6 +94,14 @@ def getattr(s: pd.Series, name: str, /, *args, **kwargs) -> pd.Series:
     dtype: int64
     """
 
+    if name in ARROW_STRING_METHODS and not (args or kwargs) and is_arrow_string(s):
+        import pyarrow.compute as pc
+
+        values = to_arrow(s)
+        if name == "__len__" or pc.all(pc.string_is_ascii(values), min_count=0).as_py():
+            values = pc.call_function(ARROW_STRING_METHODS[name], [values])
+            return from_arrow(values, s)
+
     def wrap_getattr(x):
         attr = get_attr(x, name, None)
         if callable(attr):
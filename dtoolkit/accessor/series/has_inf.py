@@ -0,0 +1,131 @@
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+from dtoolkit.accessor.register import register_series_method
+
+
+@register_series_method
+def has_inf(
+    s: pd.Series,
+    /,
+    inf: Literal["all", "pos", "+", "neg", "-"] = "all",
+) -> pd.Series:
+    """
+    Detect ``inf`` values.
+
+    Float values are checked via :func:`numpy.isinf` (or :func:`numpy.isposinf`,
+    :func:`numpy.isneginf`) directly on the underlying array. Dtypes which can't
+    hold ``inf`` (integer, boolean, datetime, string) are skipped entirely.
+
+    Parameters
+    ----------
+    inf : {'all', 'pos', '+', 'neg', '-'}, default 'all'
+
+        * 'all' : Detect ``inf`` and ``-inf``.
+        * 'pos' / '+' : Only detect ``inf``.
+        * 'neg' / '-' : Only detect ``-inf``.
+
+    Returns
+    -------
+    Series(bool)
+
+    Raises
+    ------
+    ValueError
+        If ``inf`` isn't "all", "pos", "+", "neg", or "-".
+
+    See Also
+    --------
+    numpy.isinf
+    dtoolkit.accessor.series.drop_inf
+    dtoolkit.accessor.dataframe.has_inf
+
+    Examples
+    --------
+    >>> import dtoolkit
+    >>> import pandas as pd
+    >>> import numpy as np
+    >>> s = pd.Series([1., np.inf, -np.inf])
+    >>> s
+    0    1.0
+    1    inf
+    2   -inf
+    dtype: float64
+    >>> s.has_inf()
+    0    False
+    1     True
+    2     True
+    dtype: bool
+    >>> s.has_inf(inf="neg")
+    0    False
+    1    False
+    2     True
+    dtype: bool
+
+    The mask could be combined with others before selecting.
+
+    >>> s[~s.has_inf() & (s > 0)]
+    0    1.0
+    dtype: float64
+    """
+
+    return pd.Series(isinf(s, inf=inf), index=s.index, name=s.name)
+
+
+def isinf(
+    s: pd.Series,
+    /,
+    inf: Literal["all", "pos", "+", "neg", "-"] = "all",
+) -> np.ndarray:
+    """Get the ``inf`` mask of Series as a numpy array"""
+
+    func = get_inf_func(inf)
+    dtype = s.dtype
+    if dtype.kind == "f":
+        return func(s.to_numpy(na_value=np.nan))
+    elif not can_hold_inf(s):
+        return np.zeros(len(s), dtype=bool)
+
+    # Object or other dtypes may hold 'inf' as a Python float.
+    return s.isin(get_inf_range(inf)).to_numpy(dtype=bool)
+
+
+def can_hold_inf(s: pd.Series, /) -> bool:
+    """Check whether the dtype of Series could hold ``inf`` values"""
+
+    dtype = s.dtype
+    return not (dtype.kind in "iubmM" or isinstance(dtype, pd.StringDtype))
+
+
+def get_inf_func(inf: Literal["all", "pos", "+", "neg", "-"] = "all") -> np.ufunc:
+    """Get numpy inf checking function from string"""
+
+    INF_FUNC = {
+        "all": np.isinf,
+        "pos": np.isposinf,
+        "+": np.isposinf,
+        "neg": np.isneginf,
+        "-": np.isneginf,
+    }
+    try:
+        return INF_FUNC[inf]
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"invalid inf option: {inf!r}") from e
+
+
+def get_inf_range(inf: Literal["all", "pos", "+", "neg", "-"] = "all") -> set[float]:
+    """Get inf value from string"""
+
+    INF_RANGE = {
+        "all": {np.inf, -np.inf},
+        "pos": {np.inf},
+        "+": {np.inf},
+        "neg": {-np.inf},
+        "-": {-np.inf},
+    }
+    try:
+        return INF_RANGE[inf]
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"invalid inf option: {inf!r}") from e
@@ -0,0 +1,66 @@
+import pandas as pd
+from pandas.util._decorators import doc
+
+from dtoolkit.accessor.lazy import Lazy
+from dtoolkit.accessor.register import register_series_method
+
+
+@register_series_method
+@doc(
+    klass="Series",
+    examples="""
+    >>> import dtoolkit
+    >>> import numpy as np
+    >>> import pandas as pd
+    >>> s = pd.Series([1, np.inf, 2, 2, 3], index=['a', 'b', None, 'c', 'd'])
+    >>> plan = s.lazy().drop_inf().dropna_index().filter_in([1, 2]).to_frame('x')
+    >>> plan
+    Lazy(Series, steps=4)
+    >>> print(plan.explain())
+    Lazy Series plan:
+      0. fused mask, take once
+         drop_inf()
+         dropna_index()
+         filter_in([1, 2])
+      1. to_frame('x')
+    >>> plan.collect()
+         x
+    a  1.0
+    c  2.0
+    """,
+)
+def lazy(s: pd.Series, /) -> Lazy:
+    """
+    Record the chained method calls of the {klass} as a plan, rather than running
+    them at once.
+
+    Consecutive row filtering calls (such as ``drop_inf``, ``filter_in``,
+    ``dropna_index``, ``drop_not_duplicates``, ``select_geom_type`` and
+    ``filter_geometry``) are fused: their masks are combined into one and the rows
+    are taken once, rather than materializing an intermediate {klass} after each
+    call.
+
+    Returns
+    -------
+    Lazy
+        Call :meth:`~dtoolkit.accessor.Lazy.collect` to run the plan, and
+        :meth:`~dtoolkit.accessor.Lazy.explain` to show which calls are fused.
+
+    See Also
+    --------
+    dtoolkit.accessor.Lazy
+    dtoolkit.accessor.series.lazy
+    dtoolkit.accessor.dataframe.lazy
+
+    Notes
+    -----
+    The masks of row filtering calls are computed on the {klass} before any row is
+    taken. Only the calls depending on other rows (such as ``drop_not_duplicates``)
+    are computed on the remaining rows.
+
+    Examples
+    --------
+    {examples}
+    """
+
+    return Lazy(s)
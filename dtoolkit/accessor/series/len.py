@@ -2,6 +2,10 @@ import pandas as pd
 
 from dtoolkit.accessor.index.len import length
 from dtoolkit.accessor.register import register_series_method
+from dtoolkit.util._arrow import from_arrow
+from dtoolkit.util._arrow import is_arrow_list
+from dtoolkit.util._arrow import is_arrow_string
+from dtoolkit.util._arrow import to_arrow
 
 
 @register_series_method
@@ -23,6 +27,8 @@ def len(s: pd.Series, /, number: int = 1, other: int = None) -> pd.Series:
     Returns
     -------
     Series(int64)
+        Arrow-backed if ``s`` is backed by :class:`pandas.ArrowDtype` string or
+        list.
 
     See Also
     --------
@@ -36,6 +42,9 @@ def len(s: pd.Series, /, number: int = 1, other: int = None) -> pd.Series:
     - Different to :meth:`pandas.Series.str.len`. It only returns
       :class:`collections.abc.Iterable` type length. Other type will return `NaN`.
 
+    - For :class:`pandas.ArrowDtype` string or list, the lengths are computed via
+      Arrow kernels, missing values are filled with ``other``.
+
     Examples
     --------
     >>> import dtoolkit
@@ -76,4 +85,18 @@ def len(s: pd.Series, /, number: int = 1, other: int = None) -> pd.Series:
     dtype: int64
     """
 
+    if is_arrow_string(s) or is_arrow_list(s):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        values = to_arrow(s)
+        if is_arrow_string(s):
+            lengths = pc.utf8_length(values)
+        else:
+            lengths = pc.list_value_length(values)
+        lengths = lengths.cast(pa.int64())
+        if other is not None:
+            lengths = pc.fill_null(lengths, other)
+        return from_arrow(lengths, s)
+
     return s.apply(length, number=number, other=other)
@@ -6,6 +6,10 @@ import pandas as pd
 from pandas.api.types import is_list_like
 
 from dtoolkit.accessor.register import register_series_method
+from dtoolkit.util._arrow import from_arrow
+from dtoolkit.util._arrow import is_arrow_string
+from dtoolkit.util._arrow import map_unique
+from dtoolkit.util._arrow import to_arrow
 from dtoolkit.util._exception import find_stack_level
 
 
@@ -62,7 +66,11 @@ def textdistance(
 
     Notes
     -----
-    The result of comparing to None or nan value is depended on the ``method``.
+    - The result of comparing to None or nan value is depended on the ``method``.
+
+    - For :class:`pandas.ArrowDtype` string, the distances are returned as an
+      Arrow-backed Series. Comparing to a scalar, each distinct value is only
+      scored once.
 
     Examples
     --------
@@ -92,6 +100,9 @@ def textdistance(
         or other is None
         or (not is_list_like(other) and pd.isna(other))
     ):
+        if is_arrow_string(s):
+            scores = map_unique(lambda x: method(x, other, **kwargs), to_arrow(s))
+            return from_arrow(scores, s)
         return s.apply(method, args=(other,), **kwargs)
 
     elif isinstance(other, pd.Series):
@@ -102,6 +113,15 @@ def textdistance(
         if s.size != other.size:
             raise ValueError(f"{s.size=} != {other.size=}.")
 
+        if is_arrow_string(s) or is_arrow_string(other):
+            import pyarrow as pa
+
+            # Hand the strings over in bulk rather than boxing element by element.
+            scores = pa.array(
+                [method(*xy, **kwargs) for xy in zip(to_list(s), to_list(other))],
+            )
+            return from_arrow(scores, s)
+
         return pd.Series(
             (method(*xy, **kwargs) for xy in zip(s, other)),
             name=s.name,
@@ -109,3 +129,7 @@ def textdistance(
         )
 
     raise TypeError(f"Expected Series(string), but got {type(other).__name__!r}.")
+
+
+def to_list(s: pd.Series, /) -> list:
+    return to_arrow(s).to_pylist() if is_arrow_string(s) else s.tolist()
@@ -1,8 +1,11 @@
 from typing import Callable
 
+import numpy as np
 import pandas as pd
 
 from dtoolkit.accessor.register import register_series_method
+from dtoolkit.util._arrow import is_arrow_string
+from dtoolkit.util._arrow import to_arrow
 
 
 @register_series_method
@@ -52,7 +55,10 @@ def textdistance_matrix(
 
     Notes
     -----
-    The result of comparing to None or nan value is depended on the ``method``.
+    - The result of comparing to None or nan value is depended on the ``method``.
+
+    - For :class:`pandas.ArrowDtype` string, each distinct pair of values is only
+      scored once.
 
     Examples
     --------
@@ -78,8 +84,28 @@ def textdistance_matrix(
     if not isinstance(other, pd.Series):
         raise TypeError(f"Expected Series(string), but got {type(other).__name__!r}.")
 
-    return pd.DataFrame(
-        cdist(s, other, scorer=method, workers=-1, **kwargs),
-        index=s.index,
-        columns=other.index,
-    )
+    s_codes, s_values = distinct(s)
+    other_codes, other_values = distinct(other)
+    matrix = cdist(s_values, other_values, scorer=method, workers=-1, **kwargs)
+    if s_codes is not None:
+        matrix = matrix[s_codes]
+    if other_codes is not None:
+        matrix = matrix[:, other_codes]
+
+    return pd.DataFrame(matrix, index=s.index, columns=other.index)
+
+
+def distinct(s: pd.Series, /) -> tuple[np.ndarray | None, pd.Series | list]:
+    """
+    Return the codes and distinct values of Arrow string ``s`` via Arrow kernels,
+    so each distinct pair is only scored once. Other Series are used as they are.
+    """
+
+    if not is_arrow_string(s):
+        return None, s
+
+    import pyarrow.compute as pc
+
+    values = to_arrow(s)
+    uniques = pc.unique(values)
+    return pc.index_in(values, value_set=uniques).to_numpy(), uniques.to_pylist()
@@ -4,6 +4,10 @@ import pandas as pd
 from pandas.api.types import is_string_dtype
 
 from dtoolkit.accessor.register import register_series_method
+from dtoolkit.util._arrow import from_arrow
+from dtoolkit.util._arrow import is_arrow_string
+from dtoolkit.util._arrow import map_unique
+from dtoolkit.util._arrow import to_arrow
 
 
 LOCALIZATION = Literal[
@@ -42,6 +46,7 @@ def to_zh(
     Returns
     -------
     Series(string)
+        Arrow-backed if ``s`` is backed by :class:`pandas.ArrowDtype` string.
 
     Raises
     ------
@@ -55,6 +60,11 @@ def to_zh(
     --------
     dtoolkit.accessor.dataframe.to_zh
 
+    Notes
+    -----
+    For :class:`pandas.ArrowDtype` string, each distinct value is only converted
+    once and missing values are kept.
+
     Examples
     --------
     >>> import dtoolkit
@@ -75,4 +85,13 @@ def to_zh(
     if not is_string_dtype(s):
         raise TypeError(f"Expected string dtype, but got {s.dtype!r}.")
 
+    if is_arrow_string(s):
+        values = to_arrow(s)
+        converted = map_unique(
+            lambda x: x if x is None else convert(x, locale, update=dictionary),
+            values,
+            type=values.type,
+        )
+        return from_arrow(converted, s)
+
     return s.apply(convert, locale=locale, update=dictionary)
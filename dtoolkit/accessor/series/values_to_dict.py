@@ -1,7 +1,9 @@
+import numpy as np
 import pandas as pd
 
 from dtoolkit.accessor.register import register_series_method
 from dtoolkit.accessor.series.dropna_index import dropna_index
+from dtoolkit.util._arrow import to_arrow
 
 
 @register_series_method
@@ -87,12 +89,39 @@ def values_to_dict(
     if s.empty:
         return {}
 
+    if isinstance(s.dtype, pd.ArrowDtype) and not s.index.hasnans:
+        return arrow_values_to_dict(s, unique=unique, to_list=to_list)
+
     return {
         key: handle_element(s[s.index == key], unique=unique, to_list=to_list)
         for key in s.index.unique()
     }
 
 
+def arrow_values_to_dict(s: pd.Series, /, unique: bool, to_list: bool) -> dict:
+    """Group the Arrow buffers by the index once, rather than masking per key."""
+
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    values = to_arrow(s)
+    codes, keys = s.index.factorize()
+    order = np.argsort(codes, kind="stable")
+    bounds = np.cumsum(np.bincount(codes, minlength=len(keys)))
+
+    result = {}
+    for key, start, stop in zip(keys, (0, *bounds[:-1]), bounds):
+        group = values.take(pa.array(order[start:stop]))
+        if unique:
+            group = pc.unique(group)
+
+        group = group.to_pylist()
+        # Unfold one element list-like
+        result[key] = group[0] if not to_list and len(group) == 1 else group
+
+    return result
+
+
 def handle_element(s: pd.Series, /, unique: bool, to_list: bool):
     if unique:
         s = s.unique()
@@ -1,3 +1,4 @@
+from dtoolkit.geoaccessor.dataframe.cncrs_offset import cncrs_offset  # noqa: F401
 from dtoolkit.geoaccessor.dataframe.from_wkb import from_wkb  # noqa: F401
 from dtoolkit.geoaccessor.dataframe.from_wkt import from_wkt  # noqa: F401
 from dtoolkit.geoaccessor.dataframe.from_xy import from_xy  # noqa: F401
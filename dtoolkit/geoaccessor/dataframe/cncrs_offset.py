@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from collections.abc import Hashable
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+from dtoolkit.accessor.register import register_dataframe_method
+
+# GeoDataFrame inherits the method of DataFrame. Register GeoDataFrame's one first,
+# otherwise it warns overriding a preexisting attribute.
+from dtoolkit.geoaccessor.geodataframe import cncrs_offset as _  # noqa: F401, I001
+from dtoolkit.geoaccessor.geoseries.cncrs_offset import CHINA_CRS
+from dtoolkit.geoaccessor.geoseries.cncrs_offset import get_transformer
+from dtoolkit.geoaccessor.geoseries.cncrs_offset import transform_batches
+
+
+@register_dataframe_method
+def cncrs_offset(
+    df: pd.DataFrame,
+    /,
+    x: Hashable,
+    y: Hashable,
+    from_crs: CHINA_CRS,
+    to_crs: CHINA_CRS,
+    columns: tuple[Hashable, Hashable] = None,
+    precise: bool = False,
+    tol: float = 1e-9,
+    max_iter: int = 20,
+    method: Literal["analytic", "grid"] = "analytic",
+    resolution: float = 0.01,
+    batch_size: int = 100_000,
+    n_jobs: int = 1,
+) -> pd.DataFrame:
+    """
+    Fix the offset of the coordinates in China from columns of
+    :obj:`~pandas.DataFrame`.
+
+    The coordinates are transformed as numeric arrays directly, no geometry objects
+    are created. Details see :meth:`~dtoolkit.geoaccessor.geoseries.cncrs_offset`.
+
+    Parameters
+    ----------
+    x, y : Hashable
+        ``df``'s column names of the longitude and latitude.
+
+    from_crs, to_crs : {'wgs84', 'gcj02', 'bd09'}
+        The CRS of the input and output.
+
+    columns : tuple of (Hashable, Hashable), optional
+        The column names to write the transformed longitude and latitude. They are
+        added if not in ``df``. If None, replace ``x`` and ``y``.
+
+    precise : bool, default False
+        Only works for the inverse transformations (``GCJ-02`` to ``WGS-84``,
+        ``BD-09`` to ``WGS-84`` and ``BD-09`` to ``GCJ-02``). If True, refine the
+        inverse via fixed-point iteration until the forward transformation of the
+        result matches the input within ``tol``.
+
+    tol : float, default 1e-9
+        The tolerance in degree of the iteration, only works if ``precise=True``.
+
+    max_iter : int, default 20
+        The max number of iterations, only works if ``precise=True``.
+
+    method : {'analytic', 'grid'}, default 'analytic'
+        How to compute the offset of ``GCJ-02`` from ``WGS-84``. 'grid'
+        bilinearly interpolates the offset from a precomputed grid over China.
+
+    resolution : float, default 0.01
+        The distance in degree between the nodes of the grid, only works if
+        ``method='grid'``.
+
+    batch_size : int, default 100,000
+        The number of coordinates to transform at once.
+
+    n_jobs : int, default 1
+        The number of jobs to transform batches concurrently via threads. ``-1``
+        means using all processors. See the documentation for
+        :class:`joblib.Parallel` for complete details.
+
+    Returns
+    -------
+    DataFrame
+        The coordinates are float, missing values are kept as NaN.
+
+    Raises
+    ------
+    ValueError
+        - If ``from_crs`` or ``to_crs`` is unknown, or they are the same.
+        - If ``tol`` isn't positive or ``max_iter`` isn't a positive integer.
+        - If ``method`` is unknown or ``resolution`` isn't positive.
+        - If ``batch_size`` isn't a positive integer.
+
+    See Also
+    --------
+    dtoolkit.geoaccessor.geoseries.cncrs_offset
+    dtoolkit.geoaccessor.geodataframe.cncrs_offset
+
+    Notes
+    -----
+    This method is the accessor of DataFrame, not GeoDataFrame.
+
+    Examples
+    --------
+    >>> import dtoolkit.geoaccessor
+    >>> import pandas as pd
+    >>> df = pd.DataFrame(
+    ...     {
+    ...         "x": [114.21892734521, 128.543, 1],
+    ...         "y": [29.575429778924, 37.065, 1],
+    ...     },
+    ... )
+    >>> df
+                x         y
+    0  114.218927  29.57543
+    1  128.543000  37.06500
+    2    1.000000   1.00000
+    >>> df.cncrs_offset("x", "y", from_crs="bd09", to_crs="gcj02")
+                x          y
+    0  114.212428  29.569384
+    1  128.536589  37.058755
+    2    0.993486   0.993987
+
+    Write the transformed coordinates into new columns.
+
+    >>> df.cncrs_offset(
+    ...     "x",
+    ...     "y",
+    ...     from_crs="bd09",
+    ...     to_crs="gcj02",
+    ...     columns=("gcj02_x", "gcj02_y"),
+    ... )
+                x         y     gcj02_x    gcj02_y
+    0  114.218927  29.57543  114.212428  29.569384
+    1  128.543000  37.06500  128.536589  37.058755
+    2    1.000000   1.00000    0.993486   0.993987
+    """
+
+    transformer = get_transformer(
+        from_crs,
+        to_crs,
+        precise=precise,
+        tol=tol,
+        max_iter=max_iter,
+        method=method,
+        resolution=resolution,
+    )
+
+    x_values = df[x].to_numpy(dtype=float, na_value=np.nan)
+    y_values = df[y].to_numpy(dtype=float, na_value=np.nan)
+    out_x, out_y = np.empty_like(x_values), np.empty_like(y_values)
+    transform_batches(
+        transformer,
+        x_values,
+        y_values,
+        out_x,
+        out_y,
+        batch_size=batch_size,
+        n_jobs=n_jobs,
+    )
+
+    x_column, y_column = (x, y) if columns is None else columns
+    # Avoid mutating the original DataFrame, only the written columns are new.
+    result = df.copy(deep=False)
+    result[x_column] = out_x
+    result[y_column] = out_y
+    return result
@@ -19,6 +19,7 @@ from dtoolkit.geoaccessor.geodataframe.geodistance import geodistance  # noqa: F
 from dtoolkit.geoaccessor.geodataframe.geodistance_matrix import (  # noqa: F401
     geodistance_matrix,
 )
+from dtoolkit.geoaccessor.geodataframe.geonearest import geonearest  # noqa: F401
 from dtoolkit.geoaccessor.geodataframe.has_hole import has_hole  # noqa: F401
 from dtoolkit.geoaccessor.geodataframe.hole_counts import hole_counts  # noqa: F401
 from dtoolkit.geoaccessor.geodataframe.radius import radius  # noqa: F401
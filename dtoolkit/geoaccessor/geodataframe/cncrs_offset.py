@@ -1,3 +1,5 @@
+from typing import Literal
+
 import geopandas as gpd
 from pandas.util._decorators import doc
 
@@ -13,6 +15,13 @@ def cncrs_offset(
     /,
     from_crs: CHINA_CRS,
     to_crs: CHINA_CRS,
+    precise: bool = False,
+    tol: float = 1e-9,
+    max_iter: int = 20,
+    method: Literal["analytic", "grid"] = "analytic",
+    resolution: float = 0.01,
+    batch_size: int = 100_000,
+    n_jobs: int = 1,
 ) -> gpd.GeoDataFrame:
     return df.assign(
         **{
@@ -20,6 +29,13 @@ def cncrs_offset(
                 df.geometry,
                 from_crs=from_crs,
                 to_crs=to_crs,
+                precise=precise,
+                tol=tol,
+                max_iter=max_iter,
+                method=method,
+                resolution=resolution,
+                batch_size=batch_size,
+                n_jobs=n_jobs,
             ),
         },
     )
@@ -3,10 +3,12 @@ from typing import Literal
 import geopandas as gpd
 from pandas.util._decorators import doc
 
+from dtoolkit.accessor.duplicate_tracker import DuplicateTracker
 from dtoolkit.geoaccessor.geodataframe.duplicated_geometry import duplicated_geometry
 from dtoolkit.geoaccessor.geoseries import (
     drop_duplicates_geometry as s_drop_duplicates_geometry,
 )
+from dtoolkit.geoaccessor.geoseries.drop_duplicates_geometry import check_tracker
 from dtoolkit.geoaccessor.geoseries.duplicated_geometry_groups import BINARY_PREDICATE
 from dtoolkit.geoaccessor.register import register_geodataframe_method
 
@@ -18,5 +20,10 @@ def drop_duplicates_geometry(
     /,
     predicate: BINARY_PREDICATE | None = None,
     keep: Literal["first", "last", False] = "first",
+    tracker: DuplicateTracker = None,
 ) -> gpd.GeoDataFrame:
+    if tracker is not None:
+        check_tracker(predicate, keep)
+        return df[~tracker.duplicated(df.geometry).to_numpy()]
+
     return df[~duplicated_geometry(df, predicate=predicate, keep=keep)]
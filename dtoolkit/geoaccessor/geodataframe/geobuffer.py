@@ -1,4 +1,5 @@
 from collections.abc import Hashable
+from typing import Literal
 
 import geopandas as gpd
 from pandas.util._decorators import doc
@@ -15,6 +16,8 @@ def geobuffer(
     df: gpd.GeoDataFrame,
     distance: Hashable | Number | list[Number] | OneDimArray,
     /,
+    method: Literal["utm", "geodesic"] = "utm",
+    n_jobs: int = 1,
     **kwargs,
 ) -> gpd.GeoDataFrame:
     # NOTE: Require pandas >= 1.3.0 to support `isinstance(SeriesOrDataFrame, Hashable)`
@@ -26,6 +29,8 @@ def geobuffer(
             df.geometry.name: s_geobuffer(
                 df.geometry,
                 distance,
+                method=method,
+                n_jobs=n_jobs,
                 **kwargs,
             ),
         },
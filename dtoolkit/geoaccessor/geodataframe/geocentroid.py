@@ -1,24 +1,82 @@
 from collections.abc import Hashable
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import shapely
 from pandas.util._decorators import doc
 from shapely import Point
 
 from dtoolkit.geoaccessor.geoseries import geocentroid as s_geocentroid
+from dtoolkit.geoaccessor.geoseries.geocentroid import weiszfeld_groups
 from dtoolkit.geoaccessor.register import register_geodataframe_method
 
 
 @register_geodataframe_method
-@doc(s_geocentroid)
+@doc(
+    s_geocentroid,
+    by="""
+by : Hashable, list of Hashable or array-like, optional
+    The keys to group the points by, like :meth:`~pandas.DataFrame.groupby`.
+    If given, return the centroid of each group. All groups are iterated at
+    once, and the converged groups are retired from the iteration.
+""",
+    returns="""Point or GeoSeries
+    GeoSeries of the centroids indexed by the groups if ``by`` is given.""",
+    examples="""
+Return the centroid of each group.
+
+>>> df.geocentroid("weights", by=["a", "a", "b"])
+a    POINT (119.99999 49.99999)
+b                POINT (122 55)
+dtype: geometry
+""",
+)
 def geocentroid(
     df: gpd.GeoDataFrame,
     /,
     weights: Hashable | pd.Series = None,
     max_iter: int = 300,
     tol: float = 1e-5,
-) -> Point:
+    tol_distance: float = None,
+    by: Hashable | list[Hashable] | pd.Series = None,
+) -> Point | gpd.GeoSeries:
     if weights is not None and isinstance(weights, Hashable):
         weights = df[weights]
 
-    return s_geocentroid(df.geometry, weights=weights, max_iter=max_iter, tol=tol)
+    if by is None:
+        return s_geocentroid(
+            df.geometry,
+            weights=weights,
+            max_iter=max_iter,
+            tol=tol,
+            tol_distance=tol_distance,
+        )
+
+    if df.crs != 4326:
+        raise ValueError(f"Only support 'EPSG:4326' CRS, but got {df.crs!r}.")
+
+    grouped = df.groupby(by, sort=True)
+    keys = grouped.size().index
+    groups = grouped.ngroup().to_numpy()
+
+    coords, index = shapely.get_coordinates(df.geometry.to_numpy(), return_index=True)
+    weights = np.ones(len(df)) if weights is None else np.asarray(weights, dtype=float)
+    weights, groups = weights[index], groups[index]
+    # Drop the points of missing keys or non-finite coordinates.
+    if not (keep := np.isfinite(coords).all(axis=1) & ~np.isnan(groups)).all():
+        coords, weights, groups = coords[keep], weights[keep], groups[keep]
+
+    X, Y = weiszfeld_groups(
+        coords[:, 0],
+        coords[:, 1],
+        weights,
+        groups.astype(np.intp),
+        len(keys),
+        max_iter=max_iter,
+        tol=tol,
+        tol_distance=tol_distance,
+    )
+    centroids = shapely.points(X, Y)
+    centroids[np.isnan(X)] = None  # The groups without points.
+    return gpd.GeoSeries(centroids, index=keys, crs=df.crs)
@@ -1,7 +1,13 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 from pandas.util._decorators import doc
 
+from dtoolkit._typing import Dtype
 from dtoolkit.geoaccessor.geoseries import geodistance_matrix as s_geodistance_matrix
 from dtoolkit.geoaccessor.register import register_geodataframe_method
 
@@ -13,5 +19,15 @@ def geodistance_matrix(
     /,
     other: gpd.GeoSeries | gpd.GeoDataFrame | None = None,
     radius: float = 6371008.7714150598,
-) -> pd.DataFrame:
-    return s_geodistance_matrix(df.geometry, other=other, radius=radius)
+    chunksize: int = None,
+    out: np.ndarray = None,
+    dtype: Dtype = np.float64,
+) -> pd.DataFrame | Iterator[pd.DataFrame]:
+    return s_geodistance_matrix(
+        df.geometry,
+        other=other,
+        radius=radius,
+        chunksize=chunksize,
+        out=out,
+        dtype=dtype,
+    )
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import geopandas as gpd
+import pandas as pd
+from pandas.util._decorators import doc
+
+from dtoolkit.geoaccessor.geoseries import geonearest as s_geonearest
+from dtoolkit.geoaccessor.register import register_geodataframe_method
+
+if TYPE_CHECKING:
+    from sklearn.neighbors import BallTree
+
+
+@register_geodataframe_method
+@doc(s_geonearest)
+def geonearest(
+    df: gpd.GeoDataFrame,
+    /,
+    other: gpd.GeoSeries | gpd.GeoDataFrame | BallTree,
+    k: int = 1,
+    max_distance: float = None,
+    radius: float = 6371008.7714150598,
+    n_jobs: int = 1,
+) -> pd.DataFrame:
+    return s_geonearest(
+        df.geometry,
+        other,
+        k=k,
+        max_distance=max_distance,
+        radius=radius,
+        n_jobs=n_jobs,
+    )
@@ -16,6 +16,7 @@ from dtoolkit.geoaccessor.geoseries.geodistance import geodistance  # noqa: F401
 from dtoolkit.geoaccessor.geoseries.geodistance_matrix import (  # noqa: F401
     geodistance_matrix,
 )
+from dtoolkit.geoaccessor.geoseries.geonearest import geonearest  # noqa: F401
 from dtoolkit.geoaccessor.geoseries.has_hole import has_hole  # noqa: F401
 from dtoolkit.geoaccessor.geoseries.hole_counts import hole_counts  # noqa: F401
 from dtoolkit.geoaccessor.geoseries.radius import radius  # noqa: F401
@@ -1,3 +1,7 @@
+import os
+import tempfile
+from functools import partial
+from typing import Callable
 from typing import get_args
 from typing import Literal
 
@@ -7,9 +11,13 @@ import shapely
 from pandas.util._decorators import doc
 
 from dtoolkit.geoaccessor.register import register_geoseries_method
+from dtoolkit.util import parallelize
+from dtoolkit.util._validation import is_positive_integer
 
 PI = np.pi * 3000 / 180
 CHINA_CRS = Literal["wgs84", "gcj02", "bd09"]
+# The bounds (west, south, east, north) of the offset grid, covering China.
+GRID_BOUNDS = (73, 18, 136, 54)
 a = 6378245  # Semi major axis of the earth.
 ee = 0.00669342162296594323  # Eccentricity\ :sup:`2`.
 
@@ -21,6 +29,13 @@ def cncrs_offset(
     /,
     from_crs: CHINA_CRS,
     to_crs: CHINA_CRS,
+    precise: bool = False,
+    tol: float = 1e-9,
+    max_iter: int = 20,
+    method: Literal["analytic", "grid"] = "analytic",
+    resolution: float = 0.01,
+    batch_size: int = 100_000,
+    n_jobs: int = 1,
 ) -> gpd.GeoSeries:
     r"""
     Fix the offset of the coordinates in China.
@@ -43,6 +58,43 @@ def cncrs_offset(
     from_crs, to_crs : {{'wgs84', 'gcj02', 'bd09'}}
         The CRS of the input and output.
 
+    precise : bool, default False
+        Only works for the inverse transformations (``GCJ-02`` to ``WGS-84``,
+        ``BD-09`` to ``WGS-84`` and ``BD-09`` to ``GCJ-02``). The offset is defined
+        at the original point, so the single-step inverse leaves metre-level error.
+        If True, refine the inverse via fixed-point iteration until the forward
+        transformation of the result matches the input within ``tol``.
+
+    tol : float, default 1e-9
+        The tolerance in degree of the iteration, only works if ``precise=True``.
+
+    max_iter : int, default 20
+        The max number of iterations, only works if ``precise=True``. The points
+        which don't converge keep their last estimates.
+
+    method : {{'analytic', 'grid'}}, default 'analytic'
+        How to compute the offset of ``GCJ-02`` from ``WGS-84``, only works for the
+        transformations from or to ``WGS-84``.
+
+        - 'analytic' : Evaluate the trigonometric series of the offset per point.
+        - 'grid' : Bilinearly interpolate the offset from a precomputed grid over
+          China, which is much faster for massive points. The points outside the
+          grid fall back to 'analytic'. See the notes for the max error.
+
+    resolution : float, default 0.01
+        The distance in degree between the nodes of the grid, only works if
+        ``method='grid'``.
+
+    batch_size : int, default 100,000
+        The number of coordinates to transform at once. The coordinates are
+        overwritten by the results batch by batch, so only the temporaries of a few
+        batches are allocated above the output.
+
+    n_jobs : int, default 1
+        The number of jobs to transform batches concurrently via threads. ``-1``
+        means using all processors. See the documentation for
+        :class:`joblib.Parallel` for complete details.
+
     Returns
     -------
     {klass}
@@ -51,13 +103,35 @@ def cncrs_offset(
     Raises
     ------
     ValueError
-        If the CRS is not ``ESGP:4326``.
+        - If the CRS is not ``ESGP:4326``.
+        - If ``from_crs`` or ``to_crs`` is unknown, or they are the same.
+        - If ``tol`` isn't positive or ``max_iter`` isn't a positive integer.
+        - If ``method`` is unknown or ``resolution`` isn't positive.
+        - If ``batch_size`` isn't a positive integer.
 
     See Also
     --------
     geopandas.{klass}.to_crs
     dtoolkit.geoaccessor.geoseries.cncrs_offset
     dtoolkit.geoaccessor.geodataframe.cncrs_offset
+    dtoolkit.geoaccessor.dataframe.cncrs_offset
+
+    Notes
+    -----
+    The grid of ``method='grid'`` covers longitude 73 to 136 and latitude 18 to 54.
+    It is built at the first use of each ``resolution`` and cached as a float32
+    ``.npy`` file under the ``DTOOLKIT_CACHE_DIR`` environment variable
+    (``~/.cache/dtoolkit`` by default), then it is memory-mapped. The max error of
+    the interpolated offset against the analytic one is about:
+
+    ==========  ===========  =========  =========
+    resolution  error (deg)  error (m)  grid size
+    ==========  ===========  =========  =========
+    0.005       2.5e-7       0.03       726 MB
+    0.01        1e-6         0.11       182 MB
+    0.02        3.9e-6       0.43       45 MB
+    0.05        2.4e-5       2.6        7.3 MB
+    ==========  ===========  =========  =========
 
     Examples
     --------
@@ -79,9 +153,67 @@ def cncrs_offset(
     0  114.218927  29.57543  POINT (114.21243 29.56938)
     1  128.543000  37.06500  POINT (128.53659 37.05875)
     2    1.000000   1.00000     POINT (0.99349 0.99399)
+
+    The single-step inverse leaves error, refine it via ``precise=True``.
+
+    >>> gcj02 = df.cncrs_offset(from_crs="wgs84", to_crs="gcj02")
+    >>> rough = gcj02.cncrs_offset(from_crs="gcj02", to_crs="wgs84")
+    >>> precise = gcj02.cncrs_offset(from_crs="gcj02", to_crs="wgs84", precise=True)
+    >>> rough.distance(df).round(9)
+    0    0.000012
+    1    0.000016
+    2    0.000061
+    dtype: float64
+    >>> precise.distance(df).round(9)
+    0    0.0
+    1    0.0
+    2    0.0
+    dtype: float64
+
+    Interpolate the offset from the precomputed grid for massive points.
+
+    >>> df.cncrs_offset(
+    ...     from_crs="wgs84",
+    ...     to_crs="gcj02",
+    ...     method="grid",
+    ... )  # doctest: +SKIP
+                x         y                    geometry
+    0  114.218927  29.57543   POINT (114.2243 29.57284)
+    1  128.543000  37.06500  POINT (128.54821 37.06565)
+    2    1.000000   1.00000     POINT (1.01485 1.00211)
     """
     if s.crs != 4326:
         raise ValueError(f"Only support 'EPSG:4326' CRS, but got {s.crs!r}.")
+    transformer = get_transformer(
+        from_crs,
+        to_crs,
+        precise=precise,
+        tol=tol,
+        max_iter=max_iter,
+        method=method,
+        resolution=resolution,
+    )
+
+    return gpd.GeoSeries(
+        transform(s.values, transformer, batch_size=batch_size, n_jobs=n_jobs),
+        crs=s.crs,
+        index=s.index,
+        name=s.name,
+    )
+
+
+def get_transformer(
+    from_crs: CHINA_CRS,
+    to_crs: CHINA_CRS,
+    /,
+    precise: bool = False,
+    tol: float = 1e-9,
+    max_iter: int = 20,
+    method: Literal["analytic", "grid"] = "analytic",
+    resolution: float = 0.01,
+) -> Callable:
+    """Check the arguments and return the function transforming ``(x, y)``."""
+
     if from_crs == to_crs:
         raise ValueError("'from_crs' and 'to_crs' must be different.")
     elif from_crs not in get_args(CHINA_CRS):
@@ -92,6 +224,19 @@ def cncrs_offset(
         raise ValueError(
             f"Unknown 'to_crs': {to_crs!r}, must be in {get_args(CHINA_CRS)!r}.",
         )
+    if precise:
+        if not tol > 0:
+            raise ValueError(f"'tol' must be positive, got {tol!r}.")
+        if not is_positive_integer(max_iter):
+            raise ValueError(
+                f"'max_iter' must be a positive integer, got {max_iter!r}.",
+            )
+    if method not in ("analytic", "grid"):
+        raise ValueError(
+            f"Unknown 'method': {method!r}, must be 'analytic' or 'grid'.",
+        )
+    if method == "grid" and not resolution > 0:
+        raise ValueError(f"'resolution' must be positive, got {resolution!r}.")
 
     if from_crs == "wgs84" and to_crs == "gcj02":
         transformer = wgs84_to_gcj02
@@ -105,87 +250,360 @@ def cncrs_offset(
         transformer = bd09_to_wgs84
     elif from_crs == "bd09" and to_crs == "gcj02":
         transformer = bd09_to_gcj02
+    forward = INVERSE_OF.get((from_crs, to_crs))
+
+    # Only the transformations from or to 'wgs84' have the offset of 'gcj02'.
+    if method == "grid" and "wgs84" in (from_crs, to_crs):
+        offset = partial(
+            grid_offset,
+            grid=load_grid(resolution),
+            resolution=resolution,
+        )
+        transformer = partial(transformer, offset=offset)
+        if forward is not None:
+            forward = partial(forward, offset=offset)
+
+    if precise and forward is not None:
+        transformer = partial(
+            inverse,
+            forward=forward,
+            guess=transformer,
+            tol=tol,
+            max_iter=max_iter,
+        )
 
-    return gpd.GeoSeries(
-        transform(s.values, transformer),
-        crs=s.crs,
-        index=s.index,
-        name=s.name,
-    )
+    return transformer
 
 
 # based on geopandas.array.transform, fixed for NumPy 2.0 compatibility
-def transform(data: np.ndarray, func: callable) -> np.ndarray:
+def transform(
+    data: np.ndarray,
+    func: Callable,
+    /,
+    batch_size: int,
+    n_jobs: int = 1,
+) -> np.ndarray:
     data_copy = np.array(data, copy=True)  # Create a copy to avoid mutation
-    coords = shapely.get_coordinates(data_copy, include_z=True)
-    new_x, new_y = func(coords[:, 0], coords[:, 1])
+    # Only extract z dimension if there is, it is kept as it is.
+    coords = shapely.get_coordinates(
+        data_copy,
+        include_z=shapely.has_z(data_copy).any(),
+    )
 
-    if shapely.has_z(data_copy).any():  # Has z dimension - preserve it
-        new_coords = np.column_stack([new_x, new_y, coords[:, 2]])
-    else:  # Only x, y
-        new_coords = np.column_stack([new_x, new_y])
+    x, y = coords[:, 0], coords[:, 1]
+    transform_batches(func, x, y, x, y, batch_size=batch_size, n_jobs=n_jobs)
+    return shapely.set_coordinates(data_copy, coords)
 
-    return shapely.set_coordinates(data_copy, new_coords)
 
+def transform_batches(
+    func: Callable,
+    x: np.ndarray,
+    y: np.ndarray,
+    out_x: np.ndarray,
+    out_y: np.ndarray,
+    /,
+    batch_size: int,
+    n_jobs: int = 1,
+) -> None:
+    """
+    Write ``func(x, y)`` into ``out_x`` and ``out_y`` batch by batch.
 
-# based on https://github.com/wandergis/coordTransform_py
-def wgs84_to_gcj02(x: np.array, y: np.array, /, z=None) -> tuple[np.array, np.array]:
-    rad_y = y / 180 * np.pi
-    magic = np.sqrt(1 - ee * np.sin(rad_y) ** 2)
+    The outputs could be the inputs themselves. NumPy releases the GIL, so batches
+    run concurrently via threads.
+    """
 
-    dx = transform_x(x, y) * 180 / (a / magic * np.cos(rad_y) * np.pi)
-    dy = transform_y(x, y) * 180 / (a * (1 - ee) / magic**3 * np.pi)
+    if not is_positive_integer(batch_size):
+        raise ValueError(
+            f"'batch_size' must be a positive integer, got {batch_size!r}.",
+        )
+
+    def run(start: int, /) -> None:
+        batch = slice(start, start + batch_size)
+        out_x[batch], out_y[batch] = func(x[batch], y[batch])
+
+    starts = range(0, len(x), batch_size)
+    if n_jobs == 1 or len(starts) < 2:
+        for start in starts:
+            run(start)
+    else:
+        parallelize(
+            run,
+            starts,
+            n_jobs=n_jobs,
+            backend="threading",
+            require="sharedmem",
+        )
+
+
+def inverse(
+    x: np.ndarray,
+    y: np.ndarray,
+    /,
+    z=None,
+    *,
+    forward: Callable,
+    guess: Callable,
+    tol: float,
+    max_iter: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Solve ``forward(x0, y0) == (x, y)`` via fixed-point iteration.
+
+    Start from the single-step inverse ``guess``, then move the estimates by the
+    residual of the forward transformation. The offset is smooth and small, so the
+    iteration converges in a few steps. Converged points are dropped, so following
+    iterations only compute the rest.
+    """
+
+    x0, y0 = guess(x, y, z)
+    x0 = np.array(x0, dtype=float)
+    y0 = np.array(y0, dtype=float)
+
+    rows = np.arange(x0.size)
+    for _ in range(max_iter):
+        fx, fy = forward(x0[rows], y0[rows], z)
+        dx, dy = fx - x[rows], fy - y[rows]
+        x0[rows] -= dx
+        y0[rows] -= dy
+
+        # 'nan' never converges, so it is dropped as well.
+        rows = rows[(np.fabs(dx) > tol) | (np.fabs(dy) > tol)]
+        if rows.size == 0:
+            break
+
+    return x0, y0
+
+
+# based on https://github.com/wandergis/coordTransform_py
+def wgs84_to_gcj02(
+    x: np.array,
+    y: np.array,
+    /,
+    z=None,
+    offset: Callable = None,
+) -> tuple[np.array, np.array]:
+    dx, dy = (offset or gcj02_offset)(x, y)
     return x + dx, y + dy
 
 
-def wgs84_to_bd09(x: np.array, y: np.array, /, z=None) -> tuple[np.array, np.array]:
-    return gcj02_to_bd09(*wgs84_to_gcj02(x, y, z), z)
+def wgs84_to_bd09(
+    x: np.array,
+    y: np.array,
+    /,
+    z=None,
+    offset: Callable = None,
+) -> tuple[np.array, np.array]:
+    return gcj02_to_bd09(*wgs84_to_gcj02(x, y, z, offset=offset), z)
+
+
+# based on https://github.com/wandergis/coordTransform_py
+def gcj02_to_wgs84(
+    x: np.array,
+    y: np.array,
+    /,
+    z=None,
+    offset: Callable = None,
+) -> tuple[np.array, np.array]:
+    dx, dy = (offset or gcj02_offset)(x, y)
+    return x - dx, y - dy
 
 
 # based on https://github.com/wandergis/coordTransform_py
-def gcj02_to_wgs84(x: np.array, y: np.array, /, z=None) -> tuple[np.array, np.array]:
+def gcj02_offset(x: np.array, y: np.array, /) -> tuple[np.array, np.array]:
+    """The offset in degree of ``GCJ-02`` from ``WGS-84`` at ``(x, y)``."""
+
     rad_y = y / 180 * np.pi
     magic = np.sqrt(1 - ee * np.sin(rad_y) ** 2)
 
     dx = transform_x(x, y) * 180 / (a / magic * np.cos(rad_y) * np.pi)
     dy = transform_y(x, y) * 180 / (a * (1 - ee) / magic**3 * np.pi)
-    return x - dx, y - dy
+    return dx, dy
+
+
+def grid_offset(
+    x: np.ndarray,
+    y: np.ndarray,
+    /,
+    grid: np.ndarray,
+    resolution: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Bilinearly interpolate the offset of ``GCJ-02`` from the ``grid``. The points
+    outside the grid fall back to the analytic offset.
+    """
+
+    west, south, *_ = GRID_BOUNDS
+    _, rows, cols = grid.shape
+    col = (x - west) / resolution
+    row = (y - south) / resolution
+    # 'nan' is outside as well.
+    inside = (col >= 0) & (col <= cols - 1) & (row >= 0) & (row <= rows - 1)
+    if not (everywhere := inside.all()):
+        col, row = col[inside], row[inside]
+
+    i = np.minimum(col.astype(np.intp), cols - 2)
+    j = np.minimum(row.astype(np.intp), rows - 2)
+    # The flat indices of the 4 nodes around each point, shared by 'dx' and 'dy'.
+    nodes = j * cols + i, j * cols + i + 1, (j + 1) * cols + i, (j + 1) * cols + i + 1
+    weights = (col - i).astype(np.float32), (row - j).astype(np.float32)
+    dx, dy = (bilinear(values.reshape(-1), nodes, *weights) for values in grid)
+    if everywhere:
+        return dx, dy
+
+    offset_x, offset_y = np.empty_like(x, dtype=float), np.empty_like(y, dtype=float)
+    offset_x[inside], offset_y[inside] = dx, dy
+    outside = ~inside
+    offset_x[outside], offset_y[outside] = gcj02_offset(x[outside], y[outside])
+    return offset_x, offset_y
+
+
+def bilinear(
+    values: np.ndarray,
+    nodes: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+    tx: np.ndarray,
+    ty: np.ndarray,
+    /,
+) -> np.ndarray:
+    """Interpolate between the lower-left, lower-right, upper-left, upper-right."""
+
+    lower_left, lower_right, upper_left, upper_right = (values.take(n) for n in nodes)
+    lower_right -= lower_left
+    lower_right *= tx
+    lower_left += lower_right  # lower
+    upper_right -= upper_left
+    upper_right *= tx
+    upper_left += upper_right  # upper
+    upper_left -= lower_left
+    upper_left *= ty
+    lower_left += upper_left
+    return lower_left
+
+
+def load_grid(resolution: float, /) -> np.ndarray:
+    """
+    Memory-map the offset grid of ``resolution``, build and cache it on disk at the
+    first time.
+
+    The grid is a float32 array of shape ``(2, rows, cols)`` holding ``dx`` and
+    ``dy`` of each node within ``GRID_BOUNDS``.
+    """
+
+    directory = os.environ.get("DTOOLKIT_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"),
+        ".cache",
+        "dtoolkit",
+    )
+    path = os.path.join(directory, f"gcj02_offset_{resolution:g}.npy")
+    if not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        build_grid(path, resolution)
+
+    return np.load(path, mmap_mode="r")
+
+
+def build_grid(path: str, resolution: float, /) -> None:
+    west, south, east, north = GRID_BOUNDS
+    cols = int(np.ceil((east - west) / resolution)) + 1
+    rows = int(np.ceil((north - south) / resolution)) + 1
+    x = west + np.arange(cols) * resolution
+
+    # Write into a temporary file then move it, so a broken grid is never loaded.
+    fd, temp = tempfile.mkstemp(suffix=".npy", dir=os.path.dirname(path))
+    os.close(fd)
+    grid = np.lib.format.open_memmap(
+        temp,
+        mode="w+",
+        dtype=np.float32,
+        shape=(2, rows, cols),
+    )
+
+    # Fill a block of rows at a time, only the block is in memory.
+    step = max(1, 1_000_000 // cols)
+    for start in range(0, rows, step):
+        stop = min(start + step, rows)
+        y = south + np.arange(start, stop) * resolution
+        grid[0, start:stop], grid[1, start:stop] = gcj02_offset(*np.meshgrid(x, y))
+
+    grid.flush()
+    del grid
+    os.replace(temp, path)
+
+
+# The sine terms ``coef * sin(freq * pi * v)`` of 'transform_x' and 'transform_y'.
+# based on https://github.com/wandergis/coordTransform_py
+SIN_X = (
+    (40 / 3, 6),
+    (40 / 3, 2),
+    (40 / 3, 1),
+    (80 / 3, 1 / 3),
+    (100, 1 / 12),
+    (200, 1 / 30),
+)
+SIN_Y_OF_X = ((40 / 3, 6), (40 / 3, 2))
+SIN_Y = ((40 / 3, 1), (80 / 3, 1 / 3), (320 / 3, 1 / 12), (640 / 3, 1 / 30))
 
 
 # based on https://github.com/wandergis/coordTransform_py
 def transform_x(x: np.array, y: np.array, /) -> np.array:
+    # Accumulate in place, only a few temporaries are allocated.
     x_shifted, y_shifted = x - 105, y - 35
-    x_dot_pi = x_shifted * np.pi
-
-    return (
-        300
-        + x_shifted
-        + 2 * y_shifted
-        + 0.1 * x_shifted**2
-        + 0.1 * x_shifted * y_shifted
-        + 0.1 * np.sqrt(np.fabs(x_shifted))
-        + (20 * np.sin(x_dot_pi * 6) + 20 * np.sin(x_dot_pi * 2)) * 2 / 3
-        + (20 * np.sin(x_dot_pi) + 40 * np.sin(x_dot_pi / 3)) * 2 / 3
-        + (150 * np.sin(x_dot_pi / 12) + 300 * np.sin(x_dot_pi / 30)) * 2 / 3
-    )
+    temp = np.empty_like(x_shifted)
+
+    # 300 + x + 2y + 0.1x^2 + 0.1xy + 0.1sqrt(|x|)
+    result = x_shifted + y_shifted
+    result *= x_shifted
+    result *= 0.1
+    result += x_shifted
+    result += np.multiply(y_shifted, 2, out=temp)
+    result += 300
+    result += sqrt_fabs(x_shifted, 0.1, out=temp)
+
+    return add_sin(result, x_shifted, SIN_X, temp)
 
 
 # based on https://github.com/wandergis/coordTransform_py
 def transform_y(x: np.array, y: np.array, /) -> np.array:
+    # Accumulate in place, only a few temporaries are allocated.
     x_shifted, y_shifted = x - 105, y - 35
-    x_dot_pi, y_dot_pi = x_shifted * np.pi, y_shifted * np.pi
-
-    return (
-        -100
-        + 2 * x_shifted
-        + 3 * y_shifted
-        + 0.2 * y_shifted**2
-        + 0.1 * x_shifted * y_shifted
-        + 0.2 * np.sqrt(np.fabs(x_shifted))
-        + (20 * np.sin(x_dot_pi * 6) + 20 * np.sin(x_dot_pi * 2)) * 2 / 3
-        + (20 * np.sin(y_dot_pi) + 40 * np.sin(y_dot_pi / 3)) * 2 / 3
-        + (160 * np.sin(y_dot_pi / 12) + 320 * np.sin(y_dot_pi / 30)) * 2 / 3
-    )
+    temp = np.empty_like(x_shifted)
+
+    # -100 + 2x + 3y + 0.2y^2 + 0.1xy + 0.2sqrt(|x|)
+    result = np.multiply(y_shifted, 0.2)
+    result += np.multiply(x_shifted, 0.1, out=temp)
+    result *= y_shifted
+    result += np.multiply(x_shifted, 2, out=temp)
+    result += np.multiply(y_shifted, 3, out=temp)
+    result -= 100
+    result += sqrt_fabs(x_shifted, 0.2, out=temp)
+
+    result = add_sin(result, x_shifted, SIN_Y_OF_X, temp)
+    return add_sin(result, y_shifted, SIN_Y, temp)
+
+
+def sqrt_fabs(v: np.ndarray, coef: float, /, out: np.ndarray) -> np.ndarray:
+    """``coef * sqrt(|v|)`` into ``out``."""
+
+    np.fabs(v, out=out)
+    np.sqrt(out, out=out)
+    out *= coef
+    return out
+
+
+def add_sin(
+    result: np.ndarray,
+    v: np.ndarray,
+    terms: tuple[tuple[float, float], ...],
+    temp: np.ndarray,
+    /,
+) -> np.ndarray:
+    """Add ``coef * sin(freq * pi * v)`` of each term to ``result`` in place."""
+
+    for coef, freq in terms:
+        np.multiply(v, freq * np.pi, out=temp)
+        np.sin(temp, out=temp)
+        temp *= coef
+        result += temp
+    return result
 
 
 # based on https://github.com/wandergis/coordTransform_py
@@ -195,8 +613,14 @@ def gcj02_to_bd09(x: np.array, y: np.array, /, z=None) -> tuple[np.array, np.arr
     return d * np.cos(theta) + 0.0065, d * np.sin(theta) + 0.006
 
 
-def bd09_to_wgs84(x: np.array, y: np.array, /, z=None) -> tuple[np.array, np.array]:
-    return gcj02_to_wgs84(*bd09_to_gcj02(x, y, z), z)
+def bd09_to_wgs84(
+    x: np.array,
+    y: np.array,
+    /,
+    z=None,
+    offset: Callable = None,
+) -> tuple[np.array, np.array]:
+    return gcj02_to_wgs84(*bd09_to_gcj02(x, y, z), z, offset=offset)
 
 
 # based on https://github.com/wandergis/coordTransform_py
@@ -207,3 +631,11 @@ def bd09_to_gcj02(x: np.array, y: np.array, /, z=None) -> tuple[np.array, np.arr
     d = np.sqrt(x_shifted**2 + y_shifted**2) - 2e-5 * np.sin(y_shifted * PI)
     theta = np.arctan2(y_shifted, x_shifted) - 3e-6 * np.cos(x_shifted * PI)
     return d * np.cos(theta), d * np.sin(theta)
+
+
+# The forward transformation of each inverse transformation.
+INVERSE_OF = {
+    ("gcj02", "wgs84"): wgs84_to_gcj02,
+    ("bd09", "wgs84"): wgs84_to_bd09,
+    ("bd09", "gcj02"): gcj02_to_bd09,
+}
@@ -3,6 +3,7 @@ from typing import Literal
 import geopandas as gpd
 from pandas.util._decorators import doc
 
+from dtoolkit.accessor.duplicate_tracker import DuplicateTracker
 from dtoolkit.geoaccessor.geoseries.duplicated_geometry import duplicated_geometry
 from dtoolkit.geoaccessor.geoseries.duplicated_geometry_groups import BINARY_PREDICATE
 from dtoolkit.geoaccessor.register import register_geoseries_method
@@ -15,6 +16,7 @@ def drop_duplicates_geometry(
     /,
     predicate: BINARY_PREDICATE | None = None,
     keep: Literal["first", "last", False] = "first",
+    tracker: DuplicateTracker = None,
 ) -> gpd.GeoSeries:
     """
     Remove duplicate geometry rows.
@@ -35,13 +37,25 @@ def drop_duplicates_geometry(
         - ``last`` : Mark duplicates as ``True`` except for the last occurrence.
         - False : Mark all duplicates as ``True``.
 
+    tracker : DuplicateTracker, optional
+        Track the geometries (via their WKB) across chunks of a stream, a geometry
+        is a duplicate if it is in the previous chunks. Only works with
+        ``predicate=None`` and ``keep='first'``.
+
     Returns
     -------
     {klass}
 
+    Raises
+    ------
+    ValueError
+        If ``tracker`` is given and ``predicate`` isn't None or ``keep`` isn't
+        'first'.
+
     See Also
     --------
     geopandas.sjoin
+    dtoolkit.accessor.DuplicateTracker
     dtoolkit.geoaccessor.geoseries.duplicated_geometry
     dtoolkit.geoaccessor.geoseries.drop_duplicates_geometry
     dtoolkit.geoaccessor.geodataframe.duplicated_geometry
@@ -82,4 +96,19 @@ def drop_duplicates_geometry(
     3       POLYGON ((2 0, 3 0, 3 1, 2 0))
     """
 
+    if tracker is not None:
+        check_tracker(predicate, keep)
+        return tracker.drop_duplicates(s)
+
     return s[~duplicated_geometry(s, predicate=predicate, keep=keep)]
+
+
+def check_tracker(
+    predicate: BINARY_PREDICATE | None,
+    keep: Literal["first", "last", False],
+) -> None:
+    if predicate is not None or keep != "first":
+        raise ValueError(
+            "'tracker' only works with predicate=None and keep='first', "
+            f"got predicate={predicate!r} and keep={keep!r}.",
+        )
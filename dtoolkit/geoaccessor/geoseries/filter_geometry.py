@@ -8,6 +8,7 @@ import geopandas as gpd
 import pandas as pd
 from pandas.util._decorators import doc
 
+from dtoolkit.accessor.lazy import register_row_filter
 from dtoolkit.accessor.series import invert_or_not  # noqa: F401
 from dtoolkit.geoaccessor.register import register_geoseries_method
 
@@ -125,11 +126,14 @@ def filter_geometry(
     ]
 
 
+# The result may align to 'other', so only computed on the remaining rows.
+@register_row_filter(gpd.GeoSeries, "filter_geometry", rowwise=False)
+@register_row_filter(gpd.GeoDataFrame, "filter_geometry", rowwise=False)
 def _filter_geometry(
-    s: gpd.GeoSeries,
+    s: gpd.GeoSeries | gpd.GeoDataFrame,
     other: BaseGeometry | gpd.GeoSeries | gpd.GeoDataFrame,
     predicate: BINARY_PREDICATE,
-    complement: bool,
+    complement: bool = False,
     **kwargs,
 ) -> pd.Series:
     if predicate not in get_args(BINARY_PREDICATE):
@@ -1,9 +1,11 @@
-from warnings import catch_warnings
-from warnings import simplefilter
+from functools import lru_cache
+from typing import Callable
+from typing import Literal
 
 import geopandas as gpd
 import numpy as np
 import pandas as pd
+import shapely
 from pandas.api.types import is_list_like
 from pandas.api.types import is_number
 from pandas.util._decorators import doc
@@ -11,6 +13,7 @@ from pandas.util._decorators import doc
 from dtoolkit._typing import Number
 from dtoolkit._typing import OneDimArray
 from dtoolkit.geoaccessor.register import register_geoseries_method
+from dtoolkit.util import parallelize
 
 
 @register_geoseries_method
@@ -19,13 +22,16 @@ def geobuffer(
     s: gpd.GeoSeries,
     distance: Number | list[Number] | OneDimArray,
     /,
+    method: Literal["utm", "geodesic"] = "utm",
+    n_jobs: int = 1,
     **kwargs,
 ) -> gpd.GeoSeries:
     """
     Creates geographic buffers for :class:`~geopandas.{klass}`.
 
     Reprojects input features into the *UTM* projection, buffers them,
-    then reprojects back into the original geographic coordinates.
+    then reprojects back into the original geographic coordinates. The features are
+    grouped by the *UTM* zone of their centroids.
 
     Parameters
     ----------
@@ -34,6 +40,25 @@ def geobuffer(
         same length as the ``{alias}``. For ``GeoDataFrame.geobuffer``, it would use the
         column name as the distance prior.
 
+    method : {{'utm', 'geodesic'}}, default 'utm'
+        How to buffer points, other geometries are always buffered via 'utm'.
+
+        - 'utm' : Buffer in the *UTM* projection.
+        - 'geodesic' : Generate the circle vertices directly on the WGS84 ellipsoid
+          via the forward geodesic at evenly spaced azimuths, without reprojection.
+          It's faster for massive points and has no distortion at the edges
+          of *UTM* zones. Only ``resolution`` of ``**kwargs`` works, ``4 *
+          resolution`` vertices are generated for each circle.
+
+    n_jobs : int, default 1
+        The number of jobs to buffer UTM zones concurrently via threads. ``-1``
+        means using all processors. See the documentation for
+        :class:`joblib.Parallel` for complete details.
+
+    **kwargs
+        See the documentation for :meth:`~geopandas.GeoSeries.buffer` for complete
+        details on the keyword arguments.
+
     Returns
     -------
     {klass}
@@ -47,7 +72,8 @@ def geobuffer(
     Raises
     ------
     ValueError
-        Requires the CRS of the inputting is WGS84 (epsg:4326).
+        - Requires the CRS of the inputting is WGS84 (epsg:4326).
+        - If ``method`` is unknown.
 
     TypeError
         If ``distance`` is not a number.
@@ -103,6 +129,15 @@ def geobuffer(
     1        10  ...  POLYGON ((100.00009 1, 100.00009 0.99999, 100....
     <BLANKLINE>
     [2 rows x 3 columns]
+
+    Generate the circles of points on the ellipsoid directly.
+
+    >>> df.geobuffer(100, method="geodesic")
+       distance  ...                                           geometry
+    0         0  ...  POLYGON ((122.00156 55, 122.00156 54.99991, 12...
+    1        10  ...  POLYGON ((100.0009 1, 100.00089 0.99991, 100.0...
+    <BLANKLINE>
+    [2 rows x 3 columns]
     """
 
     if s.crs != 4326:
@@ -130,27 +165,144 @@ def geobuffer(
                 f"Length of 'distance' doesn't match length of the {type(s)!r}.",
             )
 
-    with catch_warnings():
-        # Ignore UserWarning ("Geometry is in a geographic CRS")
-        simplefilter("ignore", UserWarning)
-        utms = s.centroid.get_coordinates().apply(tuple, axis=1).apply(wgs_to_utm)
+    if method not in ("utm", "geodesic"):
+        raise ValueError(f"Unknown 'method': {method!r}, must be 'utm' or 'geodesic'.")
+
+    geometries = s.to_numpy().copy()
+    x, y = centroid_xy(geometries)
+    epsg = wgs_to_utm(x, y)
+    if method == "geodesic":
+        points = (shapely.get_type_id(geometries) == shapely.GeometryType.POINT) & (
+            epsg != 0
+        )
+        geometries[points] = geodesic_circles(
+            x[points],
+            y[points],
+            distance[points] if distance_is_list else distance,
+            resolution=kwargs.get("resolution", 16),
+        )
+        epsg[points] = 0  # Skip them in 'utm' way.
+
+    codes, inverse = np.unique(epsg, return_inverse=True)
+    # Group the rows by the integer codes at once.
+    groups = np.split(
+        np.argsort(inverse, kind="stable"),
+        np.cumsum(np.bincount(inverse, minlength=codes.size))[:-1],
+    )
+
+    def buffer(code: int, rows: np.ndarray, /) -> None:
+        to_utm, to_wgs = utm_transformers(code)
+        buffered = gpd.GeoSeries(shapely.transform(geometries[rows], to_utm)).buffer(
+            distance[rows] if distance_is_list else distance,
+            **kwargs,
+        )
+        geometries[rows] = shapely.transform(buffered.to_numpy(), to_wgs)
+
+    jobs = [(code, rows) for code, rows in zip(codes, groups) if code != 0]
+    if n_jobs == 1 or len(jobs) < 2:
+        for job in jobs:
+            buffer(*job)
+    else:
+        parallelize(
+            lambda job: buffer(*job),
+            jobs,
+            n_jobs=n_jobs,
+            backend="threading",
+            require="sharedmem",
+        )
+
+    return gpd.GeoSeries(geometries, index=s.index, crs=s.crs, name=s.name)
+
+
+def geodesic_circles(
+    x: np.ndarray,
+    y: np.ndarray,
+    distance: Number | np.ndarray,
+    /,
+    resolution: int = 16,
+) -> np.ndarray:
+    """
+    Generate the circles around (x, y) with the radius ``distance`` in meter on the
+    WGS84 ellipsoid. The vertices of all circles are computed at once.
+    """
+
+    from pyproj import Geod
+
+    n, k = x.size, 4 * resolution
+    distance = np.broadcast_to(np.asarray(distance, dtype=float), n)
+
+    # The circle is symmetric about the meridian of its center, so only the east
+    # half (azimuth from 0 to 180) is computed and the west half is mirrored.
+    quarter = k // 4
+    azimuths = np.arange(-quarter, quarter + 1) * (360 / k) + 90
+    lon, lat, _ = Geod(ellps="WGS84").fwd(
+        np.repeat(x, azimuths.size),
+        np.repeat(y, azimuths.size),
+        np.tile(azimuths, n),
+        # Compute 'nan' as 0 to keep the rings closed, it is replaced at the end.
+        np.repeat(np.nan_to_num(distance), azimuths.size),
+    )
+    lon = lon.reshape(n, -1)
+    lat = lat.reshape(n, -1)
+    # Keep the circles crossing the antimeridian continuous.
+    lon = x[:, None] + (lon - x[:, None] + 180) % 360 - 180
+
+    # Start from the east and go clockwise, the same as 'shapely.buffer'.
+    vertex = np.arange(k)
+    west = (quarter < vertex) & (vertex < 3 * quarter)
+    source = np.where(west, 2 * quarter - vertex, (vertex + quarter) % k - quarter)
+    source += quarter
+
+    coords = np.empty((n, k + 1, 2))
+    coords[:, :k, 0] = lon[:, source]
+    coords[:, :k, 0][:, west] *= -1
+    coords[:, :k, 0][:, west] += 2 * x[:, None]
+    coords[:, :k, 1] = lat[:, source]
+    coords[:, k] = coords[:, 0]  # Close the rings.
+
+    circles = shapely.polygons(coords)
+    # The same as 'shapely.buffer', non-positive radius gives an empty polygon.
+    circles[distance <= 0] = shapely.Polygon()
+    circles[np.isnan(distance)] = None
+    return circles
+
+
+def centroid_xy(geometries: np.ndarray, /) -> tuple[np.ndarray, np.ndarray]:
+    """The (x, y) of the centroid of each geometry, NaN for missing or empty."""
+
+    coords, index = shapely.get_coordinates(
+        shapely.centroid(geometries),
+        return_index=True,
+    )
+    x, y = np.full(geometries.size, np.nan), np.full(geometries.size, np.nan)
+    x[index], y[index] = coords[:, 0], coords[:, 1]
+    return x, y
+
+
+def wgs_to_utm(x: np.ndarray, y: np.ndarray, /) -> np.ndarray:
+    """Based on (x, y), return the best UTM EPSG code, 0 if out of range."""
+
+    # 'nan' is out of range as well.
+    valid = (-180 <= x) & (x <= 180) & (-90 <= y) & (y <= 90)
+    x = np.where(valid, x, 0)
+    zone = (x + 180) // 6 % 60 + 1
+    epsg = np.where(y >= 0, 32600, 32700) + zone.astype(int)
+    return np.where(valid, epsg, 0)
 
-    s = s.copy()
-    for utm in utms.unique():
-        if utm is None:
-            continue
 
-        mask = utms == utm
-        dis = distance[mask] if distance_is_list else distance
-        s[mask] = s[mask].to_crs(utm).buffer(dis, **kwargs).to_crs(4326)
+@lru_cache
+def utm_transformers(epsg: int, /) -> tuple[Callable, Callable]:
+    """The cached coordinate transformations between WGS84 and the UTM ``epsg``."""
 
-    return s
+    from pyproj import Transformer
 
+    def transformation(transformer: Transformer, /) -> Callable:
+        def transform(coords: np.ndarray, /) -> np.ndarray:
+            return np.column_stack(transformer.transform(coords[:, 0], coords[:, 1]))
 
-def wgs_to_utm(point: tuple[float, float]) -> str | None:
-    """Based on (x, y), return the best UTM EPSG code."""
+        return transform
 
-    x, y = point
-    if is_number(x) and -180 <= x <= 180 and is_number(y) and -90 <= y <= 90:
-        zone = (x + 180) // 6 % 60 + 1
-        return f"EPSG:{326 if y >= 0 else 327}{zone:02.0f}"
+    return (
+        transformation(Transformer.from_crs(4326, epsg, always_xy=True)),
+        transformation(Transformer.from_crs(epsg, 4326, always_xy=True)),
+    )
@@ -1,32 +1,40 @@
 import geopandas as gpd
 import numpy as np
 import pandas as pd
+import shapely
+from pandas.util._decorators import doc
 from shapely import Point
 
-from dtoolkit.geoaccessor.geoseries.geodistance import geodistance
+from dtoolkit.geoaccessor.geoseries.geodistance import RADIUS
+from dtoolkit.geoaccessor.geoseries.geodistance import haversine
 from dtoolkit.geoaccessor.register import register_geoseries_method
 
 
+EPSILON = 1e-12  # The min distance in radian, about 6 micrometers.
+
+
 @register_geoseries_method
+@doc(by="", returns="Point", examples="")
 def geocentroid(
     s: gpd.GeoSeries,
     /,
     weights: pd.Series = None,
     max_iter: int = 300,
     tol: float = 1e-5,
+    tol_distance: float = None,
 ) -> Point:
     r"""
     Return the centroid of all points via the center of gravity method.
 
     .. math::
 
-        \left\{\begin{matrix}
-            d_i &=& D(P(\bar{x}_n, \bar{y}_n), P(x_i, y_i))  \\
-            \bar{x}_0 &=& \frac{\sum w_i x_i}{\sum w_i} \\
-            \bar{y}_0 &=& \frac{\sum w_i y_i}{\sum w_i} \\
-            \bar{x}_{n+1} &=& \frac{\sum w_i x_i / d_i}{\sum w_i / d_i} \\
-            \bar{y}_{n+1} &=& \frac{\sum w_i y_i / d_i}{\sum w_i / d_i} \\
-        \end{matrix}\right.
+        \left\{{\begin{{matrix}}
+            d_i &=& D(P(\bar{{x}}_n, \bar{{y}}_n), P(x_i, y_i))  \\
+            \bar{{x}}_0 &=& \frac{{\sum w_i x_i}}{{\sum w_i}} \\
+            \bar{{y}}_0 &=& \frac{{\sum w_i y_i}}{{\sum w_i}} \\
+            \bar{{x}}_{{n+1}} &=& \frac{{\sum w_i x_i / d_i}}{{\sum w_i / d_i}} \\
+            \bar{{y}}_{{n+1}} &=& \frac{{\sum w_i y_i / d_i}}{{\sum w_i / d_i}} \\
+        \end{{matrix}}\right.
 
     Parameters
     ----------
@@ -39,11 +47,20 @@ def geocentroid(
         Maximum number of iterations to perform.
 
     tol : float, default 1e-5
-        Tolerance for convergence.
+        Tolerance in degree for convergence, the change of both coordinates.
 
+    tol_distance : float, optional
+        Tolerance in meter for convergence, the great-circle distance the centroid
+        moves per iteration. If given, it's used instead of ``tol``.
+    {by}
     Returns
     -------
-    Point
+    {returns}
+
+    Raises
+    ------
+    ValueError
+        If the CRS is not ``EPSG:4326``.
 
     See Also
     --------
@@ -57,10 +74,10 @@ def geocentroid(
     >>> import geopandas as gpd
     >>> from shapely import Point
     >>> df = gpd.GeoDataFrame(
-    ...     {
+    ...     {{
     ...         "weights": [1, 2, 3],
     ...         "geometry": [Point(100, 32), Point(120, 50), Point(122, 55)],
-    ...     },
+    ...     }},
     ...     crs=4326,
     ... )
     >>> df
@@ -77,22 +94,184 @@ def geocentroid(
     <POINT (121.999 54.999)>
     >>> df.geocentroid([1, 2, 3])
     <POINT (121.999 54.999)>
+    {examples}"""
+
+    if s.crs != 4326:
+        raise ValueError(f"Only support 'EPSG:4326' CRS, but got {s.crs!r}.")
+
+    coords, index = shapely.get_coordinates(s.to_numpy(), return_index=True)
+    weights = np.ones(len(s)) if weights is None else np.asarray(weights, dtype=float)
+    coords, weights = finite_points(coords, weights[index])
+    if len(coords) == 1:
+        return Point(coords[0])
+
+    return Point(
+        weiszfeld(
+            coords[:, 0],
+            coords[:, 1],
+            weights,
+            max_iter=max_iter,
+            tol=tol,
+            tol_distance=tol_distance,
+        ),
+    )
+
+
+def finite_points(coords: np.ndarray, *arrays: np.ndarray) -> tuple[np.ndarray, ...]:
+    """Drop the points with non-finite coordinates, and the same rows of arrays."""
+
+    if (finite := np.isfinite(coords).all(axis=1)).all():
+        return coords, *arrays
+    return coords[finite], *(array[finite] for array in arrays)
+
+
+def weiszfeld(
+    x: np.ndarray,
+    y: np.ndarray,
+    weights: np.ndarray,
+    /,
+    max_iter: int,
+    tol: float,
+    tol_distance: float = None,
+) -> tuple[float, float]:
     """
+    Weiszfeld's iteration of the weighted geometric median of (x, y) in degree.
 
-    if len(coord := s.get_coordinates()) == 1:
-        return Point(coord.iloc[0])
+    The coordinates are converted to radian once, each iteration only computes the
+    haversine distances into a reused buffer.
+    """
 
-    weights = np.asarray(weights) if weights is not None else 1
-    X = coord.mul(weights, axis=0).mean()
+    rad_x, rad_y = np.radians(x), np.radians(y)
+    cos_y = np.cos(rad_y)
+    distance, temp = np.empty_like(rad_x), np.empty_like(rad_x)
 
+    X, Y = weights @ x / weights.sum(), weights @ y / weights.sum()
     for _ in range(max_iter):
-        dis = geodistance(s, Point(X)).rdiv(1).mul(weights, axis=0)
-        Xt = coord.mul(dis, axis=0).sum() / dis.sum()
+        haversine_into(
+            rad_x, rad_y, cos_y, np.radians(X), np.radians(Y), distance, temp
+        )
+        # A point coincides with the centroid would pull the centroid onto itself,
+        # rather than dividing by zero.
+        np.maximum(distance, EPSILON, out=distance)
+        np.divide(weights, distance, out=distance)
+        total = distance.sum()
+        Xt, Yt = distance @ x / total, distance @ y / total
+
+        if tol_distance is not None:
+            moved = RADIUS * haversine(X, Y, Xt, Yt)
+            converged = moved <= tol_distance
+        else:
+            converged = abs(X - Xt) <= tol and abs(Y - Yt) <= tol
+
+        X, Y = Xt, Yt
+        if converged:
+            break
+
+    return X, Y
 
-        if ((X - Xt).abs() <= tol).all():
-            X = Xt
+
+def weiszfeld_groups(
+    x: np.ndarray,
+    y: np.ndarray,
+    weights: np.ndarray,
+    groups: np.ndarray,
+    n_groups: int,
+    /,
+    max_iter: int,
+    tol: float,
+    tol_distance: float = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Weiszfeld's iterations of many groups of (x, y) in degree at once.
+
+    The points are sorted by ``groups``, so each group is a segment and the sums
+    are segmented reductions via :func:`numpy.add.reduceat`. The converged groups
+    are retired, only the points of the active groups are computed. The centroid
+    of a group without points is NaN.
+    """
+
+    order = np.argsort(groups, kind="stable")
+    x, y, weights = x[order], y[order], weights[order]
+    ids, starts, counts = np.unique(
+        groups[order],
+        return_index=True,
+        return_counts=True,
+    )
+
+    X, Y = np.full(n_groups, np.nan), np.full(n_groups, np.nan)
+    total = np.add.reduceat(weights, starts)
+    X[ids] = np.add.reduceat(weights * x, starts) / total
+    Y[ids] = np.add.reduceat(weights * y, starts) / total
+
+    rad_x, rad_y = np.radians(x), np.radians(y)
+    cos_y = np.cos(rad_y)
+    owner = np.repeat(np.arange(ids.size), counts)
+    for _ in range(max_iter):
+        if ids.size == 0:
             break
 
-        X = Xt
+        Xa, Ya = X[ids], Y[ids]
+        distance, temp = np.empty_like(rad_x), np.empty_like(rad_x)
+        haversine_into(
+            rad_x,
+            rad_y,
+            cos_y,
+            np.radians(Xa)[owner],
+            np.radians(Ya)[owner],
+            distance,
+            temp,
+        )
+        np.maximum(distance, EPSILON, out=distance)
+        np.divide(weights, distance, out=distance)
+        total = np.add.reduceat(distance, starts)
+        Xt = np.add.reduceat(np.multiply(distance, x, out=temp), starts) / total
+        Yt = np.add.reduceat(np.multiply(distance, y, out=temp), starts) / total
+
+        if tol_distance is not None:
+            converged = RADIUS * haversine(Xa, Ya, Xt, Yt) <= tol_distance
+        else:
+            converged = (np.abs(Xa - Xt) <= tol) & (np.abs(Ya - Yt) <= tol)
+
+        X[ids], Y[ids] = Xt, Yt
+        if converged.any():
+            # Retire the converged groups and their points.
+            active = ~converged
+            points = active[owner]
+            ids, counts = ids[active], counts[active]
+            starts = np.cumsum(counts) - counts
+            owner = np.repeat(np.arange(ids.size), counts)
+            x, y, weights = x[points], y[points], weights[points]
+            rad_x, rad_y, cos_y = rad_x[points], rad_y[points], cos_y[points]
+
+    return X, Y
+
+
+def haversine_into(
+    rad_x: np.ndarray,
+    rad_y: np.ndarray,
+    cos_y: np.ndarray,
+    X: float | np.ndarray,
+    Y: float | np.ndarray,
+    out: np.ndarray,
+    temp: np.ndarray,
+    /,
+) -> np.ndarray:
+    """The great-circle distance in radian from each point to (X, Y) into ``out``."""
+
+    np.subtract(rad_y, Y, out=out)
+    out *= 0.5
+    np.sin(out, out=out)
+    np.square(out, out=out)
+
+    np.subtract(rad_x, X, out=temp)
+    temp *= 0.5
+    np.sin(temp, out=temp)
+    np.square(temp, out=temp)
+    temp *= cos_y
+    temp *= np.cos(Y)
 
-    return Point(X)
+    out += temp
+    np.sqrt(out, out=out)
+    np.arcsin(out, out=out)
+    out *= 2
+    return out
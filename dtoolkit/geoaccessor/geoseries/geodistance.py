@@ -9,13 +9,16 @@ from dtoolkit.geoaccessor.register import register_geoseries_method
 from dtoolkit.util._exception import find_stack_level
 
 
+RADIUS = 6371008.7714150598  # The mean radius of the earth in meter.
+
+
 @register_geoseries_method
 def geodistance(
     s: gpd.GeoSeries,
     /,
     other: BaseGeometry | gpd.GeoSeries | gpd.GeoDataFrame,
     align: bool = True,
-    radius: float = 6371008.7714150598,
+    radius: float = RADIUS,
 ) -> pd.Series:
     """
     Returns a ``Series`` containing the `great-circle`__ distance to aligned other
@@ -1,8 +1,17 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
 import geopandas as gpd
 import numpy as np
 import pandas as pd
 
+from dtoolkit._typing import Dtype
 from dtoolkit.geoaccessor.register import register_geoseries_method
+from dtoolkit.util._validation import is_positive_integer
+
+
+BLOCK_SIZE = 2**22  # The number of distances computed at once, 32 MB in float64.
 
 
 @register_geoseries_method
@@ -11,7 +20,10 @@ def geodistance_matrix(
     /,
     other: gpd.GeoSeries | gpd.GeoDataFrame | None = None,
     radius: float = 6371008.7714150598,
-) -> pd.DataFrame:
+    chunksize: int = None,
+    out: np.ndarray = None,
+    dtype: Dtype = np.float64,
+) -> pd.DataFrame | Iterator[pd.DataFrame]:
     """
     Returns a ``DataFrame`` containing the `great-circle`__ distances matrix between in
     ``s`` and ``other`` via haversine formula.
@@ -30,18 +42,33 @@ def geodistance_matrix(
     Parameters
     ----------
     other : GeoSeries, or GeoDataFrame, default None
-        If None, uses ``other=s``.
+        If None, uses ``other=s``. Then the matrix is symmetric, only its upper
+        triangle is computed and mirrored to the lower one.
 
     radius : float, default 6371008.7714150598
         Great-circle distance uses a spherical model of the earth, using the mean earth
         radius as defined by the International Union of Geodesy and Geophysics,
         (2\\ *a* + *b*)/3 = 6371008.7714150598 meters for WGS-84.
 
+    chunksize : int, optional
+        If given, return an iterator of the row blocks of the matrix, each block
+        has ``chunksize`` rows. So the whole matrix is never held in memory.
+
+    out : ndarray, optional
+        The array to write the matrix into, such as a :class:`numpy.memmap` for
+        the matrix larger than memory. Its shape should be ``(len(s), len(other))``,
+        and the returned DataFrame is backed by it.
+
+    dtype : dtype, default float64
+        The dtype of the distances, such as ``np.float32`` to halve the memory.
+        If ``out`` is given, uses its dtype.
+
     Returns
     -------
-    DataFrame
+    DataFrame or Iterator of DataFrame
         - The index and columns are the same as the index of ``s`` and ``other``.
         - The values are the great-circle distances and its unit is meters.
+        - The iterator of the row blocks is returned if ``chunksize`` is given.
 
     Raises
     ------
@@ -49,7 +76,10 @@ def geodistance_matrix(
         If don't have module named 'sklearn'.
 
     ValueError
-        If the CRS is not ``ESGP:4326``.
+        - If the CRS is not ``ESGP:4326``.
+        - If ``chunksize`` isn't a positive integer.
+        - If both ``chunksize`` and ``out`` are given.
+        - If the shape of ``out`` isn't ``(len(s), len(other))``.
 
     TypeError
         If the other is not a GeoSeries, GeoDataFrame, or None type.
@@ -100,25 +130,109 @@ def geodistance_matrix(
     0  0.000000e+00  1.435335e+06
     1  2.784435e+06  1.889892e+06
     2  3.855604e+06  4.453100e+06
-    """
-    from sklearn.metrics.pairwise import haversine_distances
 
-    if other is None:
-        other = s.copy()
+    Compute the matrix block by block.
+
+    >>> for chunk in df.geodistance_matrix(other, chunksize=2):
+    ...     print(chunk)
+                  0             1
+    0  0.000000e+00  1.435335e+06
+    1  2.784435e+06  1.889892e+06
+                  0             1
+    2  3.855604e+06  4.453100e+06
 
-    if not isinstance(other, gpd.base.GeoPandasBase):
+    Write the matrix into an array in float32, which could be a memory-map.
+
+    >>> import numpy as np
+    >>> out = np.empty((3, 2), dtype=np.float32)
+    >>> df.geodistance_matrix(other, out=out)
+                0            1
+    0        0.00  1435334.875
+    1  2784435.25  1889892.375
+    2  3855604.50  4453099.500
+    >>> out.dtype
+    dtype('float32')
+    """
+    if other is not None and not isinstance(other, gpd.base.GeoPandasBase):
         raise TypeError(f"Unknown type: {type(other).__name__!r}.")
     if s.crs != 4326:
         raise ValueError(f"Only support 'EPSG:4326' CRS, but got {s.crs!r}.")
-    if other.crs != 4326:
+    if other is not None and other.crs != 4326:
         raise ValueError(f"Only support 'EPSG:4326' CRS, but got {other.crs!r}.")
+    if chunksize is not None:
+        if not is_positive_integer(chunksize):
+            raise ValueError(
+                f"'chunksize' must be a positive integer, got {chunksize!r}.",
+            )
+        if out is not None:
+            raise ValueError("'chunksize' and 'out' can't be given together.")
+
+    a = latlon(s)
+    b = a if other is None else latlon(other)
+    columns = s.index if other is None else other.index
+    if chunksize is not None:
+        return iter_blocks(a, b, s.index, columns, radius, chunksize, dtype)
+
+    if out is None:
+        out = np.empty((len(a), len(b)), dtype=dtype)
+    elif out.shape != (len(a), len(b)):
+        raise ValueError(
+            f"The shape of 'out' should be {(len(a), len(b))}, got {out.shape}.",
+        )
 
-    return pd.DataFrame(
-        radius
-        * haversine_distances(
-            np.radians(s.get_coordinates().loc[:, ["y", "x"]]),
-            np.radians(other.get_coordinates().loc[:, ["y", "x"]]),
-        ),
-        index=s.index,
-        columns=other.index,
-    )
+    if other is None:
+        fill_symmetric(a, radius, out)
+    else:
+        step = block_rows(len(b))
+        for start in range(0, len(a), step):
+            rows = slice(start, start + step)
+            out[rows] = distances(a[rows], b, radius)
+
+    return pd.DataFrame(out, index=s.index, columns=columns, copy=False)
+
+
+def latlon(s: gpd.GeoSeries | gpd.GeoDataFrame, /) -> np.ndarray:
+    """The (latitude, longitude) in radian of each point."""
+
+    return np.radians(s.get_coordinates().to_numpy()[:, ::-1])
+
+
+def block_rows(n_columns: int, /) -> int:
+    return max(BLOCK_SIZE // max(n_columns, 1), 1)
+
+
+def distances(a: np.ndarray, b: np.ndarray, radius: float, /) -> np.ndarray:
+    from sklearn.metrics.pairwise import haversine_distances
+
+    return radius * haversine_distances(a, b)
+
+
+def fill_symmetric(a: np.ndarray, radius: float, out: np.ndarray, /) -> None:
+    """Fill the distances between ``a`` themselves via the upper triangle."""
+
+    step = block_rows(len(a))
+    for start in range(0, len(a), step):
+        rows = slice(start, start + step)
+        block = distances(a[rows], a[start:], radius)
+        out[rows, start:] = block
+        out[start:, rows] = block.T
+
+
+def iter_blocks(
+    a: np.ndarray,
+    b: np.ndarray,
+    index: pd.Index,
+    columns: pd.Index,
+    radius: float,
+    chunksize: int,
+    dtype: Dtype,
+    /,
+) -> Iterator[pd.DataFrame]:
+    for start in range(0, len(a), chunksize):
+        rows = slice(start, start + chunksize)
+        yield pd.DataFrame(
+            distances(a[rows], b, radius).astype(dtype, copy=False),
+            index=index[rows],
+            columns=columns,
+            copy=False,
+        )
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
+
+from dtoolkit.geoaccessor.register import register_geoseries_method
+from dtoolkit.util import parallelize
+from dtoolkit.util._validation import is_positive_integer
+
+if TYPE_CHECKING:
+    from sklearn.neighbors import BallTree
+
+
+BATCH_SIZE = 10_000  # The number of points per query batch.
+
+
+@register_geoseries_method
+def geonearest(
+    s: gpd.GeoSeries,
+    /,
+    other: gpd.GeoSeries | gpd.GeoDataFrame | BallTree,
+    k: int = 1,
+    max_distance: float = None,
+    radius: float = 6371008.7714150598,
+    n_jobs: int = 1,
+) -> pd.DataFrame:
+    """
+    Find the ``k`` nearest points in ``other`` of each point via `great-circle`__
+    distance.
+
+    __ https://en.wikipedia.org/wiki/Great-circle_distance
+
+    The points of ``other`` are indexed by a :class:`~sklearn.neighbors.BallTree`
+    with the haversine metric, so each query only visits a few nodes of the tree
+    rather than computing the distances to all points like
+    :meth:`~dtoolkit.geoaccessor.geoseries.geodistance_matrix`.
+
+    Parameters
+    ----------
+    other : GeoSeries, GeoDataFrame or BallTree
+        The points to search. A :class:`~sklearn.neighbors.BallTree` could be
+        prebuilt and reused across calls, which must be built on the
+        ``(latitude, longitude)`` in radian with ``metric="haversine"``.
+
+    k : int, default 1
+        The number of nearest points to return.
+
+    max_distance : float, optional
+        The max great-circle distance in meter. The nearest points beyond it are
+        missing.
+
+    radius : float, default 6371008.7714150598
+        Great-circle distance uses a spherical model of the earth, using the mean earth
+        radius as defined by the International Union of Geodesy and Geophysics,
+        (2\\ *a* + *b*)/3 = 6371008.7714150598 meters for WGS-84.
+
+    n_jobs : int, default 1
+        The number of threads to query. ``-1`` means using all processors.
+
+    Returns
+    -------
+    DataFrame
+        - The index is the same as the index of ``s``, and each label is repeated
+          ``k`` times from the nearest to the farthest.
+        - ``nearest`` is the index of ``other``, or the position of the points if
+          ``other`` is a BallTree.
+        - ``distance`` is the great-circle distance and its unit is meters.
+        - Missing if the point is missing, empty or has non-finite coordinates,
+          or there are no nearest points within ``max_distance``, or ``other``
+          has fewer than ``k`` valid points.
+
+    Raises
+    ------
+    ModuleNotFoundError
+        If don't have module named 'sklearn'.
+
+    ValueError
+        - If ``k`` isn't a positive integer.
+        - If the CRS is not ``EPSG:4326``.
+        - If the geometries are not Point.
+
+    TypeError
+        If the other is not a GeoSeries, GeoDataFrame, or BallTree type.
+
+    See Also
+    --------
+    sklearn.neighbors.BallTree
+    geopandas.sjoin_nearest
+    dtoolkit.geoaccessor.geoseries.geodistance_matrix
+    dtoolkit.geoaccessor.geodataframe.geonearest
+
+    Notes
+    -----
+    Currently, only supports Point geometry.
+
+    Examples
+    --------
+    >>> import dtoolkit.geoaccessor
+    >>> import pandas as pd
+    >>> df = pd.DataFrame(
+    ...     {
+    ...         "x": [120, 122, 100],
+    ...         "y":[30, 55, 1],
+    ...     },
+    ... ).from_xy("x", "y", crs=4326)
+    >>> df
+         x   y        geometry
+    0  120  30  POINT (120 30)
+    1  122  55  POINT (122 55)
+    2  100   1   POINT (100 1)
+    >>> other = pd.DataFrame(
+    ...     {
+    ...         "x": [120, 110, 121],
+    ...         "y":[30, 40, 31],
+    ...     },
+    ...     index=["a", "b", "c"],
+    ... ).from_xy("x", "y", crs=4326)
+    >>> other
+         x   y        geometry
+    a  120  30  POINT (120 30)
+    b  110  40  POINT (110 40)
+    c  121  31  POINT (121 31)
+    >>> df.geonearest(other)
+      nearest      distance
+    0       a  0.000000e+00
+    1       b  1.889892e+06
+    2       a  3.855604e+06
+
+    Find the 2 nearest points within 1000 kilometers.
+
+    >>> df.geonearest(other, k=2, max_distance=1_000_000)
+      nearest       distance
+    0       a       0.000000
+    0       c  146775.883304
+    1     NaN            NaN
+    1     NaN            NaN
+    2     NaN            NaN
+    2     NaN            NaN
+
+    Prebuild the tree once and reuse it, then the nearest are the positions of the
+    points.
+
+    >>> import numpy as np
+    >>> from sklearn.neighbors import BallTree
+    >>> tree = BallTree(
+    ...     np.radians(other.get_coordinates()[["y", "x"]]),
+    ...     metric="haversine",
+    ... )
+    >>> df.geonearest(tree)
+       nearest      distance
+    0        0  0.000000e+00
+    1        1  1.889892e+06
+    2        0  3.855604e+06
+    """
+    from sklearn.neighbors import BallTree
+
+    if not is_positive_integer(k):
+        raise ValueError(f"'k' must be a positive integer, got {k!r}.")
+    if s.crs != 4326:
+        raise ValueError(f"Only support 'EPSG:4326' CRS, but got {s.crs!r}.")
+
+    if isinstance(other, BallTree):
+        tree = other
+        labels = pd.RangeIndex(tree.data.shape[0])
+        positions = None
+    elif isinstance(other, gpd.base.GeoPandasBase):
+        if other.crs != 4326:
+            raise ValueError(f"Only support 'EPSG:4326' CRS, but got {other.crs!r}.")
+
+        positions, points = latlon(other.geometry)
+        tree = BallTree(points, metric="haversine") if len(points) else None
+        labels = other.index
+    else:
+        raise TypeError(f"Unknown type: {type(other).__name__!r}.")
+
+    rows, points = latlon(s)
+    nearest = np.full((len(s), k), -1, dtype=np.intp)
+    distance = np.full((len(s), k), np.nan)
+    # The tree may have fewer than 'k' points, the rest of nearest are missing.
+    n = 0 if tree is None else min(k, tree.data.shape[0])
+
+    def query(start: int, /) -> None:
+        batch = slice(start, start + BATCH_SIZE)
+        distance[rows[batch], :n], nearest[rows[batch], :n] = tree.query(
+            points[batch],
+            k=n,
+        )
+
+    starts = range(0, len(rows) if n else 0, BATCH_SIZE)
+    if n_jobs == 1 or len(starts) < 2:
+        for start in starts:
+            query(start)
+    else:
+        parallelize(
+            query,
+            starts,
+            n_jobs=n_jobs,
+            backend="threading",
+            require="sharedmem",
+        )
+
+    distance *= radius
+    if max_distance is not None:
+        beyond = distance > max_distance
+        distance[beyond] = np.nan
+        nearest[beyond] = -1
+    if positions is not None:
+        # From the positions of the tree to the positions of 'other'.
+        found = nearest >= 0
+        nearest[found] = positions[nearest[found]]
+
+    return pd.DataFrame(
+        {
+            "nearest": pd.api.extensions.take(
+                labels.to_numpy(),
+                nearest.ravel(),
+                allow_fill=True,
+            ),
+            "distance": distance.ravel(),
+        },
+        index=s.index.repeat(k),
+    )
+
+
+def latlon(s: gpd.GeoSeries, /) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return the positions of the valid points and their (latitude, longitude) in
+    radian, the missing, empty and non-finite points are skipped.
+    """
+
+    geometries = s.to_numpy()
+    valid = ~(shapely.is_missing(geometries) | shapely.is_empty(geometries))
+    if (shapely.get_type_id(geometries[valid]) != shapely.GeometryType.POINT).any():
+        raise ValueError("Only support Point geometry.")
+
+    positions = np.flatnonzero(valid)
+    coords = shapely.get_coordinates(geometries[valid])
+    if not (finite := np.isfinite(coords).all(axis=1)).all():
+        positions, coords = positions[finite], coords[finite]
+    return positions, np.radians(coords[:, ::-1])
@@ -1,8 +1,10 @@
 from typing import Literal
 
 import geopandas as gpd
+import pandas as pd
 from pandas.util._decorators import doc
 
+from dtoolkit.accessor.lazy import register_row_filter
 from dtoolkit.accessor.series import invert_or_not
 from dtoolkit.geoaccessor.register import register_geoseries_method
 
@@ -81,4 +83,15 @@ def select_geom_type(
     0  POINT (1 1)
     """
 
-    return s[invert_or_not(s.geom_type == geom_type, invert=complement)]
+    return s[select_geom_type_mask(s, geom_type, complement=complement)]
+
+
+@register_row_filter(gpd.GeoSeries, "select_geom_type")
+@register_row_filter(gpd.GeoDataFrame, "select_geom_type")
+def select_geom_type_mask(
+    s: gpd.GeoSeries | gpd.GeoDataFrame,
+    geom_type: GEOM_TYPE,
+    /,
+    complement: bool = False,
+) -> pd.Series:
+    return invert_or_not(s.geom_type == geom_type, invert=complement)
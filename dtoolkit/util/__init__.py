@@ -1 +1,2 @@
+from dtoolkit.util.fit_decompose import fit_decompose  # noqa: F401
 from dtoolkit.util.parallelize import parallelize  # noqa: F401
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+def is_arrow_string(s: pd.Series, /) -> bool:
+    """Whether ``s`` is backed by an Arrow string array."""
+
+    if not isinstance(s.dtype, pd.ArrowDtype):
+        return False
+
+    import pyarrow as pa
+
+    typ = s.dtype.pyarrow_dtype
+    return pa.types.is_string(typ) or pa.types.is_large_string(typ)
+
+
+def is_arrow_list(s: pd.Series, /) -> bool:
+    """Whether ``s`` is backed by an Arrow list array."""
+
+    if not isinstance(s.dtype, pd.ArrowDtype):
+        return False
+
+    import pyarrow as pa
+
+    typ = s.dtype.pyarrow_dtype
+    return (
+        pa.types.is_list(typ)
+        or pa.types.is_large_list(typ)
+        or pa.types.is_fixed_size_list(typ)
+    )
+
+
+def to_arrow(s: pd.Series, /) -> pa.ChunkedArray:
+    """Return the Arrow buffers of an Arrow-backed ``s`` without copying."""
+
+    return s.array.__arrow_array__()
+
+
+def from_arrow(values: pa.Array | pa.ChunkedArray, s: pd.Series, /) -> pd.Series:
+    """Wrap Arrow ``values`` as a Series with the index and name of ``s``."""
+
+    return pd.Series(
+        pd.arrays.ArrowExtensionArray(values),
+        index=s.index,
+        name=s.name,
+        copy=False,
+    )
+
+
+def map_unique(
+    func,
+    values: pa.ChunkedArray,
+    /,
+    type: pa.DataType = None,
+) -> pa.ChunkedArray:
+    """
+    Apply ``func`` to each distinct value of ``values`` once and broadcast the
+    results back via Arrow kernels. Missing values are passed to ``func`` as None.
+    The results are converted to ``type`` if given, otherwise it is inferred.
+    """
+
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    uniques = pc.unique(values)
+    results = pa.array(list(map(func, uniques.to_pylist())), type=type)
+    return pc.take(results, pc.index_in(values, value_set=uniques))
@@ -0,0 +1,10 @@
+from numbers import Integral
+
+
+def is_positive_integer(value, /) -> bool:
+    """
+    Whether ``value`` is a positive integer, including NumPy integers but not
+    booleans.
+    """
+
+    return isinstance(value, Integral) and not isinstance(value, bool) and value >= 1
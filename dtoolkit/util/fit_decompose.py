@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from collections.abc import Hashable
+from typing import Iterable
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from sklearn.base import TransformerMixin
+
+
+def fit_decompose(
+    chunks: Iterable[pd.DataFrame],
+    /,
+    method: TransformerMixin,
+    columns: (
+        None
+        | dict[Hashable | tuple[Hashable], Hashable | list[Hashable] | tuple[Hashable]]
+        | list[Hashable]
+        | pd.Index
+    ) = None,
+    **kwargs,
+) -> TransformerMixin | dict[Hashable, TransformerMixin]:
+    """
+    Fit decomposition transformer(s) from chunks of DataFrame.
+
+    The transformer is fitted chunk by chunk via ``partial_fit`` (e.g.
+    :class:`~sklearn.decomposition.IncrementalPCA`), so the whole data never
+    needs to be in memory. If ``method`` doesn't support ``partial_fit``,
+    chunks are concatenated and fitted at once.
+
+    Parameters
+    ----------
+    chunks : Iterable of DataFrame
+        Such as the reader of :func:`~pandas.read_csv` with ``chunksize``.
+
+    method : TransformerMixin
+        Decomposition transformer.
+
+    columns : dict, list, Index or None, default None
+        Choose columns to decompose. See the documentation for
+        :meth:`~dtoolkit.accessor.dataframe.decompose` for complete details.
+
+    **kwargs
+        See the documentation for ``method`` for complete details on
+        the keyword arguments.
+
+    Returns
+    -------
+    TransformerMixin or dict
+        If ``columns`` is :keyword:`dict`, return a dict of fitted transformers
+        ``{new columns: transformer}``. Could be passed to ``fitted`` of
+        :meth:`~dtoolkit.accessor.dataframe.decompose`.
+
+    Raises
+    ------
+    ValueError
+        - If ``chunks`` is empty.
+        - If the type of ``columns`` isn't right.
+
+    See Also
+    --------
+    dtoolkit.accessor.dataframe.decompose
+
+    Examples
+    --------
+    >>> import dtoolkit
+    >>> import pandas as pd
+    >>> from sklearn import decomposition
+    >>> from dtoolkit.util import fit_decompose
+    >>> df = pd.DataFrame(
+    ...     [
+    ...         [-1, -1, 1, 1],
+    ...         [-2, -1, 2, 1],
+    ...         [-3, -2, 3, 2],
+    ...         [1, 1, -1, -1],
+    ...         [2, 1, -2, -1],
+    ...         [3, 2, -3, -2],
+    ...     ],
+    ...     columns=["a", "b", "c", "d"],
+    ... )
+    >>> chunks = [df.iloc[:3], df.iloc[3:]]
+
+    Fit the transformer chunk by chunk.
+
+    >>> model = fit_decompose(
+    ...     chunks,
+    ...     decomposition.IncrementalPCA,
+    ...     {"A": ["a", "b"]},
+    ... )
+    >>> model
+    {'A': IncrementalPCA(n_components=1)}
+
+    Then transform chunk by chunk.
+
+    >>> for chunk in chunks:
+    ...     chunk.decompose(
+    ...         decomposition.IncrementalPCA,
+    ...         {"A": ["a", "b"]},
+    ...         fitted=model,
+    ...     )  # doctest: +SKIP
+              A  a  b  c  d
+    0 -1.383323 -1 -1  1  1
+    1 -2.221969 -2 -1  2  1
+    2 -3.605292 -3 -2  3  2
+              A  a  b  c  d
+    3  1.383323  1  1 -1 -1
+    4  2.221969  2  1 -2 -1
+    5  3.605292  3  2 -3 -2
+    """
+
+    if columns is None or isinstance(columns, (list, pd.Index)):
+        layout = {None: columns}
+    elif isinstance(columns, dict):
+        layout = columns
+    else:
+        raise ValueError("The type of inputting 'columns' isn't right")
+
+    models = {
+        key: method(count_components(key) if key is not None else None, **kwargs)
+        for key in layout
+    }
+    incremental = all(hasattr(model, "partial_fit") for model in models.values())
+
+    pieces, empty = [], True
+    for chunk in chunks:
+        empty = False
+        if incremental:
+            for key, value in layout.items():
+                models[key].partial_fit(_to_frame(chunk, value))
+        else:
+            pieces.append(chunk)
+
+    if empty:
+        raise ValueError("'chunks' is empty.")
+    elif not incremental:
+        data = pd.concat(pieces)
+        for key, value in layout.items():
+            models[key].fit(_to_frame(data, value))
+
+    return models if isinstance(columns, dict) else models[None]
+
+
+def count_components(key: Hashable | tuple[Hashable], /) -> int:
+    """The number of components of the new column(s) ``key``."""
+
+    return len(key) if isinstance(key, tuple) else 1
+
+
+def _to_frame(
+    df: pd.DataFrame,
+    /,
+    columns: Hashable | list[Hashable] | pd.Index | None,
+) -> pd.DataFrame:
+    df = df if columns is None else df[columns]
+    return df.to_frame() if isinstance(df, pd.Series) else df
@@ -0,0 +1,91 @@
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from dtoolkit.accessor.dataframe import compact  # noqa: F401
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {
+            "a": [1, 2, 300, 4] * 25,
+            "b": [0.5, 1.5, 2.5, None] * 25,
+            "c": ["x", "y", "x", "x"] * 25,
+            "d": [True, False, None, True] * 25,
+            "e": [f"p{i}" for i in range(100)],
+        },
+    )
+
+
+def test_work(df):
+    result = df.compact()
+
+    assert result.dtypes.astype(str).tolist() == [
+        "int16",
+        "float32",
+        "category",
+        "boolean",
+        "str",
+    ]
+    assert_frame_equal(result, df.astype(result.dtypes))
+
+
+def test_dry_run_and_plan(df):
+    plan = df.compact(dry_run=True)
+    chunk = pd.DataFrame(
+        {
+            "a": [5, 6],
+            "b": [3.5, 4.5],
+            "c": ["y", "y"],
+            "d": [False, False],
+            "e": ["t", "u"],
+        },
+    )
+
+    result = chunk.compact(plan=plan)
+
+    assert result.dtypes.to_dict() == plan
+    assert_frame_equal(result, chunk.astype(plan))
+
+
+def test_partial_plan(df):
+    result = df.compact(plan={"a": "int32"})
+
+    assert_frame_equal(result, df.astype({"a": "int32"}))
+
+
+def test_report(df):
+    result, report = df.compact(report=True)
+
+    assert report.index.equals(df.columns)
+    assert report["dtype_before"].tolist() == df.dtypes.tolist()
+    assert report["dtype_after"].tolist() == result.dtypes.tolist()
+    assert (
+        report["bytes_before"].tolist()
+        == df.memory_usage(
+            index=False,
+            deep=True,
+        ).tolist()
+    )
+    assert (report["bytes_after"] <= report["bytes_before"]).all()
+
+
+def test_keep_columns():
+    df = pd.DataFrame(
+        [[1, 2]],
+        columns=pd.MultiIndex.from_tuples([("a", 1), ("a", 2)], names=["x", "y"]),
+    )
+
+    assert df.compact().columns.equals(df.columns)
+
+
+def test_error(df):
+    with pytest.raises(KeyError):
+        df.compact(plan={"z": "int8"})
+
+    with pytest.raises(ValueError):
+        df.compact(plan={"a": "int8"})
+
+    with pytest.raises(ValueError):
+        pd.DataFrame([[1, 2]], columns=["a", "a"]).compact()
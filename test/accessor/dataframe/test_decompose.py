@@ -270,3 +270,53 @@ def test_work(df, method, columns, drop, kwargs, expected):
 def test_error(df, method, columns, drop, kwargs, error):
     with pytest.raises(error):
         df.decompose(method, columns, drop=drop, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "columns",
+    [None, ["a", "b"], {"A": ["a", "b"], ("B", "C"): ["a", "b", "c"]}],
+)
+def test_fitted(columns):
+    df = pd.DataFrame(
+        [
+            [-1, -1, 1],
+            [-2, -1, 2],
+            [-3, -2, 4],
+            [1, 1, -1],
+            [2, 1, -2],
+            [3, 2, -3],
+        ],
+        columns=["a", "b", "c"],
+    )
+
+    expected, model = df.decompose(decomposition.PCA, columns, return_model=True)
+    result = pd.concat(
+        [
+            chunk.decompose(decomposition.PCA, columns, fitted=model)
+            for chunk in (df.iloc[:2], df.iloc[2:])
+        ],
+    )
+
+    assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("drop", [True, False])
+def test_n_jobs(drop):
+    df = pd.DataFrame(
+        [
+            [-1, -1, 1, 1],
+            [-2, -1, 2, 1],
+            [-3, -2, 4, 2],
+            [1, 1, -1, -1],
+            [2, 1, -2, -1],
+            [3, 2, -3, -2],
+        ],
+        columns=["a", "b", "c", "d"],
+    )
+    columns = {"A": ["a", "b"], ("B", "C"): ["b", "c", "d"], "a": "a", "D": ["d"]}
+
+    result = df.decompose(decomposition.PCA, columns, drop=drop, n_jobs=2)
+    expected = df.decompose(decomposition.PCA, columns, drop=drop, n_jobs=1)
+
+    assert_frame_equal(result, expected)
+    assert result.columns.tolist()[:5] == ["A", "B", "C", "a", "D"]
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from dtoolkit.accessor.dataframe import expand  # noqa: F401
+
+
+df = pd.DataFrame(
+    {
+        "a": [[0, 1, 2], "foo", [], (3, 4)],
+        "b": 1,
+        "c": [["a", "b", "c"], np.nan, [], ["d", "e"]],
+        "d": ["x", "y", "z", "w"],
+        "e": [[1], [2], [3], (4,)],
+        "f": [(1, [2, 3]), [4], 5, None],
+    },
+)
+
+
+@pytest.mark.parametrize("flatten", [False, True])
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_same_as_series_expand(flatten, n_jobs):
+    result = df.expand(flatten=flatten, n_jobs=n_jobs)
+
+    expected = pd.concat(
+        (s.expand(flatten=flatten) for _, s in df.items()),
+        axis=1,
+    )
+    assert_frame_equal(result, expected)
+
+
+def test_pass_through():
+    data = pd.DataFrame(
+        {
+            "a": ["foo", "bar"],
+            "b": pd.array([1, None], dtype="Int64"),
+            "c": [(1, 2), (3, 4)],
+        },
+    )
+
+    result = data.expand()
+
+    expected = pd.DataFrame(
+        {
+            "a": data["a"],
+            "b": data["b"],
+            "c_0": [1, 3],
+            "c_1": [2, 4],
+        },
+    )
+    assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "data, suffix",
+    [
+        (pd.DataFrame({"a": [(1, 2)], "b": [(1, 2, 3)]}), ["x", "y"]),
+        (pd.DataFrame({0: [(1, 2)]}), None),
+    ],
+)
+def test_error(data, suffix):
+    with pytest.raises((ValueError, TypeError)):
+        data.expand(suffix=suffix)
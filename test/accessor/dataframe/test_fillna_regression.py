@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 from pandas.testing import assert_frame_equal
@@ -292,3 +293,89 @@ def test_error():
     )
     with pytest.raises(ValueError):
         df.fillna_regression(linear_model.MultiTaskElasticNet, {"y": "x1"}, how="blah")
+
+
+@pytest.mark.parametrize(
+    "columns",
+    [
+        {"y1": ["x1", "x2"], "y2": ["x1", "y1"], "y3": ["x2"], "y4": ["y2", "y3"]},
+        # 'y1' uses the original 'y3' because 'y3' is filled after it.
+        {"y3": ["x1"], "y1": ["x2", "y3"], "y2": ["x1"]},
+    ],
+)
+@pytest.mark.parametrize("how", ["na", "all"])
+def test_n_jobs_same_as_sequential(columns, how):
+    df = pd.DataFrame(
+        {
+            "x1": [1, 1, 2, 2, 3, 4, 5],
+            "x2": [1, 2, 2, 3, 5, 3, 1],
+            "y1": [6, None, 9, 11, None, 14, 10],
+            "y2": [3, 4, None, 6, 7, None, 9],
+            "y3": [2, 5, 4, 7, 10, 6, 2],
+            "y4": [None, 1, 2, 3, 4, 5, None],
+        },
+    )
+
+    result, models = df.fillna_regression(
+        linear_model.LinearRegression,
+        columns,
+        how=how,
+        return_model=True,
+        n_jobs=2,
+    )
+
+    expected = df.copy()
+    for y, X in columns.items():
+        data = expected[expected[y].notnull()]
+        model = linear_model.LinearRegression().fit(data[X], data[y])
+        if how == "all":
+            expected[y] = model.predict(expected[X])
+        elif (null := expected[y].isnull()).any():
+            expected.loc[null, y] = model.predict(expected.loc[null, X])
+
+    assert_frame_equal(result, expected)
+    assert list(models) == list(columns)
+
+
+@pytest.mark.parametrize("how", ["na", "all"])
+@pytest.mark.parametrize("batch_size", [None, 1, 2, 3, 100, np.int64(2)])
+def test_fitted_and_batch_size(how, batch_size):
+    df = pd.DataFrame(
+        {
+            "x1": [1, 1, 2, 2, 3, 4, 5],
+            "x2": [1, 2, 2, 3, 5, 3, 1],
+            "y1": [6, None, 9, 11, None, 14, None],
+            "y2": [3, 4, None, 6, 7, None, 9],
+        },
+    )
+    columns = {"y1": ["x1", "x2"], "y2": ["x1", "y1"]}
+
+    expected, models = df.fillna_regression(
+        linear_model.LinearRegression,
+        columns,
+        how=how,
+        return_model=True,
+    )
+    result, reused = df.fillna_regression(
+        linear_model.LinearRegression,
+        columns,
+        how=how,
+        return_model=True,
+        fitted=models,
+        batch_size=batch_size,
+    )
+
+    assert_frame_equal(result, expected)
+    assert all(reused[y] is models[y] for y in columns)
+
+
+@pytest.mark.parametrize("batch_size", [0, -1, 1.5, True])
+def test_batch_size_error(batch_size):
+    df = pd.DataFrame({"x": [1, 2, 3], "y": [1, None, 3]})
+
+    with pytest.raises(ValueError):
+        df.fillna_regression(
+            linear_model.LinearRegression,
+            {"y": "x"},
+            batch_size=batch_size,
+        )
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_series_equal
+
+from dtoolkit.accessor.dataframe import has_inf  # noqa: F401
+
+
+df_mixed = pd.DataFrame(
+    {
+        "float": [np.inf, 1.0, -np.inf, 2.0],
+        "int": [1, 2, 3, 4],
+        "object": ["x", np.inf, "y", "z"],
+        "datetime": pd.date_range("2020-01-01", periods=4),
+        "float32": pd.Series([np.inf, np.nan, 1, -np.inf], dtype="float32"),
+        "Float64": pd.Series([None, 1, np.inf, -np.inf], dtype="Float64"),
+    },
+)
+
+
+@pytest.mark.parametrize(
+    "axis, how, inf, subset",
+    [
+        (0, "any", "all", None),
+        (0, "all", "all", None),
+        (0, "any", "pos", None),
+        (0, "any", "neg", None),
+        (0, "all", "all", ["float", "float32"]),
+        (0, "all", "neg", ["float", "Float64"]),
+        (0, "any", "all", ["int", "datetime"]),
+        (0, "any", "all", ["object"]),
+        (1, "any", "all", None),
+        (1, "all", "all", None),
+        (1, "any", "neg", [0, 1]),
+    ],
+)
+def test_same_as_isin(axis, how, inf, subset):
+    inf_range = {
+        "all": [np.inf, -np.inf],
+        "pos": [np.inf],
+        "neg": [-np.inf],
+    }[inf]
+    agg_axis = 1 - axis
+    agg_obj = df_mixed if subset is None else df_mixed.loc(axis=agg_axis)[subset]
+    expected = agg_obj.isin(inf_range).boolean(how=how, axis=agg_axis)
+
+    result = df_mixed.has_inf(axis=axis, how=how, inf=inf, subset=subset)
+
+    assert_series_equal(result, expected.astype(bool), check_names=False)
+
+
+def test_empty_columns():
+    df = pd.DataFrame(index=range(2))
+
+    assert_series_equal(df.has_inf(how="any"), pd.Series([False, False]))
+    assert_series_equal(df.has_inf(how="all"), pd.Series([True, True]))
+
+
+@pytest.mark.parametrize(
+    "error, how, inf",
+    [
+        (ValueError, "whatever", "all"),
+        (ValueError, "any", "whatever"),
+        (ValueError, "any", None),
+    ],
+)
+def test_error(error, how, inf):
+    with pytest.raises(error):
+        df_mixed.has_inf(how=how, inf=inf)
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 from pandas.testing import assert_frame_equal
@@ -180,3 +181,98 @@ def test_work(df, weights, validate, top, drop, expected):
         assert_equal = assert_frame_equal
 
     assert_equal(result, expected, check_index_type=False, check_like=True)
+
+
+def test_dict_of_dict_same_as_sequential():
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, None, 4],
+            "b": [2, None, None, 8],
+            "c": [4, 5, 6, 7],
+        },
+    )
+    weights = {
+        "ab": {"a": 1, "b": 3},
+        "bc": {"b": 2, "c": 2},
+        "a": {"ab": 1, "a": 1},  # overwrite the original column
+        "ab-bc": {"ab": 1, "bc": 1, "a": 2},  # use the new 'a'
+    }
+
+    result = df.weighted_mean(weights)
+
+    expected = pd.DataFrame()
+    for name, weight in weights.items():
+        data = expected.combine_first(df)
+        another = data[list(weight)].mul(list(weight.values())).sum(axis=1)
+        another = another.divide(sum(weight.values())).rename(name)
+        expected = pd.concat((expected, another), axis=1)
+    expected = expected.combine_first(df)
+
+    assert_frame_equal(result, expected, check_like=True)
+
+
+@pytest.mark.parametrize(
+    "by, columns",
+    [
+        ("g", ["h", "a", "b"]),
+        (["g", "h"], ["a", "b"]),
+    ],
+)
+def test_by_same_as_groupby_apply(by, columns):
+    df = pd.DataFrame(
+        {
+            "g": ["x", "x", "y", "y", "y", "z"],
+            "h": [1, 2, 1, 1, 2, 1],
+            "a": [1, 2, None, 4, 5, 6],
+            "b": [2.5, 3, 4, 5, None, 7],
+            "w": [1, 2, 3, None, 5, 0.5],
+        },
+    )
+
+    result = df.weighted_mean("w", by=by)
+
+    expected = df.groupby(by)[[*columns, "w"]].apply(
+        lambda g: g[columns].mul(g["w"], axis=0).sum() / g["w"].sum(),
+    )
+    assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "weights, validate, top, error",
+    [
+        ({"a": 1}, False, 1, TypeError),
+        (["a"], False, 1, TypeError),
+        ("c", False, 1, KeyError),
+        ("b", True, 1, ValueError),
+    ],
+)
+def test_by_error(weights, validate, top, error):
+    df = pd.DataFrame({"g": [1, 1, 2], "a": [1, 2, 3], "b": [0.5, 0.5, 0.5]})
+
+    with pytest.raises(error):
+        df.weighted_mean(weights, validate=validate, top=top, by="g")
+
+
+@pytest.mark.parametrize(
+    "by, columns",
+    [
+        (np.array([1, 1, 2, 2]), ["d", "a"]),
+        ([pd.Series(["x", "x", "y", "y"]), "d"], ["a"]),
+    ],
+)
+def test_by_array_and_not_numeric(by, columns):
+    df = pd.DataFrame(
+        {
+            "r": ["x", "x", "y", "y"],
+            "d": [1, 2, 1, 1],
+            "a": [1, 2, 3, 4],
+            "w": [1, 3, 1, 1],
+        },
+    )
+
+    result = df.weighted_mean("w", by=by)
+
+    expected = df.groupby(by)[[*columns, "w"]].apply(
+        lambda g: g[columns].mul(g["w"], axis=0).sum() / g["w"].sum(),
+    )
+    assert_frame_equal(result, expected)
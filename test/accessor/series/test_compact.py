@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_series_equal
+
+from dtoolkit.accessor.series import compact  # noqa: F401
+
+
+@pytest.mark.parametrize(
+    "s, expected",
+    [
+        (pd.Series([1, 2, 300]), "int16"),
+        (pd.Series([-1, 2, 100]), "int8"),
+        (pd.Series([1, 2, 300], dtype="uint64"), "uint16"),
+        (pd.Series([1, None, 300], dtype="Int64"), "Int16"),
+        (pd.Series([0.5, None, 2.5]), "float32"),
+        (pd.Series([0.1, 123456789.123]), "float64"),
+        (pd.Series([0.123456789, 1234.56789]), "float64"),
+        (pd.Series([0.5, np.nan, np.inf]), "float32"),
+        (pd.Series([1, 2], dtype="int8"), "int8"),
+        (pd.Series([True, False]), "bool"),
+        (pd.Series([True, False], dtype=object), "bool"),
+        (pd.Series([True, None], dtype=object), "boolean"),
+        (pd.Series(["a", "b", "a", "a"] * 25), "category"),
+        (pd.Series(["a", "b", "c", "a"]), "str"),
+        (pd.Series(["a", None, "a", "a"], dtype=object), "category"),
+        (pd.Series([], dtype=object), "object"),
+        (pd.Series(pd.date_range("2020", periods=3)), "datetime64[us]"),
+    ],
+)
+def test_dtype(s, expected):
+    result = s.compact()
+
+    assert result.dtype == expected
+    assert_series_equal(result, s.astype(result.dtype))
+
+
+@pytest.mark.parametrize(
+    "category_ratio, expected",
+    [(0, "str"), (0.01, "str"), (0.02, "category"), (1, "category")],
+)
+def test_category_ratio(category_ratio, expected):
+    s = pd.Series(["a", "b", "a", "a"] * 25)
+
+    assert s.compact(category_ratio=category_ratio).dtype == expected
+
+
+@pytest.mark.parametrize(
+    "s, plan",
+    [
+        (pd.Series([1.0, 2.0]), "int16"),
+        (pd.Series([1.0, None]), "Int16"),
+        (pd.Series([1, 2**24]), "float32"),
+    ],
+)
+def test_plan_fit(s, plan):
+    result = s.compact(plan=plan)
+
+    assert result.dtype == plan
+    assert_series_equal(result, s.astype(plan))
+
+
+def test_category_not_smaller():
+    # Each value is distinct, so the categories are as large as the values.
+    s = pd.Series(["a", "b"])
+
+    assert s.compact(category_ratio=1).dtype == s.dtype
+
+
+def test_dry_run_and_plan():
+    first = pd.Series(["a", "b", "a", "a"] * 25)
+    second = pd.Series(["b", "b", None])
+
+    dtype = first.compact(dry_run=True)
+    result = second.compact(plan=dtype)
+
+    assert result.dtype == dtype
+    assert result.cat.categories.tolist() == ["a", "b"]
+    assert result.tolist()[:2] == ["b", "b"]
+
+
+def test_report():
+    s = pd.Series(np.arange(100))
+
+    result, report = s.compact(report=True)
+
+    assert result.dtype == "int8"
+    assert report.to_dict() == {
+        "dtype_before": np.dtype("int64"),
+        "dtype_after": np.dtype("int8"),
+        "bytes_before": 800,
+        "bytes_after": 100,
+    }
+
+
+@pytest.mark.parametrize(
+    "s, plan",
+    [
+        (pd.Series([1, 2, 300]), "int8"),
+        (pd.Series([-1, 2]), "uint8"),
+        (pd.Series([0.1, 123456789.123]), "float32"),
+        (pd.Series([1.5, 2.7]), "int16"),
+        (pd.Series([1.0, None]), "int16"),
+        (pd.Series([1.0, np.inf]), "int64"),
+        (pd.Series([16777217]), "float32"),
+        (pd.Series([2**53 + 1]), "float64"),
+        (pd.Series(["a", "c"]), pd.CategoricalDtype(["a", "b"])),
+        (pd.Series([True, None], dtype=object), "bool"),
+    ],
+)
+def test_plan_not_fit(s, plan):
+    with pytest.raises(ValueError):
+        s.compact(plan=plan)
+
+
+@pytest.mark.parametrize("category_ratio", [-0.1, 1.1])
+def test_category_ratio_error(category_ratio):
+    with pytest.raises(ValueError):
+        pd.Series([1]).compact(category_ratio=category_ratio)
@@ -144,6 +144,20 @@ def test_work(true, predicted, absolute_error, relative_error, expected):
     assert_frame_equal(result, expected)
 
 
+@pytest.mark.parametrize("dtype", ["int64", "Int64"])
+def test_negative_true(dtype):
+    true = pd.Series([-1, 1, -10, -10], dtype=dtype)
+
+    result = true.error_report([0, 2, -9, -11])
+
+    # The row-wise relative error keeps the sign of the true values.
+    assert result["relative_error"].astype(float).tolist() == [-1, 1, -0.1, -0.1]
+    assert true.error_report(
+        [0, 2, -9, -11],
+        summary=True,
+    )["mape"] == pytest.approx(0.55)
+
+
 @pytest.mark.parametrize(
     "true, predicted, error",
     [
@@ -156,3 +170,30 @@ def test_work(true, predicted, absolute_error, relative_error, expected):
 def test_error(true, predicted, error):
     with pytest.raises(error):
         true.error_report(predicted)
+
+
+@pytest.mark.parametrize("batch_size", [None, 1, 3, 100, np.int64(3)])
+def test_summary(batch_size):
+    true = pd.Series([1, 2, 3, 4, None, 0, 5], dtype="Float64")
+    predicted = pd.Series([2, 2, 1, 4.5, 3, 0, 10])
+
+    result = true.error_report(predicted, summary=True, batch_size=batch_size)
+
+    report = true.error_report(predicted).dropna(subset="absolute_error")
+    absolute = report["absolute_error"].astype(float)
+    relative = report["relative_error"].astype(float)
+    assert result["count"] == len(report)
+    assert result["mae"] == pytest.approx(absolute.mean())
+    assert result["mape"] == pytest.approx(relative.mean())  # skip 0 / 0
+    assert result["rmse"] == pytest.approx(np.sqrt((absolute**2).mean()))
+    assert result["max"] == absolute.max()
+    # Estimated within 1% relative error of the lower nearest rank.
+    for q in (0.5, 0.9, 0.99):
+        exact = absolute.quantile(q, interpolation="lower")
+        assert result[f"{q:.0%}"] == pytest.approx(exact, rel=0.01)
+
+
+@pytest.mark.parametrize("batch_size", [0, -1, 1.5, True])
+def test_summary_error(batch_size):
+    with pytest.raises(ValueError):
+        pd.Series([1, 2]).error_report([2, 1], summary=True, batch_size=batch_size)
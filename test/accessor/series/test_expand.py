@@ -145,3 +145,29 @@ def test_not_list_like_type():
     expected = pd.DataFrame({"item": [1, 2, 3]})
 
     assert_frame_equal(result, expected)
+
+
+def test_string_type():
+    s = pd.Series(["foo", "bar"], name="item")
+
+    assert_frame_equal(s.expand(), s.to_frame())
+
+
+def test_arrow_list():
+    pa = pytest.importorskip("pyarrow")
+    s = pd.Series(
+        [[1, 2], None, [3], []],
+        name="item",
+        dtype=pd.ArrowDtype(pa.list_(pa.int64())),
+    )
+
+    result = s.expand()
+    expected = pd.DataFrame(
+        {
+            "item_0": [1, None, 3, None],
+            "item_1": [2, None, None, None],
+        },
+        dtype=pd.ArrowDtype(pa.int64()),
+    )
+
+    assert_frame_equal(result, expected)
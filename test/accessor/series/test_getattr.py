@@ -81,3 +81,33 @@ def test_attr_work(s, name, args, kwargs, expected):
     result = s.getattr(name, *args, **kwargs)
 
     assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("upper", ["HELLO", None, "W0RLD"]),
+        ("isalpha", [True, None, False]),
+        ("__len__", [5, None, 5]),
+    ],
+)
+def test_arrow_string(name, expected):
+    pa = pytest.importorskip("pyarrow")
+    s = pd.Series(["hello", None, "w0rld"], dtype=pd.ArrowDtype(pa.string()))
+
+    result = s.getattr(name)
+
+    assert isinstance(result.dtype, pd.ArrowDtype)
+    assert result.tolist() == pd.Series(expected, dtype=result.dtype).tolist()
+
+
+@pytest.mark.parametrize("name", ["upper", "lower", "title", "swapcase", "isalpha"])
+def test_arrow_string_not_ascii(name):
+    pa = pytest.importorskip("pyarrow")
+    data = ["ß", "ǅa", "ΣΑΣ ΣΑΣ", "Ⅻ", None]
+    s = pd.Series(data, dtype=pd.ArrowDtype(pa.string()))
+
+    result = s.getattr(name)
+    expected = pd.Series(data, dtype=object).getattr(name)
+
+    assert result.tolist() == expected.tolist()
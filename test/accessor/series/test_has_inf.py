@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_series_equal
+
+from dtoolkit.accessor.series import has_inf  # noqa: F401
+
+
+@pytest.mark.parametrize(
+    "s",
+    [
+        pd.Series([np.inf, 1.0, -np.inf, np.nan], name="x"),
+        pd.Series([np.inf, 1.0, -np.inf, np.nan], dtype="float32"),
+        pd.Series([np.inf, 1.0, -np.inf, None], dtype="Float64"),
+        pd.Series(["a", np.inf, -np.inf, None], dtype=object),
+        pd.Series([1, 2, 3], index=["a", "b", "c"]),
+        pd.Series([True, False]),
+        pd.Series(pd.date_range("2020-01-01", periods=2)),
+        pd.Series(["inf", "a"]),
+        pd.Series([], dtype=float),
+    ],
+)
+@pytest.mark.parametrize(
+    "inf, inf_range",
+    [
+        ("all", [np.inf, -np.inf]),
+        ("pos", [np.inf]),
+        ("+", [np.inf]),
+        ("neg", [-np.inf]),
+        ("-", [-np.inf]),
+    ],
+)
+def test_same_as_isin(s, inf, inf_range):
+    result = s.has_inf(inf=inf)
+    expected = s.isin(inf_range).astype(bool)
+
+    assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize("inf", ["whatever", None])
+def test_error(inf):
+    with pytest.raises(ValueError):
+        pd.Series([np.inf]).has_inf(inf=inf)
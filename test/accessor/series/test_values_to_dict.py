@@ -45,3 +45,20 @@ def test_empty(s):
     result = s.values_to_dict()
 
     assert result == {}
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(unique=True, to_list=True),
+        dict(unique=False, to_list=True),
+        dict(unique=True, to_list=False),
+    ],
+)
+def test_arrow(kwargs):
+    pa = pytest.importorskip("pyarrow")
+    s = pd.Series(["x", "y", "x", "z", "x"], index=["a", "b", "a", "c", "b"])
+
+    result = s.astype(pd.ArrowDtype(pa.string())).values_to_dict(**kwargs)
+
+    assert result == s.values_to_dict(**kwargs)
@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+from pandas.testing import assert_series_equal
+
+from dtoolkit.accessor import DuplicateTracker
+
+
+rng = np.random.default_rng(0)
+df = pd.DataFrame(
+    {
+        "a": rng.integers(0, 20, 1000),
+        "b": rng.choice(["x", "y", None], 1000),
+        "c": rng.integers(0, 3, 1000).astype(float),
+    },
+)
+
+
+def chunks(obj, size=97):
+    for start in range(0, len(obj), size):
+        yield obj.iloc[start : start + size]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"max_memory": 2**20},
+        {"max_memory": 64, "spill_dir": "tmp"},
+    ],
+)
+@pytest.mark.parametrize("subset", [None, "a", ["a", "b"]])
+def test_same_as_duplicated(kwargs, subset, tmp_path):
+    if "spill_dir" in kwargs:
+        kwargs = kwargs | {"spill_dir": tmp_path}
+    tracker = DuplicateTracker(**kwargs)
+
+    result = pd.concat(tracker.duplicated(chunk, subset=subset) for chunk in chunks(df))
+
+    assert_series_equal(result, df.duplicated(subset=subset, keep="first"))
+    assert len(tracker) == len(df.drop_duplicates(subset=subset))
+
+
+def test_spill(tmp_path):
+    tracker = DuplicateTracker(max_memory=64, spill_dir=tmp_path)
+
+    result = pd.concat(tracker.drop_duplicates(chunk) for chunk in chunks(df["a"]))
+
+    assert_series_equal(result, df["a"].drop_duplicates())
+    assert tracker.nbytes <= 64
+    assert len(list(tmp_path.iterdir())) > 0
+
+    tracker.clear()
+    assert len(tracker) == 0
+    assert len(list(tmp_path.iterdir())) == 0
+
+
+def test_drop_not_duplicates_accessor():
+    tracker = DuplicateTracker()
+
+    result = pd.concat(
+        chunk.drop_not_duplicates(subset="a", keep="first", tracker=tracker)
+        for chunk in chunks(df)
+    )
+
+    assert_frame_equal(result, df.drop_not_duplicates(subset="a", keep="first"))
+
+
+def test_memory_error():
+    tracker = DuplicateTracker(max_memory=64)
+
+    with pytest.raises(MemoryError):
+        tracker.duplicated(df)
+
+
+@pytest.mark.parametrize(
+    "obj, kwargs",
+    [
+        (df["a"], {"subset": "a"}),
+        (df["a"].drop_not_duplicates, {"keep": False}),
+        (df.drop_not_duplicates, {"keep": "last"}),
+    ],
+)
+def test_error(obj, kwargs):
+    with pytest.raises(ValueError):
+        if callable(obj):
+            obj(tracker=DuplicateTracker(), **kwargs)
+        else:
+            DuplicateTracker().duplicated(obj, **kwargs)
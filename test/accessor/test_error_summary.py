@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+from pandas.testing import assert_series_equal
+
+from dtoolkit.accessor import ErrorSummary
+
+
+def test_merge_same_as_update():
+    rng = np.random.default_rng(0)
+    true = rng.normal(10, 3, 1000)
+    predicted = true + rng.normal(0, 1, 1000)
+    predicted[::7] = np.nan
+
+    expected = ErrorSummary().update(true, predicted).to_series()
+
+    summary = ErrorSummary()
+    for i in range(0, 1000, 300):
+        summary.merge(ErrorSummary().update(true[i : i + 300], predicted[i : i + 300]))
+
+    assert_series_equal(summary.to_series(), expected)
+
+
+@pytest.mark.parametrize(
+    "true, predicted, expected",
+    [
+        ([-1, 1], [0, 2], 1),
+        ([-10, -10], [-9, -11], 0.1),
+        ([-2, 4], [-3, 2], 0.5),
+    ],
+)
+def test_negative_true(true, predicted, expected):
+    result = ErrorSummary().update(true, predicted).to_series()
+
+    assert result["mape"] == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "percentiles, expected",
+    [
+        ((0.5, 0.9, 0.99), ["50%", "90%", "99%"]),
+        ((0.995, 1), ["99.5%", "100%"]),
+        ((0.12345, 0.123456), ["12.345%", "12.346%"]),
+    ],
+)
+def test_percentile_labels(percentiles, expected):
+    result = ErrorSummary(percentiles).update([1, 2], [2, 4]).to_series()
+
+    assert result.index[5:].tolist() == expected
+
+
+def test_empty():
+    result = ErrorSummary().update([np.nan], [1]).to_series()
+
+    assert result["count"] == 0
+    assert result.drop("count").isna().all()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"percentiles": [0.5, 1.5]},
+        {"accuracy": 0},
+        {"accuracy": 1},
+    ],
+)
+def test_error(kwargs):
+    with pytest.raises(ValueError):
+        ErrorSummary(**kwargs)
+
+
+def test_merge_error():
+    with pytest.raises(ValueError):
+        ErrorSummary(accuracy=0.01).merge(ErrorSummary(accuracy=0.02))
+
+
+def test_length_error():
+    with pytest.raises(IndexError):
+        ErrorSummary().update([1, 2], [1])
@@ -0,0 +1,151 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_series_equal
+
+from dtoolkit.accessor import ExprCache
+from dtoolkit.accessor.expr_cache import PANDAS_INTERNALS
+from dtoolkit.accessor.expr_cache import _compile
+from dtoolkit.accessor.expr_cache import _evaluate
+
+
+s = pd.Series(
+    [1.5, -2.0, 3.0, 0.5],
+    index=pd.Index([5, 6, 7, 8], name="k"),
+    name="col",
+)
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "col > 1 and col < 3",
+        "col == 1.5 or col != 3",
+        "not (col > 1)",
+        "abs(-col) + 1",
+        "col ** 2 / 3",
+        "sqrt(abs(col)) * 2",
+        "index > 5",
+        "k + col",
+        "col",
+    ],
+)
+def test_same_as_pandas(expr):
+    cache = ExprCache()
+
+    result = cache.eval(s, expr)
+    again = cache.eval(s * 2, expr)
+
+    assert_series_equal(result, s.to_frame().eval(expr))
+    assert_series_equal(again, (s * 2).to_frame().eval(expr))
+    assert cache.info()[:2] == (1, 1)
+
+
+@pytest.mark.parametrize(
+    "data, expr",
+    [
+        (s, "col in [1.5, 3]"),
+        (s, "1 + 2"),
+        (s, "col = 1"),
+        (s, "col > @s.mean()"),
+        (s.astype("Float64"), "col > 1"),
+        (pd.Series(["a", "b"], name="col"), "col == 'a'"),
+    ],
+)
+def test_not_compiled(data, expr):
+    assert _compile(data, expr, parser="pandas", use_numexpr=False) is None
+
+
+def test_not_compiled_is_not_hit():
+    cache = ExprCache()
+
+    for _ in range(3):
+        assert cache.eval(s, "col in [1.5, 3]") is None
+
+    info = cache.info()
+    assert (info.hits, info.misses, info.currsize) == (0, 3, 1)
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "col > 1 and col < 3",
+        "not (col > 1)",
+        "abs(-col) + 1",
+        "sqrt(abs(col)) * 2",
+        "index > 5",
+        "k + col",
+    ],
+)
+def test_numexpr(expr):
+    pytest.importorskip("numexpr")
+
+    compiled = _compile(s, expr, parser="pandas", use_numexpr=True)
+
+    assert compiled is not None
+    assert compiled.code is None  # run via 'numexpr' rather than numpy
+    assert_series_equal(_evaluate(compiled, s * 2), (s * 2).to_frame().eval(expr))
+
+
+def test_engine():
+    pytest.importorskip("numexpr")
+    cache = ExprCache()
+
+    numexpr = cache.eval(s, "col > 1")
+    python = cache.eval(s, "col > 1", engine="python")
+
+    # The programs of 'numexpr' and numpy are cached separately.
+    assert_series_equal(numexpr, python)
+    info = cache.info()
+    assert (info.hits, info.misses, info.currsize) == (0, 2, 2)
+
+
+def test_fallback():
+    result = s.eval("col > 1 and index in [5, 8]")
+
+    assert_series_equal(result, pd.Series([True, False, False, False], index=s.index))
+
+
+@pytest.mark.parametrize("engine", [None, "python"])
+@pytest.mark.parametrize("dtype", ["int8", "uint8", "int16"])
+@pytest.mark.parametrize("expr", ["a * 2", "-a", "a + a"])
+def test_dtype_same_as_pandas(engine, dtype, expr):
+    if engine is None:
+        pytest.importorskip("numexpr")
+    data = pd.Series([1, 2, 3], dtype=dtype, name="a")
+    cache = ExprCache()
+
+    result = cache.eval(data, expr, engine=engine)
+
+    assert result is not None
+    assert_series_equal(result, data.to_frame().eval(expr, engine=engine))
+
+
+def test_layout():
+    cache = ExprCache()
+
+    cache.eval(s, "col > 1")
+    cache.eval(s.rename("other"), "col > 1")
+    cache.eval(s.astype(np.float32), "col > 1")
+
+    # The layouts are different, the 'other' series can't be compiled.
+    info = cache.info()
+    assert (info.hits, info.misses, info.currsize) == (0, 3, 3)
+
+
+def test_maxsize():
+    cache = ExprCache(maxsize=2)
+
+    for expr in ("col > 1", "col > 2", "col > 3", "col > 3"):
+        cache.eval(s, expr)
+
+    info = cache.info()
+    assert (info.hits, info.misses, info.currsize) == (1, 3, 2)
+
+    cache.clear()
+    assert cache.info()[:4] == (0, 0, 2, 0)
+
+
+def test_pandas_internals():
+    # Fail loudly rather than silently falling back if pandas moves the parser.
+    assert PANDAS_INTERNALS, "The private parser of 'pandas.eval' is moved."
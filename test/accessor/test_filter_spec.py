@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from dtoolkit.accessor import FilterSpec
+
+
+df = pd.DataFrame(
+    {
+        "int": [1, 2, 3, 4, 5, 2**40],
+        "uint8": np.array([1, 2, 3, 4, 5, 6], dtype="uint8"),
+        "float": [1.0, np.nan, 3.5, 4.0, 5.0, 6.0],
+        "object": ["a", None, "b", 1, "c", "a"],
+        "str": ["a", "b", "c", "d", "e", "f"],
+        "category": pd.Categorical(["a", "b", None, "a", "c", "b"]),
+        "Int64": pd.array([1, None, 3, 4, 5, 6], dtype="Int64"),
+        "bool": [True, False, True, False, True, False],
+        "datetime": pd.date_range("2020-01-01", periods=6),
+    },
+)
+
+
+@pytest.mark.parametrize(
+    "condition",
+    [
+        [1, 3, 2**40],
+        [-3, 1, 5],
+        [1.0, 3.5, np.nan],
+        ["a", "c", np.nan],
+        ["a", 1],
+        [],
+        {2, 4},
+        np.array([5, 6]),
+        [True],
+        [pd.Timestamp("2020-01-02")],
+    ],
+)
+@pytest.mark.parametrize("column", df.columns)
+def test_same_as_isin(condition, column):
+    spec = FilterSpec(condition)
+    s = df[column]
+
+    result = spec.isin(s)
+
+    assert result.tolist() == s.isin(condition).astype(bool).tolist()
+
+
+@pytest.mark.parametrize("how", ["any", "all"])
+@pytest.mark.parametrize("complement", [True, False])
+@pytest.mark.parametrize(
+    "condition",
+    [
+        {"int": [1, 2, 3], "float": [1.0, 3.5], "category": ["a", "c"]},
+        {"str": ["a", "b"], "object": ["a"]},
+        [1, 3, 5, "a"],
+    ],
+)
+def test_reuse_on_chunks(condition, how, complement):
+    spec = FilterSpec(condition)
+
+    for chunk in (df.iloc[:3], df.iloc[3:], df):
+        result = chunk.filter_in(spec, how=how, complement=complement)
+        expected = chunk.filter_in(condition, how=how, complement=complement)
+        subset = chunk[list(condition)] if isinstance(condition, dict) else chunk
+        mask = subset.isin(condition).astype(bool)
+        mask = ~mask if complement else mask
+
+        assert_frame_equal(result, expected)
+        assert_frame_equal(result, chunk[getattr(mask, how)(axis=1)])
+
+
+def test_series_with_dict():
+    spec = FilterSpec({"str": ["a", "c"]})
+
+    assert df["str"].filter_in(spec).tolist() == ["a", "c"]
+
+
+@pytest.mark.parametrize("name", [None, "str", "whatever"])
+def test_series_with_plain_dict(name):
+    s = pd.Series(["a", "b", "c", "x"], name=name)
+    condition = {"a": ["x"], "c": [1]}
+
+    result = s.filter_in(condition)
+
+    # Like 'Series.isin', a plain dict is checked via its keys.
+    assert result.equals(s[s.isin(condition)])
+
+
+def test_series_with_dict_missing_name():
+    spec = FilterSpec({"str": ["a", "c"]})
+
+    with pytest.raises(KeyError):
+        df["str"].rename("whatever").filter_in(spec)
+
+
+@pytest.mark.parametrize(
+    "error, condition",
+    [
+        (TypeError, "a"),
+        (TypeError, {"a": 1}),
+    ],
+)
+def test_error(error, condition):
+    with pytest.raises(error):
+        FilterSpec(condition)
+
+
+def test_missing_key():
+    with pytest.raises(KeyError):
+        df.filter_in(FilterSpec({"whatever": [1]}))
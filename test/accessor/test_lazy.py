@@ -0,0 +1,165 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+from pandas.testing import assert_series_equal
+
+from dtoolkit.accessor import DuplicateTracker
+from dtoolkit.accessor import Lazy
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame(
+        {
+            "a": [1, 2, np.inf, 4, 5, 5, 1, -np.inf],
+            "b": [5, 4, 3, 2, 1, 1, 5, 0],
+        },
+        index=["x", None, "y", "z", "w", "v", "u", None],
+    )
+
+
+def run(obj, steps, /):
+    for name, args, kwargs in steps:
+        obj = getattr(obj, name)(*args, **kwargs)
+    return obj
+
+
+def build(obj, steps, /):
+    plan = obj.lazy()
+    for name, args, kwargs in steps:
+        plan = getattr(plan, name)(*args, **kwargs)
+    return plan
+
+
+@pytest.mark.parametrize(
+    "steps",
+    [
+        [],
+        [("drop_inf", (), {})],
+        [("drop_inf", (), {}), ("filter_in", ({"b": [1, 5]},), {})],
+        [
+            ("filter_in", ({"b": [1, 2, 4, 5]},), {}),
+            ("dropna_index", (), {}),
+            ("drop_not_duplicates", (), {}),
+        ],
+        # 'drop_not_duplicates' is decided by the remaining rows.
+        [
+            ("drop_not_duplicates", (), {"subset": "b", "keep": "first"}),
+            ("filter_in", ({"b": [5, 1]},), {"complement": True}),
+            ("drop_not_duplicates", (), {"subset": "a"}),
+        ],
+        [
+            ("dropna_index", (), {}),
+            ("drop_not_duplicates", (), {"subset": "b"}),
+            ("drop_inf", (), {}),
+        ],
+        # 'drop_inf' along columns can't be fused.
+        [
+            ("dropna_index", (), {}),
+            ("drop_inf", (), {"axis": 1}),
+            ("filter_in", ({"b": [1, 2, 5]},), {}),
+        ],
+        [
+            ("drop_inf", (), {}),
+            ("sort_values", ("b",), {}),
+            ("filter_in", (pd.Series([1, 2], name="b"),), {}),
+            ("head", (3,), {}),
+        ],
+    ],
+)
+def test_same_as_eager(df, steps):
+    assert_frame_equal(build(df, steps).collect(), run(df, steps))
+
+
+@pytest.mark.parametrize(
+    "steps",
+    [
+        [("drop_inf", (), {}), ("dropna_index", (), {})],
+        [
+            ("drop_inf", ("+",), {}),
+            ("filter_in", ([1, 5, -np.inf],), {}),
+            ("drop_not_duplicates", (), {"keep": "last"}),
+        ],
+        [
+            ("filter_in", ([1, 5],), {}),
+            ("drop_not_duplicates", (), {}),
+            ("to_frame", (), {}),
+        ],
+    ],
+)
+def test_series_same_as_eager(df, steps):
+    s = df["a"]
+
+    result = build(s, steps).collect()
+    expected = run(s, steps)
+
+    if isinstance(expected, pd.Series):
+        assert_series_equal(result, expected)
+    else:
+        assert_frame_equal(result, expected)
+
+
+def test_tracker(df):
+    lazy, eager = DuplicateTracker(), DuplicateTracker()
+
+    for chunk in (df.iloc[:4], df.iloc[4:]):
+        result = (
+            chunk.lazy()
+            .drop_inf()
+            .drop_not_duplicates(subset="b", keep="first", tracker=lazy)
+            .collect()
+        )
+        expected = chunk.drop_inf().drop_not_duplicates(
+            subset="b",
+            keep="first",
+            tracker=eager,
+        )
+
+        assert_frame_equal(result, expected)
+
+
+def test_explain(df):
+    plan = (
+        df.lazy()
+        .drop_inf()
+        .filter_in({"b": [1, 2, 4, 5]})
+        .sort_values("b")
+        .dropna_index()
+        .drop_not_duplicates(keep="last")
+    )
+
+    assert isinstance(plan, Lazy)
+    assert len(plan) == 5
+    assert repr(plan) == "Lazy(DataFrame, steps=5)"
+    assert plan.explain() == "\n".join(
+        [
+            "Lazy DataFrame plan:",
+            "  0. fused mask, take once",
+            "     drop_inf()",
+            "     filter_in({'b': [1, 2, 4, 5]})",
+            "  1. sort_values('b')",
+            "  2. fused mask, take once",
+            "     dropna_index()",
+            "     drop_not_duplicates(keep='last')",
+        ],
+    )
+
+
+def test_immutable(df):
+    plan = df.lazy().drop_inf()
+
+    plan.dropna_index()
+
+    assert len(plan) == 1
+
+
+def test_error(df):
+    with pytest.raises(AttributeError):
+        df.lazy()._private
+
+    with pytest.raises(ValueError):
+        df.lazy().drop_inf().dropna_index(how="blah").collect()
+
+    with pytest.raises(AttributeError):
+        df.lazy().drop_inf().whatever().collect()
@@ -0,0 +1,131 @@
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from dtoolkit.geoaccessor.dataframe import cncrs_offset  # noqa: F401
+
+
+@pytest.mark.parametrize(
+    "from_crs, to_crs, kwargs",
+    [
+        ("wgs84", "gcj02", {}),
+        ("wgs84", "bd09", {}),
+        ("gcj02", "wgs84", {}),
+        ("gcj02", "bd09", {}),
+        ("bd09", "wgs84", {}),
+        ("bd09", "gcj02", {}),
+        ("gcj02", "wgs84", {"precise": True}),
+        ("bd09", "wgs84", {"precise": True, "batch_size": 1, "n_jobs": 2}),
+    ],
+)
+def test_same_as_geometry(from_crs, to_crs, kwargs):
+    df = pd.DataFrame(
+        {
+            "x": [114.21892734521, 128.543, 120, 1],
+            "y": [29.575429778924, 37.065, 30, 1],
+        },
+    )
+
+    result = df.cncrs_offset("x", "y", from_crs=from_crs, to_crs=to_crs, **kwargs)
+    expected = gpd.GeoSeries.from_xy(df.x, df.y, crs=4326).cncrs_offset(
+        from_crs,
+        to_crs,
+        **kwargs,
+    )
+
+    np.testing.assert_allclose(result.x, expected.x, rtol=0, atol=1e-12)
+    np.testing.assert_allclose(result.y, expected.y, rtol=0, atol=1e-12)
+
+
+def test_columns():
+    df = pd.DataFrame({"lng": [120, 121], "lat": [30, 31], "name": ["a", "b"]})
+
+    result = df.cncrs_offset(
+        "lng",
+        "lat",
+        from_crs="wgs84",
+        to_crs="gcj02",
+        columns=("x", "y"),
+    )
+    expected = df.cncrs_offset("lng", "lat", from_crs="wgs84", to_crs="gcj02")
+
+    assert result.columns.tolist() == ["lng", "lat", "name", "x", "y"]
+    assert_frame_equal(result[["lng", "lat", "name"]], df)
+    assert_frame_equal(
+        result[["x", "y"]],
+        expected[["lng", "lat"]].set_axis(["x", "y"], axis=1),
+    )
+
+
+def test_missing_values():
+    df = pd.DataFrame(
+        {
+            "x": pd.array([120, None], dtype="Float64"),
+            "y": [30.0, np.nan],
+        },
+    )
+
+    result = df.cncrs_offset("x", "y", from_crs="wgs84", to_crs="gcj02")
+
+    assert result.dtypes.tolist() == [np.float64, np.float64]
+    assert result.iloc[1].isna().all()
+    assert result.iloc[0].notna().all()
+
+
+def test_not_geoframe():
+    df = pd.DataFrame({"x": [120], "y": [30]})
+
+    result = df.cncrs_offset("x", "y", from_crs="wgs84", to_crs="gcj02")
+
+    assert type(result) is pd.DataFrame
+
+
+def test_avoid_mutating_original_data():
+    df = pd.DataFrame({"x": [120.0, 121.0], "y": [30.0, 31.0]})
+    df_copy = df.copy()
+
+    result = df.cncrs_offset("x", "y", from_crs="wgs84", to_crs="gcj02")
+
+    assert_frame_equal(df, df_copy)
+    assert not np.allclose(result.x, df.x)
+
+
+@pytest.mark.parametrize(
+    "kwargs, error",
+    [
+        ({"from_crs": "wgs84", "to_crs": "wgs84"}, ValueError),
+        ({"from_crs": "error-CRS", "to_crs": "wgs84"}, ValueError),
+        ({"from_crs": "wgs84", "to_crs": "error-CRS"}, ValueError),
+        (
+            {"from_crs": "gcj02", "to_crs": "wgs84", "precise": True, "tol": 0},
+            ValueError,
+        ),
+        ({"from_crs": "wgs84", "to_crs": "gcj02", "batch_size": 0}, ValueError),
+        ({"x": "z", "from_crs": "wgs84", "to_crs": "gcj02"}, KeyError),
+    ],
+)
+def test_error(kwargs, error):
+    df = pd.DataFrame({"x": [120], "y": [30]})
+    kwargs = {"x": "x", "y": "y"} | kwargs
+
+    with pytest.raises(error):
+        df.cncrs_offset(**kwargs)
+
+
+def test_grid(tmp_path, monkeypatch):
+    monkeypatch.setenv("DTOOLKIT_CACHE_DIR", str(tmp_path))
+    df = pd.DataFrame({"x": [114.2, 120, 1], "y": [29.5, 30, 1]})
+    kwargs = {
+        "from_crs": "wgs84",
+        "to_crs": "gcj02",
+        "method": "grid",
+        "resolution": 0.1,
+    }
+
+    result = df.cncrs_offset("x", "y", **kwargs)
+    expected = gpd.GeoSeries.from_xy(df.x, df.y, crs=4326).cncrs_offset(**kwargs)
+
+    np.testing.assert_allclose(result.x, expected.x, rtol=0, atol=1e-12)
+    np.testing.assert_allclose(result.y, expected.y, rtol=0, atol=1e-12)
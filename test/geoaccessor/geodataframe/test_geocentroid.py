@@ -0,0 +1,103 @@
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pytest
+from shapely import MultiPoint
+from shapely import Point
+
+from dtoolkit.geoaccessor.geodataframe import geocentroid  # noqa: F401
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(0)
+    n = 100
+    return gpd.GeoDataFrame(
+        {
+            "id": rng.integers(0, 10, n),
+            "weights": rng.random(n),
+        },
+        geometry=gpd.points_from_xy(
+            rng.uniform(100, 120, n),
+            rng.uniform(20, 40, n),
+        ),
+        crs=4326,
+    )
+
+
+@pytest.mark.parametrize("weights", [None, "weights"])
+def test_by(df, weights):
+    result = df.geocentroid(weights, by="id")
+    expected = gpd.GeoSeries(
+        {key: group.geocentroid(weights) for key, group in df.groupby("id")},
+        crs=4326,
+    )
+
+    assert result.index.equals(expected.index)
+    assert result.crs == expected.crs
+    assert result.geom_equals_exact(expected, 1e-9).all()
+
+
+def test_by_tol_distance(df):
+    result = df.geocentroid(by="id", tol_distance=0.01)
+    expected = df.geocentroid(by="id", tol=1e-12)
+
+    assert (result.to_crs(3857).distance(expected.to_crs(3857)) < 1).all()
+
+
+def test_by_multiple_keys(df):
+    df["key"] = df["id"] % 2
+    result = df.geocentroid(by=["key", "id"])
+
+    assert isinstance(result.index, pd.MultiIndex)
+    assert result.loc[(1, 3)].equals_exact(
+        df[df["id"] == 3].geocentroid(),
+        1e-9,
+    )
+
+
+def test_by_missing():
+    df = gpd.GeoDataFrame(
+        {"id": [1, 1, None, 2, 3]},
+        geometry=[Point(0, 0), Point(2, 0), Point(9, 9), Point(5, 5), None],
+        crs=4326,
+    )
+
+    result = df.geocentroid(by="id")
+
+    assert result.index.tolist() == [1, 2, 3]
+    assert result[1].equals_exact(Point(1, 0), 1e-6)
+    assert result[2] == Point(5, 5)
+    assert result[3] is None
+
+
+def test_by_not_finite():
+    df = gpd.GeoDataFrame(
+        {"id": [1, 1, 1, 2, 2]},
+        geometry=gpd.points_from_xy([1, None, 2, np.inf, 5], [1, None, 2, 0, 5]),
+        crs=4326,
+    )
+
+    result = df.geocentroid(by="id")
+
+    assert result[1].equals_exact(Point(1.5086, 1.5086), 1e-4)
+    assert result[2] == Point(5, 5)
+
+
+def test_by_multipart():
+    df = gpd.GeoDataFrame(
+        {"id": ["a", "a"], "weights": [1, 3]},
+        geometry=[MultiPoint([(0, 0), (0, 2)]), Point(0, 1)],
+        crs=4326,
+    )
+
+    # The weight of the row applies to each of its points.
+    result = df.geocentroid("weights", by="id")
+
+    assert result["a"].equals_exact(Point(0, 1), 1e-6)
+
+
+@pytest.mark.parametrize("by", [None, "id"])
+def test_crs_not_4326(df, by):
+    with pytest.raises(ValueError, match="Only support 'EPSG:4326' CRS"):
+        df.to_crs(3857).geocentroid(by=by)
@@ -1,4 +1,7 @@
+import sys
+
 import geopandas as gpd
+import numpy as np
 import pytest
 from geopandas.testing import assert_geoseries_equal
 
@@ -125,6 +128,124 @@ def test_work(s, from_crs, to_crs, expected):
     assert_geoseries_equal(result, expected, check_less_precise=True)
 
 
+@pytest.mark.parametrize(
+    "tol, max_iter", [(0, 20), (-1e-9, 20), (1e-9, 0), (1e-9, 1.5), (1e-9, True)]
+)
+def test_precise_error(tol, max_iter):
+    s = gpd.GeoSeries.from_wkt(["POINT (120 30)"], crs=4326)
+
+    with pytest.raises(ValueError):
+        s.cncrs_offset("gcj02", "wgs84", precise=True, tol=tol, max_iter=max_iter)
+
+
+@pytest.mark.parametrize(
+    "from_crs, to_crs",
+    [
+        ("wgs84", "gcj02"),
+        ("wgs84", "bd09"),
+        ("gcj02", "bd09"),
+    ],
+)
+def test_precise(from_crs, to_crs):
+    s = gpd.GeoSeries.from_wkt(
+        [
+            "POINT (128.543 37.065)",
+            "LINESTRING (120 30, 122 33)",
+            "POINT EMPTY",
+            None,
+        ],
+        crs=4326,
+    )
+    offset = s.cncrs_offset(from_crs, to_crs)
+
+    rough = offset.cncrs_offset(to_crs, from_crs)
+    precise = offset.cncrs_offset(to_crs, from_crs, precise=True, tol=1e-10)
+
+    assert not rough.geom_equals_exact(s, tolerance=1e-7).iloc[:2].any()
+    assert precise.geom_equals_exact(s, tolerance=1e-9).iloc[:2].all()
+    assert precise.iloc[2].is_empty
+    assert precise.iloc[3] is None
+
+
+def test_precise_max_iter():
+    s = gpd.GeoSeries.from_wkt(["POINT (120 30)"], crs=4326)
+    gcj02 = s.cncrs_offset("wgs84", "gcj02")
+
+    rough = gcj02.cncrs_offset("gcj02", "wgs84")
+    once = gcj02.cncrs_offset("gcj02", "wgs84", precise=True, max_iter=1)
+    precise = gcj02.cncrs_offset("gcj02", "wgs84", precise=True)
+
+    error = [np.fabs(i.x - 120) for i in (rough.iloc[0], once.iloc[0], precise.iloc[0])]
+    assert error[0] > error[1] > error[2]
+
+
+def test_precise_only_works_for_inverse():
+    s = gpd.GeoSeries.from_wkt(["POINT (120 30)"], crs=4326)
+
+    assert_geoseries_equal(
+        s.cncrs_offset("wgs84", "gcj02", precise=True),
+        s.cncrs_offset("wgs84", "gcj02"),
+    )
+
+
+@pytest.mark.parametrize("batch_size", [0, -1, 1.5, None, True])
+def test_batch_size_error(batch_size):
+    s = gpd.GeoSeries.from_wkt(["POINT (120 30)"], crs=4326)
+
+    with pytest.raises(ValueError):
+        s.cncrs_offset("wgs84", "gcj02", batch_size=batch_size)
+
+
+@pytest.mark.parametrize("precise", [False, True])
+@pytest.mark.parametrize(
+    "batch_size, n_jobs",
+    [(1, 1), (2, 1), (2, 2), (3, -1), (np.int64(2), 1)],
+)
+def test_batch(precise, batch_size, n_jobs):
+    s = gpd.GeoSeries.from_wkt(
+        [
+            "POINT Z (128.543 37.065 1)",
+            "LINESTRING (120 30, 122 33)",
+            "POINT (114.2 29.5)",
+            None,
+            "POINT EMPTY",
+        ],
+        crs=4326,
+    )
+
+    assert_geoseries_equal(
+        s.cncrs_offset(
+            "gcj02",
+            "wgs84",
+            precise=precise,
+            batch_size=batch_size,
+            n_jobs=n_jobs,
+        ),
+        s.cncrs_offset("gcj02", "wgs84", precise=precise),
+    )
+
+
+def test_keep_z():
+    s = gpd.GeoSeries.from_wkt(["POINT Z (120 30 5)", "POINT (120 30)"], crs=4326)
+
+    result = s.cncrs_offset("wgs84", "gcj02")
+
+    assert result.has_z.tolist() == [True, False]
+    assert result.iloc[0].z == 5
+
+
+@pytest.mark.parametrize("transform", ["transform_x", "transform_y"])
+def test_transform_scalar_same_as_array(transform):
+    transform = getattr(
+        sys.modules["dtoolkit.geoaccessor.geoseries.cncrs_offset"], transform
+    )
+
+    result = transform(114.2, 29.5)
+    expected = transform(np.array([114.2]), np.array([29.5]))
+
+    assert result == pytest.approx(expected[0])
+
+
 def test_avoid_mutating_original_data():
     s = gpd.GeoSeries.from_wkt(["POINT (0 0)", "POINT (120 30)"], crs=4326)
     s_copy = s.copy()
@@ -135,3 +256,94 @@ def test_avoid_mutating_original_data():
 
     with pytest.raises(AssertionError):
         assert_geoseries_equal(s, result)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("DTOOLKIT_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "from_crs, to_crs",
+    [
+        ("wgs84", "gcj02"),
+        ("wgs84", "bd09"),
+        ("gcj02", "wgs84"),
+        ("bd09", "wgs84"),
+    ],
+)
+def test_grid(cache_dir, from_crs, to_crs):
+    s = gpd.GeoSeries.from_wkt(
+        [
+            "POINT (114.2 29.5)",
+            "LINESTRING (120 30, 122 33)",
+            "POINT (135.99 53.99)",
+        ],
+        crs=4326,
+    )
+
+    result = s.cncrs_offset(from_crs, to_crs, method="grid", resolution=0.05)
+    expected = s.cncrs_offset(from_crs, to_crs)
+
+    assert result.geom_equals_exact(expected, tolerance=3e-5).all()
+    assert not result.geom_equals_exact(expected, tolerance=1e-12).all()
+    assert [p.name for p in cache_dir.iterdir()] == ["gcj02_offset_0.05.npy"]
+
+
+def test_grid_outside(cache_dir):
+    s = gpd.GeoSeries.from_wkt(["POINT (1 1)", "POINT (150 30)"], crs=4326)
+
+    assert_geoseries_equal(
+        s.cncrs_offset("wgs84", "gcj02", method="grid", resolution=0.5),
+        s.cncrs_offset("wgs84", "gcj02"),
+    )
+
+
+def test_grid_without_gcj02_offset(cache_dir):
+    s = gpd.GeoSeries.from_wkt(["POINT (120 30)"], crs=4326)
+
+    assert_geoseries_equal(
+        s.cncrs_offset("gcj02", "bd09", method="grid"),
+        s.cncrs_offset("gcj02", "bd09"),
+    )
+    assert not any(cache_dir.iterdir())
+
+
+def test_grid_cached(cache_dir, monkeypatch):
+    s = gpd.GeoSeries.from_wkt(["POINT (120 30)"], crs=4326)
+    expected = s.cncrs_offset("wgs84", "gcj02", method="grid", resolution=0.5)
+
+    def build_grid(*args):
+        raise AssertionError("The cached grid should be reused.")
+
+    module = sys.modules["dtoolkit.geoaccessor.geoseries.cncrs_offset"]
+    monkeypatch.setattr(module, "build_grid", build_grid)
+    result = s.cncrs_offset("wgs84", "gcj02", method="grid", resolution=0.5)
+
+    assert_geoseries_equal(result, expected)
+
+
+def test_grid_precise(cache_dir):
+    s = gpd.GeoSeries.from_wkt(["POINT (120.123 30.456)"], crs=4326)
+    kwargs = {"method": "grid", "resolution": 0.5}
+
+    gcj02 = s.cncrs_offset("wgs84", "gcj02", **kwargs)
+    result = gcj02.cncrs_offset("gcj02", "wgs84", precise=True, **kwargs)
+
+    assert result.geom_equals_exact(s, tolerance=1e-9).all()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"method": "error-method"},
+        {"method": "grid", "resolution": 0},
+        {"method": "grid", "resolution": -0.01},
+    ],
+)
+def test_grid_error(cache_dir, kwargs):
+    s = gpd.GeoSeries.from_wkt(["POINT (120 30)"], crs=4326)
+
+    with pytest.raises(ValueError):
+        s.cncrs_offset("wgs84", "gcj02", **kwargs)
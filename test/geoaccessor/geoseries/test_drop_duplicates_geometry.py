@@ -0,0 +1,49 @@
+import geopandas as gpd
+import pandas as pd
+import pytest
+from pandas.testing import assert_series_equal
+from shapely import Point
+
+from dtoolkit.accessor import DuplicateTracker
+from dtoolkit.geoaccessor.geoseries import drop_duplicates_geometry  # noqa: F401
+
+
+s = gpd.GeoSeries(
+    [Point(0, 0), Point(1, 1), Point(0, 0), None, Point(1, 1), None, Point(2, 2)],
+)
+
+
+def test_tracker():
+    tracker = DuplicateTracker()
+
+    result = pd.concat(
+        s.iloc[i : i + 2].drop_duplicates_geometry(tracker=tracker)
+        for i in range(0, len(s), 2)
+    )
+
+    assert_series_equal(result, s.drop_duplicates_geometry())
+
+
+def test_tracker_geodataframe():
+    df = s.to_frame("geometry").set_geometry("geometry")
+    tracker = DuplicateTracker()
+
+    result = pd.concat(
+        df.iloc[i : i + 3].drop_duplicates_geometry(tracker=tracker)
+        for i in range(0, len(df), 3)
+    )
+
+    assert result.index.tolist() == df.drop_duplicates_geometry().index.tolist()
+
+
+@pytest.mark.parametrize(
+    "predicate, keep",
+    [
+        ("intersects", "first"),
+        (None, "last"),
+        (None, False),
+    ],
+)
+def test_tracker_error(predicate, keep):
+    with pytest.raises(ValueError):
+        s.drop_duplicates_geometry(predicate, keep=keep, tracker=DuplicateTracker())
@@ -89,3 +89,35 @@ def test_work(s, other, predicate, complement, expected):
     )
 
     assert_geoseries_equal(result, expected)
+
+
+@pytest.mark.parametrize("frame", [False, True])
+def test_lazy(frame):
+    s = gpd.GeoSeries(
+        [
+            Polygon([(0, 0), (1, 1), (0, 1)]),
+            LineString([(0, 0), (0, 2)]),
+            LineString([(0, 0), (0, 1)]),
+            Point(0, 1),
+            Point(-1, -1),
+            Point(0.5, 0.5),
+        ],
+        index=[0, 1, None, 3, 4, 5],
+    )
+    obj = s.to_frame("geometry") if frame else s
+    other = gpd.GeoSeries([box(0, 0, 1, 1)] * 6, index=[5, 4, 3, None, 1, 0])
+
+    result = (
+        obj.lazy()
+        .dropna_index()
+        .select_geom_type("Point", complement=True)
+        .filter_geometry(other, "intersects", align=True)
+        .collect()
+    )
+    expected = (
+        obj.dropna_index()
+        .select_geom_type("Point", complement=True)
+        .filter_geometry(other, "intersects", align=True)
+    )
+
+    assert_geoseries_equal(result.geometry, expected.geometry)
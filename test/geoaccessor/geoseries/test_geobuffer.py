@@ -1,7 +1,10 @@
+import sys
+
 import geopandas as gpd
 import numpy as np
 import pandas as pd
 import pytest
+import shapely
 
 from dtoolkit.geoaccessor.geoseries import geobuffer  # noqa: F401
 
@@ -58,3 +61,125 @@ def test_distance_type_is_not_num_type():
 def test_crs():
     with pytest.raises(ValueError):
         s.to_crs("epsg:3857").geobuffer(10)
+
+
+def test_wgs_to_utm():
+    module = sys.modules["dtoolkit.geoaccessor.geoseries.geobuffer"]
+
+    result = module.wgs_to_utm(
+        np.asarray([120, 150, -180, 180, np.nan, 200, 0]),
+        np.asarray([50, -30, 0, -1, 0, 0, np.nan]),
+    )
+
+    assert result.tolist() == [32651, 32756, 32601, 32701, 0, 0, 0]
+
+
+def test_missing_and_duplicated_index():
+    s = gpd.GeoSeries.from_wkt(
+        [
+            "POINT (120 50)",
+            None,
+            "POINT EMPTY",
+            "POLYGON ((150 -30, 150.1 -30, 150.1 -30.1, 150 -30))",
+        ],
+        index=[0, 0, 1, 1],
+        crs=4326,
+    )
+
+    result = s.geobuffer([10, 20, 30, 40])
+
+    assert result.index.equals(s.index)
+    assert result.iloc[1] is None
+    assert result.iloc[2].is_empty
+    assert result.geom_type.iloc[[0, 3]].tolist() == ["Polygon", "Polygon"]
+    assert result.iloc[3].contains(s.iloc[3])
+
+
+def test_n_jobs():
+    s = gpd.GeoSeries.from_xy(range(-180, 180, 6), [10, -10] * 30, crs=4326)
+
+    result = s.geobuffer(range(1, 61), n_jobs=2)
+    expected = s.geobuffer(range(1, 61))
+
+    assert result.geom_equals_exact(expected, tolerance=0).all()
+    assert (result.geom_type == "Polygon").all()
+
+
+@pytest.mark.parametrize("distance", [10, 1000, 100_000])
+@pytest.mark.parametrize("x, y", [(120, 50), (150, -30), (100, 1), (-60, 85)])
+def test_geodesic(x, y, distance):
+    from pyproj import Geod
+
+    s = gpd.GeoSeries.from_xy([x], [y], crs=4326)
+
+    result = s.geobuffer(distance, method="geodesic")
+
+    lon, lat = shapely.get_coordinates(result).T
+    _, _, radius = Geod(ellps="WGS84").inv(
+        np.full(lon.size, x),
+        np.full(lat.size, y),
+        lon,
+        lat,
+    )
+    np.testing.assert_allclose(radius, distance, rtol=1e-9)
+    assert lon.size == 4 * 16 + 1
+    assert result.is_valid.all()
+    assert result.iloc[0].contains(s.iloc[0])
+
+
+def test_geodesic_close_to_utm():
+    result = s.geobuffer(1000, method="geodesic").to_crs(3857)
+    expected = s.geobuffer(1000).to_crs(3857)
+
+    # The UTM projection has a little distortion.
+    assert (result.symmetric_difference(expected).area / expected.area).lt(1e-2).all()
+
+
+def test_geodesic_only_for_points():
+    s = gpd.GeoSeries.from_wkt(
+        [
+            "POINT (120 50)",
+            "LINESTRING (120 50, 120.1 50.1)",
+            "POINT EMPTY",
+            None,
+        ],
+        crs=4326,
+    )
+
+    result = s.geobuffer([10, 20, 30, 40], method="geodesic")
+    expected = s.geobuffer([10, 20, 30, 40])
+
+    assert result.iloc[1:3].geom_equals_exact(expected.iloc[1:3], tolerance=0).all()
+    assert result.iloc[3] is None
+    assert not result.iloc[:1].geom_equals_exact(expected.iloc[:1], tolerance=0).any()
+
+
+def test_geodesic_distance():
+    s = gpd.GeoSeries.from_xy([120] * 3, [50] * 3, crs=4326)
+
+    result = s.geobuffer([0, -1, np.nan], method="geodesic")
+
+    assert result.iloc[0].is_empty
+    assert result.iloc[1].is_empty
+    assert result.iloc[2] is None
+
+
+def test_geodesic_resolution():
+    s = gpd.GeoSeries.from_xy([120], [50], crs=4326)
+
+    result = s.geobuffer(10, method="geodesic", resolution=2)
+
+    assert shapely.get_num_coordinates(result.iloc[0]) == 4 * 2 + 1
+
+
+def test_geodesic_antimeridian():
+    s = gpd.GeoSeries.from_xy([179.9999, -179.9999], [0, 0], crs=4326)
+
+    result = s.geobuffer(100, method="geodesic")
+
+    assert (result.bounds.maxx - result.bounds.minx).lt(0.01).all()
+
+
+def test_method_error():
+    with pytest.raises(ValueError):
+        s.geobuffer(10, method="error-method")
@@ -1,10 +1,76 @@
 import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pytest
 from shapely import Point
 
 from dtoolkit.geoaccessor.geoseries import geocentroid
+from dtoolkit.geoaccessor.geoseries import geodistance
 
 
 def test_one_point():
     s = gpd.GeoSeries(Point(100, 32), crs=4326)
 
     assert geocentroid(s) == Point(100, 32)
+
+
+def test_coincident_point():
+    # The initial centroid coincides with the center point.
+    s = gpd.GeoSeries.from_xy([10, 11, 9, 10, 10], [10, 10, 10, 11, 9], crs=4326)
+
+    assert geocentroid(s).equals_exact(Point(10, 10), 1e-9)
+
+
+def test_weights():
+    s = gpd.GeoSeries.from_xy([100, 101, 102], [30, 31, 32], crs=4326)
+    weights = pd.Series([1, 1, 100])
+
+    result = geocentroid(s, weights=weights)
+
+    assert result.distance(Point(102, 32)) < geocentroid(s).distance(Point(102, 32))
+
+
+@pytest.mark.parametrize("tol_distance", [1, 100])
+def test_tol_distance(tol_distance):
+    s = gpd.GeoSeries.from_xy([100, 110, 120, 100], [30, 32, 30, 40], crs=4326)
+
+    expected = geocentroid(s, tol=1e-12)
+    result = geocentroid(s, tol_distance=tol_distance)
+
+    moved = geodistance(gpd.GeoSeries([result], crs=4326), expected).iloc[0]
+    assert moved <= tol_distance * 10
+
+
+@pytest.mark.parametrize(
+    "x, y, weights",
+    [
+        ([1, None, 2], [1, None, 2], None),
+        ([1, np.inf, 2], [1, 5, 2], None),
+        ([1, None, 2], [1, None, 2], [1, 100, 1]),
+    ],
+)
+def test_skip_not_finite(x, y, weights):
+    s = gpd.GeoSeries.from_xy(x, y, crs=4326)
+
+    result = geocentroid(s, weights=weights)
+    expected = geocentroid(gpd.GeoSeries.from_xy([1, 2], [1, 2], crs=4326))
+
+    assert result.equals_exact(expected, 1e-9)
+    assert result.equals_exact(Point(1.5086, 1.5086), 1e-4)
+
+
+def test_weights_skip_missing():
+    s = gpd.GeoSeries([Point(0, 0), None, Point(2, 0)], crs=4326)
+
+    # The weight of the missing geometry isn't taken by the following point.
+    result = geocentroid(s, weights=[1, 100, 1])
+
+    assert result.equals_exact(geocentroid(s.dropna()), 1e-9)
+
+
+@pytest.mark.parametrize("crs", [3857, None])
+def test_crs_not_4326(crs):
+    s = gpd.GeoSeries.from_xy([100, 110], [30, 32], crs=crs)
+
+    with pytest.raises(ValueError, match="Only support 'EPSG:4326' CRS"):
+        geocentroid(s)
@@ -1,4 +1,7 @@
+import sys
+
 import geopandas as gpd
+import numpy as np
 import pandas as pd
 import pytest
 from pandas.testing import assert_frame_equal
@@ -7,6 +10,22 @@ from shapely import Point
 from dtoolkit.geoaccessor.geoseries import geodistance_matrix
 
 
+geodistance_matrix_module = sys.modules[
+    "dtoolkit.geoaccessor.geoseries.geodistance_matrix"
+]
+
+
+@pytest.fixture
+def points():
+    rng = np.random.default_rng(0)
+    return gpd.GeoSeries.from_xy(
+        rng.uniform(-180, 180, 50),
+        rng.uniform(-90, 90, 50),
+        index=range(100, 150),
+        crs=4326,
+    )
+
+
 @pytest.mark.parametrize(
     "s, other, error",
     [
@@ -55,3 +74,74 @@ def test_none():
     expected = pd.DataFrame([[0, 6327577.80745203], [6327577.80745203, 0]])
 
     assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("block_size", [1, 64, 2**22])
+def test_symmetric(monkeypatch, points, block_size):
+    monkeypatch.setattr(geodistance_matrix_module, "BLOCK_SIZE", block_size)
+
+    result = geodistance_matrix(points)
+    expected = geodistance_matrix(points, other=points.copy())
+
+    assert_frame_equal(result, expected)
+    assert (result.to_numpy() == result.to_numpy().T).all()
+    assert (np.diag(result) == 0).all()
+
+
+@pytest.mark.parametrize("other", [None, slice(0, 20)])
+@pytest.mark.parametrize("chunksize", [1, 7, 100, np.int64(10)])
+def test_chunksize(points, other, chunksize):
+    other = None if other is None else points[other]
+    chunks = list(geodistance_matrix(points, other=other, chunksize=chunksize))
+
+    assert len(chunks) == -(-len(points) // chunksize)
+    assert all(len(chunk) <= chunksize for chunk in chunks)
+    assert_frame_equal(
+        pd.concat(chunks),
+        geodistance_matrix(points, other=other),
+    )
+
+
+@pytest.mark.parametrize("other", [None, slice(0, 20)])
+def test_out(tmp_path, points, other):
+    other = None if other is None else points[other]
+    expected = geodistance_matrix(points, other=other)
+
+    out = np.lib.format.open_memmap(
+        tmp_path / "matrix.npy",
+        mode="w+",
+        dtype=np.float32,
+        shape=expected.shape,
+    )
+    result = geodistance_matrix(points, other=other, out=out)
+
+    assert np.shares_memory(result.to_numpy(), out)
+    assert (result.dtypes == np.float32).all()
+    assert_frame_equal(result, expected.astype(np.float32))
+
+
+def test_dtype(points):
+    result = geodistance_matrix(points, dtype=np.float32)
+    chunks = geodistance_matrix(points, chunksize=10, dtype=np.float32)
+
+    assert (result.dtypes == np.float32).all()
+    assert_frame_equal(pd.concat(chunks), result)
+
+
+@pytest.mark.parametrize(
+    "kwargs, match",
+    [
+        ({"chunksize": 0}, "'chunksize' must be a positive integer"),
+        ({"chunksize": 1.5}, "'chunksize' must be a positive integer"),
+        ({"chunksize": True}, "'chunksize' must be a positive integer"),
+        ({"chunksize": np.int64(0)}, "'chunksize' must be a positive integer"),
+        (
+            {"chunksize": 1, "out": np.empty((50, 50))},
+            "'chunksize' and 'out' can't be given together",
+        ),
+        ({"out": np.empty((50, 49))}, "The shape of 'out' should be"),
+    ],
+)
+def test_argument_error(points, kwargs, match):
+    with pytest.raises(ValueError, match=match):
+        geodistance_matrix(points, **kwargs)
@@ -0,0 +1,163 @@
+import sys
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pytest
+from shapely import LineString
+from shapely import Point
+from sklearn.neighbors import BallTree
+
+from dtoolkit.geoaccessor.geoseries import geodistance_matrix  # noqa: F401
+from dtoolkit.geoaccessor.geoseries import geonearest  # noqa: F401
+
+
+geonearest_module = sys.modules["dtoolkit.geoaccessor.geoseries.geonearest"]
+
+
+def random_points(n: int, seed: int, /, index=None) -> gpd.GeoSeries:
+    rng = np.random.default_rng(seed)
+    return gpd.GeoSeries.from_xy(
+        rng.uniform(-180, 180, n),
+        rng.uniform(-80, 80, n),
+        index=index,
+        crs=4326,
+    )
+
+
+@pytest.fixture
+def s():
+    return random_points(50, 0)
+
+
+@pytest.fixture
+def other():
+    return random_points(30, 1, index=[f"p{i}" for i in range(30)])
+
+
+@pytest.mark.parametrize("k", [1, 3, np.int64(2)])
+def test_same_as_geodistance_matrix(s, other, k):
+    result = s.geonearest(other, k=k)
+
+    matrix = s.geodistance_matrix(other)
+    order = np.argsort(matrix.to_numpy(), axis=1)[:, :k]
+    expected = pd.DataFrame(
+        {
+            "nearest": other.index.to_numpy()[order].ravel(),
+            "distance": np.take_along_axis(matrix.to_numpy(), order, axis=1).ravel(),
+        },
+        index=s.index.repeat(k),
+    )
+
+    assert len(result) == len(s) * k
+    assert result.index.equals(expected.index)
+    assert (result["nearest"].to_numpy() == expected["nearest"].to_numpy()).all()
+    np.testing.assert_allclose(result["distance"], expected["distance"])
+
+
+def test_max_distance(s, other):
+    max_distance = 2_000_000
+    result = s.geonearest(other, k=2, max_distance=max_distance)
+    expected = s.geonearest(other, k=2)
+
+    beyond = expected["distance"] > max_distance
+    assert beyond.any()
+    assert result.loc[beyond.to_numpy()].isna().all().all()
+    assert result.loc[~beyond.to_numpy()].equals(expected.loc[~beyond.to_numpy()])
+
+
+def test_missing_and_empty():
+    s = gpd.GeoSeries([Point(0, 0), None, Point(), Point(10, 10)], crs=4326)
+    other = gpd.GeoSeries([None, Point(9, 9), Point(), Point(1, 1)], crs=4326)
+
+    result = s.geonearest(other)
+
+    assert result["nearest"].tolist()[0] == 3
+    assert result["nearest"].tolist()[3] == 1
+    assert result.iloc[[1, 2]].isna().all().all()
+
+
+def test_not_finite():
+    s = gpd.GeoSeries.from_xy([0, np.nan, 10, np.inf], [0, np.nan, 10, 0], crs=4326)
+    other = gpd.GeoSeries.from_xy([np.nan, 9, 1, np.inf], [np.nan, 9, 1, 1], crs=4326)
+
+    result = s.geonearest(other, k=2)
+
+    assert result["nearest"].iloc[[0, 1, 4, 5]].tolist() == [2, 1, 1, 2]
+    assert result.iloc[[2, 3, 6, 7]].isna().all().all()
+
+
+def test_k_more_than_points():
+    s = gpd.GeoSeries.from_xy([0, 10], [0, 10], crs=4326)
+    other = gpd.GeoSeries([Point(1, 1), None, Point()], index=["a", "b", "c"], crs=4326)
+
+    result = s.geonearest(other, k=3)
+
+    assert result["nearest"].tolist()[::3] == ["a", "a"]
+    assert result.iloc[[1, 2, 4, 5]].isna().all().all()
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        gpd.GeoSeries([None, Point()], crs=4326),
+        gpd.GeoSeries([], crs=4326),
+    ],
+)
+def test_no_valid_points(other):
+    s = gpd.GeoSeries.from_xy([0, 10], [0, 10], crs=4326)
+
+    result = s.geonearest(other, k=2)
+
+    assert result.index.equals(s.index.repeat(2))
+    assert result.isna().all().all()
+
+
+def test_balltree(s, other):
+    tree = BallTree(
+        np.radians(other.get_coordinates()[["y", "x"]]),
+        metric="haversine",
+    )
+
+    result = s.geonearest(tree, k=2)
+    expected = s.geonearest(other, k=2)
+
+    assert (
+        other.index[result["nearest"].to_numpy()] == expected["nearest"].to_numpy()
+    ).all()
+    assert result["distance"].equals(expected["distance"])
+
+
+def test_n_jobs(monkeypatch, s, other):
+    monkeypatch.setattr(geonearest_module, "BATCH_SIZE", 7)
+
+    result = s.geonearest(other, k=2, n_jobs=2)
+    expected = s.geonearest(other, k=2)
+
+    assert result.equals(expected)
+
+
+@pytest.mark.parametrize("k", [0, 1.5, "1", True])
+def test_k_error(s, other, k):
+    with pytest.raises(ValueError, match="'k' must be a positive integer"):
+        s.geonearest(other, k=k)
+
+
+def test_crs_error(s, other):
+    with pytest.raises(ValueError, match="Only support 'EPSG:4326' CRS"):
+        s.to_crs(3857).geonearest(other)
+
+    with pytest.raises(ValueError, match="Only support 'EPSG:4326' CRS"):
+        s.geonearest(other.to_crs(3857))
+
+
+def test_geometry_error(s):
+    other = gpd.GeoSeries([LineString([(0, 0), (1, 1)])], crs=4326)
+
+    with pytest.raises(ValueError, match="Only support Point geometry"):
+        s.geonearest(other)
+
+
+def test_type_error(s):
+    with pytest.raises(TypeError, match="Unknown type"):
+        s.geonearest([Point(0, 0)])
@@ -0,0 +1,49 @@
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from dtoolkit.accessor.dataframe import decompose  # noqa: F401
+from dtoolkit.util import fit_decompose
+
+
+decomposition = pytest.importorskip("sklearn.decomposition")
+
+
+@pytest.mark.parametrize(
+    "method",
+    [decomposition.IncrementalPCA, decomposition.PCA],
+)
+@pytest.mark.parametrize(
+    "columns",
+    [None, ["a", "b"], {"A": ["a", "b"], ("B", "C"): ["a", "b", "c"]}],
+)
+def test_fit_decompose(method, columns):
+    df = pd.DataFrame(
+        [
+            [-1, -1, 1],
+            [-2, -1, 2],
+            [-3, -2, 4],
+            [1, 1, -1],
+            [2, 1, -2],
+            [3, 2, -3],
+        ],
+        columns=["a", "b", "c"],
+    )
+    chunks = [df.iloc[:3], df.iloc[3:]]
+
+    model = fit_decompose(chunks, method, columns)
+    result = pd.concat(
+        [chunk.decompose(method, columns, fitted=model) for chunk in chunks],
+    )
+    expected = df.decompose(decomposition.PCA, columns)
+
+    # The sign of components is arbitrary.
+    assert_frame_equal(result.abs(), expected.abs(), check_dtype=False, atol=1e-3)
+
+
+def test_fit_decompose_error():
+    with pytest.raises(ValueError):
+        fit_decompose([], decomposition.IncrementalPCA)
+
+    with pytest.raises(ValueError):
+        fit_decompose([pd.DataFrame({"a": [1]})], decomposition.PCA, "a")